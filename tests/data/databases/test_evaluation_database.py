@@ -0,0 +1,274 @@
+"""Test the EvaluationDatabase base class."""
+import os
+import typing as tp
+import unittest
+import unittest.mock as mock
+
+import pandas as pd
+
+from tests.test_utils import replace_config
+from varats.data.cache_helper import get_data_file_path
+from varats.data.databases.blame_diff_library_interaction_database import (
+    BlameDiffLibraryInteractionDatabase,
+)
+from varats.data.databases.blame_diff_metrics_database import (
+    BlameDiffMetricsDatabase,
+)
+from varats.data.databases.evaluationdatabase import (
+    EvaluationDatabase,
+    QueryCache,
+    get_query_cache,
+)
+from varats.mapping.commit_map import CommitMap
+from varats.paper.case_study import CaseStudy, CSEntry, CSStage
+
+CMAP = CommitMap([
+    "0, 1111111111aaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+    "1, 2222222222bbbbbbbbbbbbbbbbbbbbbbbbbbbbbb",
+    "2, 3333333333cccccccccccccccccccccccccccccc",
+    "3, 4444444444dddddddddddddddddddddddddddddd",
+])
+
+
+class DummyDatabase(
+    EvaluationDatabase, cache_id="dummy_data", columns=["value"]
+):
+    """Database that returns a fixed dataframe and records the case studies it
+    was loaded for."""
+
+    loaded_case_studies: tp.List[tp.Optional[CaseStudy]] = []
+
+    @classmethod
+    def _load_dataframe(
+        cls, project_name: str, commit_map: CommitMap,
+        case_study: tp.Optional[CaseStudy], **kwargs: tp.Any
+    ) -> pd.DataFrame:
+        cls.loaded_case_studies.append(case_study)
+        return pd.DataFrame({
+            "revision": [
+                "1111111111", "2222222222bbbbbbbbbbbbbbbbbbbbbbbbbbbbbb",
+                "3333333333", "4444444444"
+            ],
+            "time_id": [-1, -1, -1, -1],
+            "value": [1, 2, 3, 4]
+        })
+
+
+class CachedDummyDatabase(
+    EvaluationDatabase, cache_id="cached_dummy_data", columns=["value"]
+):
+    """Database that stores its data in a cache file and counts how often it
+    was loaded."""
+
+    num_loads = 0
+
+    @classmethod
+    def _load_dataframe(
+        cls, project_name: str, commit_map: CommitMap,
+        case_study: tp.Optional[CaseStudy], **kwargs: tp.Any
+    ) -> pd.DataFrame:
+        cls.num_loads += 1
+        cache_file = get_data_file_path(cls.CACHE_ID, project_name)
+        if not cache_file.exists():
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text("1")
+        return pd.DataFrame({
+            "revision": ["1111111111", "2222222222"],
+            "time_id": [-1, -1],
+            "value": [int(cache_file.read_text()),
+                      kwargs.get("offset", 0)]
+        })
+
+
+def _load_paired_dataframe(
+    database: tp.Type[EvaluationDatabase]
+) -> tp.Callable[..., pd.DataFrame]:
+    """Create a loader that pairs every revision of a case study with its
+    predecessor in the case study, like the blame diff databases do."""
+
+    def load_dataframe(
+        project_name: str, commit_map: CommitMap,
+        case_study: tp.Optional[CaseStudy], **kwargs: tp.Any
+    ) -> pd.DataFrame:
+        # pylint: disable=unused-argument
+        revisions = sorted(
+            tp.cast(CaseStudy, case_study).revisions, key=commit_map.time_id
+        )
+        data = pd.DataFrame(columns=database.COLUMNS)
+        data["revision"] = [rev[:10] for rev in revisions[1:]]
+        data["time_id"] = -1
+        data[database.COLUMNS[2]] = [
+            commit_map.time_id(rev) - commit_map.time_id(pred)
+            for pred, rev in zip(revisions, revisions[1:])
+        ]
+        return data
+
+    return load_dataframe
+
+
+def _create_case_study(version: int, revisions: tp.List[str]) -> CaseStudy:
+    return CaseStudy(
+        "xz", version, [
+            CSStage(
+                revisions=[
+                    CSEntry(CMAP.c_hash(CMAP.short_time_id(rev)), 0)
+                    for rev in revisions
+                ]
+            )
+        ]
+    )
+
+
+class TestEvaluationDatabase(unittest.TestCase):
+    """Test loading and filtering data of an EvaluationDatabase."""
+
+    def setUp(self) -> None:
+        DummyDatabase.loaded_case_studies = []
+
+    def test_without_case_study(self):
+        """Check if all data is returned without a case study."""
+        data = DummyDatabase.get_data_for_project(
+            "xz", ["revision", "time_id", "value"], CMAP
+        )
+
+        self.assertEqual(data["value"].tolist(), [1, 2, 3, 4])
+        self.assertEqual(data["time_id"].tolist(), [0, 1, 2, 3])
+        self.assertEqual(DummyDatabase.loaded_case_studies, [None])
+
+    def test_unknown_revisions(self):
+        """Check if revisions that are not part of the commit map keep their
+        cached time id."""
+        commit_map = CommitMap([
+            "0, 1111111111aaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+            "1, 3333333333cccccccccccccccccccccccccccccc",
+        ])
+
+        data = DummyDatabase.get_data_for_project(
+            "xz", ["time_id", "value"], commit_map
+        )
+
+        self.assertEqual(data["value"].tolist(), [1, 2, 3, 4])
+        self.assertEqual(data["time_id"].tolist(), [0, -1, 1, -1])
+
+    def test_multiple_case_studies(self):
+        """Check if the data is loaded once and split by case study."""
+        case_study_0 = _create_case_study(0, ["1111111111", "2222222222"])
+        case_study_1 = _create_case_study(1, ["2222222222", "4444444444"])
+
+        data = DummyDatabase.get_data_for_project(
+            "xz", ["time_id", "value"], CMAP, case_study_0, case_study_1
+        )
+
+        self.assertEqual(list(data.columns), ["time_id", "value"])
+        self.assertEqual(data["value"].tolist(), [1, 2, 2, 4])
+        self.assertEqual(len(DummyDatabase.loaded_case_studies), 1)
+        self.assertEqual(
+            DummyDatabase.loaded_case_studies[0].revisions,
+            case_study_0.revisions + [CMAP.c_hash(3)]
+        )
+
+    def test_paired_revisions(self):
+        """Check if the data of databases that pair revisions of a case study
+        is loaded separately for every case study."""
+        case_study_0 = _create_case_study(
+            0, ["1111111111", "2222222222", "4444444444"]
+        )
+        case_study_1 = _create_case_study(1, ["3333333333", "4444444444"])
+
+        for database in (
+            BlameDiffMetricsDatabase, BlameDiffLibraryInteractionDatabase
+        ):
+            with mock.patch.object(
+                database,
+                "_load_dataframe",
+                side_effect=_load_paired_dataframe(database)
+            ):
+                columns = ["revision", database.COLUMNS[2]]
+                combined = database.get_data_for_project(
+                    "xz", columns, CMAP, case_study_0, case_study_1
+                )
+                separate = pd.concat([
+                    database.get_data_for_project(
+                        "xz", columns, CMAP, case_study
+                    ) for case_study in (case_study_0, case_study_1)
+                ])
+
+                self.assertEqual(
+                    combined.values.tolist(), separate.values.tolist()
+                )
+                self.assertEqual(
+                    combined[database.COLUMNS[2]].tolist(), [1, 2, 1]
+                )
+
+    def test_invalid_columns(self):
+        """Check if requesting unknown columns fails."""
+        self.assertRaises(
+            ValueError, DummyDatabase.get_data_for_project, "xz", ["foo"], CMAP,
+            _create_case_study(0, ["1111111111"])
+        )
+
+
+class TestQueryCache(unittest.TestCase):
+    """Test the process-wide query cache of evaluation databases."""
+
+    def setUp(self) -> None:
+        get_query_cache().clear()
+        CachedDummyDatabase.num_loads = 0
+
+    @replace_config()
+    def test_repeated_queries(self, config):
+        # pylint: disable=unused-argument
+        """Check if repeated queries are answered from the cache."""
+        first = CachedDummyDatabase.get_data_for_project(
+            "xz", ["time_id", "value"], CMAP
+        )
+        first["value"] = 42
+        second = CachedDummyDatabase.get_data_for_project(
+            "xz", ["revision", "value"], CMAP
+        )
+
+        self.assertEqual(CachedDummyDatabase.num_loads, 1)
+        self.assertEqual(second["value"].tolist(), [1, 0])
+
+        CachedDummyDatabase.get_data_for_project(
+            "xz", ["value"], CMAP, offset=1
+        )
+        self.assertEqual(CachedDummyDatabase.num_loads, 2)
+
+    @replace_config()
+    def test_invalidation(self, config):
+        # pylint: disable=unused-argument
+        """Check if the data is loaded again after the cache file changed."""
+        CachedDummyDatabase.get_data_for_project("xz", ["value"], CMAP)
+
+        cache_file = get_data_file_path(CachedDummyDatabase.CACHE_ID, "xz")
+        cache_file.write_text("7")
+        stat = os.stat(cache_file)
+        os.utime(
+            cache_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000)
+        )
+
+        data = CachedDummyDatabase.get_data_for_project("xz", ["value"], CMAP)
+        self.assertEqual(CachedDummyDatabase.num_loads, 2)
+        self.assertEqual(data["value"].tolist(), [7, 0])
+
+    def test_memory_budget(self):
+        """Check if least recently used entries are evicted when the memory
+        budget is exceeded."""
+        data = pd.DataFrame({"value": range(100)})
+        size = int(data.memory_usage(deep=True).sum())
+        query_cache = QueryCache(memory_budget=2 * size)
+
+        for key in ("a", "b"):
+            query_cache.insert((key,), (None,), data)
+        self.assertIs(query_cache.get(("a",), (None,)), data)
+        query_cache.insert(("c",), (None,), data)
+
+        self.assertEqual(query_cache.num_entries, 2)
+        self.assertEqual(query_cache.size, 2 * size)
+        self.assertIsNone(query_cache.get(("b",), (None,)))
+        self.assertIsNone(query_cache.get(("a",), ((1, 1),)))
+        self.assertIs(query_cache.get(("c",), (None,)), data)
+
+        query_cache.insert(("d",), (None,), pd.concat([data] * 3))
+        self.assertIsNone(query_cache.get(("d",), (None,)))
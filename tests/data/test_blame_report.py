@@ -2,18 +2,28 @@
 
 import unittest
 import unittest.mock as mock
+from copy import deepcopy
 from pathlib import Path
 
 import yaml
 
 from varats.data.reports.blame_report import (
+    BlameInteractionColumns,
+    BlameReportAnalysis,
     BlameReport,
     BlameReportDiff,
     BlameResultFunctionEntry,
     BlameInstInteractions,
+    count_interacting_authors,
+    count_interacting_commits,
+    count_interactions,
+    generate_author_degree_tuples,
+    generate_avg_time_distribution_tuples,
     generate_degree_tuples,
+    generate_max_time_distribution_tuples,
     generate_lib_dependent_degrees,
     gen_base_to_inter_commit_repo_pair_mapping,
+    get_commit_repo_pairs,
 )
 from varats.utils.git_util import CommitRepoPair
 
@@ -487,6 +497,81 @@ class TestBlameReportWithRepoData(unittest.TestCase):
         self.assertEqual(interaction.base_commit.repository_name, "xz")
 
 
+class TestBlameInteractionColumns(unittest.TestCase):
+    """Test if the interactions of a blame report are correctly stored in the
+    array-backed interaction columns."""
+
+    report: BlameReport
+
+    @classmethod
+    def setUpClass(cls):
+        """Load and parse function infos from yaml file."""
+        with mock.patch(
+            "builtins.open",
+            new=mock.mock_open(
+                read_data=YAML_DOC_HEADER + YAML_DOC_BR_METADATA + YAML_DOC_BR_2
+            )
+        ):
+            cls.report = BlameReport(Path(FAKE_REPORT_PATH))
+
+    def test_commits_are_interned(self):
+        """Check if every distinct commit is only stored once."""
+        columns = self.report.interaction_columns
+        self.assertEqual(len(columns.commits), 3)
+        self.assertEqual(len(columns), 4)
+        self.assertEqual(columns.base_commit_ids.tolist(), [0, 0, 0, 0])
+        self.assertEqual(
+            columns.interacting_commit_offsets.tolist(), [0, 1, 3, 4, 5]
+        )
+        self.assertEqual(columns.amounts.tolist(), [19, 7, 3, 2])
+        self.assertEqual(columns.degrees.tolist(), [1, 2, 1, 1])
+
+    def test_function_entries_are_views(self):
+        """Check if function entries are views on the interaction columns."""
+        func_entry = self.report.get_blame_result_function_entry('_Z7doStuffii')
+        self.assertEqual(func_entry.interaction_range, (2, 3))
+        self.assertEqual(
+            func_entry.interactions,
+            [self.report.interaction_columns.interaction(2)]
+        )
+
+        empty_entry = self.report.get_blame_result_function_entry(
+            'adjust_assignment_expression'
+        )
+        self.assertEqual(empty_entry.interaction_range, (0, 0))
+        self.assertEqual(empty_entry.interactions, [])
+
+    def test_deepcopy_materializes_interactions(self):
+        """Check if copies of a function entry do not reference the
+        columns."""
+        func_entry = self.report.get_blame_result_function_entry('bool_exec')
+        copied_entry = deepcopy(func_entry)
+
+        self.assertIsNone(copied_entry.interaction_range)
+        self.assertEqual(copied_entry.interactions, func_entry.interactions)
+        self.assertEqual(copied_entry.num_instructions, 42)
+
+    def test_count_helpers(self):
+        """Check if the count helpers work on the interaction columns."""
+        self.assertEqual(count_interactions(self.report), 31)
+        self.assertEqual(count_interacting_commits(self.report), 2)
+
+    def test_commit_repo_pairs(self):
+        """Check if the commits of a report are collected from the columns
+        without creating interaction objects."""
+        expected_pairs = set()
+        for func_entry in self.report.function_entries:
+            for interaction in func_entry.interactions:
+                expected_pairs.add(interaction.base_commit)
+                expected_pairs.update(interaction.interacting_commits)
+
+        with mock.patch.object(
+            BlameInteractionColumns, "interaction"
+        ) as interaction_mock:
+            self.assertEqual(get_commit_repo_pairs(self.report), expected_pairs)
+            interaction_mock.assert_not_called()
+
+
 class TestBlameReportDiff(unittest.TestCase):
     """Test if diffs between BlameReports are correctly computed."""
 
@@ -731,6 +816,82 @@ class TestBlameReportHelperFunctions(unittest.TestCase):
         self.assertEqual(degree_tuples[0], (1, 24))
         self.assertEqual(degree_tuples[1], (2, 7))
 
+    @staticmethod
+    def __commit_lookup(c_hash: str, repo_name: str):
+        author, days = {
+            "e64923e69eab82332c1bed7fe1e80e14c2c5cb7f": ("A", 0),
+            "5e030723d70f4894c21881e32dba4decec815c7e": ("B", 10),
+            "97c573ee98a1c2143b6876433697e363c9eca98b": ("A", 3),
+            "bd693d7bc2e4ae5be93e300506ba1efea149e5b7": ("C", 20),
+            "58ec513bd231f384038d9612ffdfb14affa6263f": ("D", 15),
+            "ead5e00960478e1d270aea5f373aece97b4b7e74": ("B", 12),
+        }[c_hash]
+        return author, f"{author}@example.com", days * 86400 + 42, ()
+
+    def test_author_degrees(self):
+        """Test if author degrees are computed per interaction."""
+        self.assertEqual(
+            count_interacting_authors(self.reports[1], self.__commit_lookup), 4
+        )
+        self.assertEqual(
+            generate_author_degree_tuples(
+                self.reports[1], self.__commit_lookup
+            ), [(2, 28), (1, 1), (4, 5)]
+        )
+
+    def test_time_delta_distributions(self):
+        """Test if time deltas are aggregated and bucketed per
+        interaction."""
+        self.assertEqual(
+            generate_max_time_distribution_tuples(
+                self.reports[1], self.__commit_lookup, 1
+            ), [(10, 33), (20, 1)]
+        )
+        self.assertEqual(
+            generate_max_time_distribution_tuples(
+                self.reports[1], self.__commit_lookup, 20
+            ), [(0, 33), (1, 1)]
+        )
+        self.assertEqual(
+            generate_avg_time_distribution_tuples(
+                self.reports[1], self.__commit_lookup, 1
+            ), [(6, 1), (8, 1), (9, 26), (7, 5), (16, 1)]
+        )
+
+    def test_fused_analysis(self):
+        """Test if the fused analysis matches the single helpers and looks up
+        every commit only once."""
+        commit_lookup = mock.Mock(side_effect=self.__commit_lookup)
+        analysis = BlameReportAnalysis(self.reports[1], commit_lookup)
+
+        self.assertEqual(
+            analysis.lib_dependent_degrees(),
+            generate_lib_dependent_degrees(self.reports[1])
+        )
+        self.assertEqual(
+            analysis.degree_tuples(), generate_degree_tuples(self.reports[1])
+        )
+        self.assertEqual(analysis.num_interactions(), 34)
+        self.assertEqual(analysis.num_interacting_commits(), 6)
+        self.assertEqual(analysis.num_interacting_authors(), 4)
+        self.assertEqual(
+            analysis.author_degree_tuples(), [(2, 28), (1, 1), (4, 5)]
+        )
+        self.assertEqual(
+            analysis.max_time_distribution_tuples(1), [(10, 33), (20, 1)]
+        )
+        self.assertEqual(
+            analysis.avg_time_distribution_tuples(1), [(6, 1), (8, 1), (9, 26),
+                                                       (7, 5), (16, 1)]
+        )
+        self.assertEqual(commit_lookup.call_count, 6)
+
+    def test_analysis_without_commit_lookup(self):
+        """Test that author degrees require a commit lookup."""
+        analysis = BlameReportAnalysis(self.reports[1])
+        self.assertEqual(analysis.num_interactions(), 34)
+        self.assertRaises(ValueError, analysis.author_degree_tuples)
+
     def test_generate_lib_dependent_degrees(self):
         """Test if degree tuples per library generation works."""
 
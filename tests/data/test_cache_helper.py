@@ -1,10 +1,23 @@
 """Test the cache_helper module."""
 import unittest
+import unittest.mock as mock
 
 import pandas as pd
 
 from tests.test_utils import replace_config
-from varats.data.cache_helper import build_cached_report_table
+from varats.data.cache_helper import (
+    CACHE_ID_COL,
+    CACHE_TIMESTAMP_COL,
+    CSVCacheStorage,
+    ParquetCacheStorage,
+    SegmentedReportTable,
+    build_cached_report_table,
+    cache_dataframe,
+    compact_cached_report_table,
+    get_data_file_path,
+    get_storage_backend,
+    load_cached_df_or_none,
+)
 
 
 class TestCacheHelper(unittest.TestCase):
@@ -18,59 +31,306 @@ class TestCacheHelper(unittest.TestCase):
         "c2": ("c", 2),
     }
 
+    @staticmethod
+    def create_empty_df():
+        return pd.DataFrame(columns=["entry"])
+
+    def create_cache_entry_data(self, entry: str):
+        return pd.DataFrame({"entry": entry}, index=[
+            0
+        ]), self.get_entry_id(entry), self.get_entry_timestamp(entry)
+
+    def get_entry_id(self, entry: str) -> str:
+        return self.TEST_DATA[entry][0]
+
+    def get_entry_timestamp(self, entry: str) -> str:
+        return str(self.TEST_DATA[entry][1])
+
+    @staticmethod
+    def is_newer_timestamp(ts1: str, ts2: str) -> bool:
+        return int(ts1) > int(ts2)
+
+    def build_table(
+        self, data_to_load, data_to_drop, create_cache_entry_data=None
+    ):
+        return build_cached_report_table(
+            "cache_test_data", "project", data_to_load, data_to_drop,
+            self.create_empty_df, create_cache_entry_data or
+            self.create_cache_entry_data, self.get_entry_id,
+            self.get_entry_timestamp, self.is_newer_timestamp
+        )
+
+    def check_build_cached_report_table(self):
+        """Check whether data items are correctly cached and updated/evicted."""
+        # initialize cache with a,b,c
+        df = self.build_table(["a", "b", "c"], [])
+
+        self.assertIn("a", df["entry"].values)
+        self.assertIn("b", df["entry"].values)
+        self.assertIn("c", df["entry"].values)
+
+        # update c -> c2 and "update" b -> b
+        df = self.build_table(["b", "c2"], [])
+
+        self.assertIn("a", df["entry"].values)
+        self.assertIn("b", df["entry"].values)
+        self.assertNotIn("c", df["entry"].values)
+        self.assertIn("c2", df["entry"].values)
+
+        # delete a via a2
+        df = self.build_table([], ["a"])
+
+        self.assertNotIn("a2", df["entry"].values)
+        self.assertIn("b", df["entry"].values)
+        self.assertIn("c2", df["entry"].values)
+
     def test_build_cached_report_table(self):
         """Check whether data items are correctly cached and updated/evicted."""
-        data_id = "cache_test_data"
-        project_name = "project"
+        with replace_config():
+            self.check_build_cached_report_table()
+
+    def test_build_cached_report_table_parallel(self):
+        """Check whether data items are correctly cached and updated/evicted
+        when entries are created by worker processes."""
+        with replace_config() as config:
+            config["caching"]["cache_build_workers"] = 2
+            self.check_build_cached_report_table()
+
+            df = self.build_table(["a", "b", "c", "c2"], [])
+            self.assertEqual(list(df["entry"].values), ["a", "b", "c2"])
+
+    def test_build_segmented_report_table(self):
+        """Check whether data items are correctly cached and updated/evicted
+        in a segmented table."""
+        with replace_config() as config:
+            config["caching"]["segmented_report_tables"] = True
+            self.check_build_cached_report_table()
+
+            table = SegmentedReportTable("cache_test_data", "project")
+            self.assertEqual({
+                entry_id: timestamp
+                for entry_id, (timestamp, _) in table.entries().items()
+            }, {
+                "a": "1",
+                "b": "1",
+                "c": "2"
+            })
+            # one segment for the initial entries and one for the update
+            self.assertEqual(len(list(table.path.glob("segment-*"))), 2)
+
+            table.drop_entries(["a"])
+            self.assertEqual(sorted(table.load()["entry"].values), ["b", "c2"])
 
-        def create_empty_df():
-            return pd.DataFrame(columns=["entry"])
+            compact_cached_report_table("cache_test_data", "project")
+            self.assertEqual(len(list(table.path.glob("segment-*"))), 1)
+            self.assertEqual(sorted(table.load()["entry"].values), ["b", "c2"])
+
+    def test_migrate_to_segmented_report_table(self):
+        """Check whether an existing cache file is imported as segment."""
+        with replace_config() as config:
+            self.build_table(["a", "b"], [])
+
+            config["caching"]["segmented_report_tables"] = True
+            df = self.build_table(["c"], [])
+            self.assertEqual(list(df["entry"].values), ["a", "b", "c"])
+            self.assertFalse(
+                get_data_file_path("cache_test_data", "project").exists()
+            )
+            self.assertEqual(
+                list(
+                    SegmentedReportTable("cache_test_data",
+                                         "project").load()["entry"].values
+                ), ["a", "b", "c"]
+            )
+
+    def test_checkpoint_on_failure(self):
+        """Check whether already created entries are stored if creating an
+        entry fails."""
 
         def create_cache_entry_data(entry: str):
-            return pd.DataFrame({"entry": entry}, index=[
-                0
-            ]), get_entry_id(entry), get_entry_timestamp(entry)
+            if entry == "c":
+                raise ValueError("Broken entry")
+            return self.create_cache_entry_data(entry)
 
-        def get_entry_id(entry: str) -> str:
-            return self.TEST_DATA[entry][0]
+        with replace_config() as config:
+            config["caching"]["cache_build_checkpoint_interval"] = 0
+            self.assertRaises(
+                ValueError, self.build_table, ["a", "b", "c"], [],
+                create_cache_entry_data
+            )
 
-        def get_entry_timestamp(entry: str) -> str:
-            return str(self.TEST_DATA[entry][1])
+            cached_df = load_cached_df_or_none("cache_test_data", "project")
+            self.assertIsNotNone(cached_df)
+            self.assertEqual(list(cached_df["entry"].values), ["a", "b"])
 
-        def is_newer_timestamp(ts1: str, ts2: str) -> bool:
-            return int(ts1) > int(ts2)
+            df = self.build_table(["a", "b", "c"], [])
+            self.assertEqual(list(df["entry"].values), ["a", "b", "c"])
 
+    def test_classification_scales_linearly(self):
+        """Check that classifying data items against the cached table does not
+        scan the table once per item."""
+
+        def count_column_accesses(num_entries: int) -> int:
+            entry_ids = [f"{idx:040x}" for idx in range(num_entries)]
+            cached_df = _ColumnAccessCountingDataFrame({
+                "value": [0] * num_entries,
+                CACHE_ID_COL: entry_ids,
+                CACHE_TIMESTAMP_COL: ["1"] * num_entries
+            })
+            _ColumnAccessCountingDataFrame.num_accesses = 0
+
+            with replace_config() as config:
+                config["caching"]["cache_build_checkpoint_interval"] = 0
+                with mock.patch(
+                    "varats.data.cache_helper.load_cached_df_or_none",
+                    return_value=cached_df
+                ), mock.patch("varats.data.cache_helper.cache_dataframe"):
+                    df = build_cached_report_table(
+                        "cache_scaling", "project",
+                        [f"{idx:040x}" for idx in range(0, num_entries, 2)] +
+                        ["new"], entry_ids[1::2],
+                        lambda: pd.DataFrame(columns=["value"]), lambda entry:
+                        (pd.DataFrame({"value": [0]}), entry, "1"),
+                        lambda entry: entry, lambda entry: "1",
+                        lambda ts1, ts2: int(ts1) > int(ts2)
+                    )
+            self.assertEqual(len(df), num_entries + 1)
+            return _ColumnAccessCountingDataFrame.num_accesses
+
+        self.assertEqual(count_column_accesses(1000), count_column_accesses(10))
+
+    def test_parallel_build_matches_sequential_build(self):
+        """Check whether building a large table with worker processes results
+        in the same table and checkpoints as building it sequentially."""
+        initial_entries = [f"e{idx}_1" for idx in range(20)]
+        entries_to_load = [f"e{idx}_2" for idx in range(10, 15)
+                          ] + [f"e{idx}_1" for idx in range(15, 30)]
+        entries_to_drop = [f"e{idx}_2" for idx in range(5)]
+
+        def build_tables(num_workers: int):
+            with replace_config() as config:
+                config["caching"]["cache_build_workers"] = num_workers
+                config["caching"]["cache_build_checkpoint_interval"] = 3
+                with mock.patch(
+                    "varats.data.cache_helper.cache_dataframe",
+                    wraps=cache_dataframe
+                ) as cache_mock:
+                    for data_to_load, data_to_drop in ((initial_entries, []), (
+                        entries_to_load, entries_to_drop
+                    )):
+                        df = build_cached_report_table(
+                            "cache_test_data", "project", data_to_load,
+                            data_to_drop, self.create_empty_df,
+                            _create_numbered_entry_data,
+                            lambda entry: entry.split("_")[0],
+                            lambda entry: entry.split("_")[1],
+                            self.is_newer_timestamp
+                        )
+                return df, load_cached_df_or_none(
+                    "cache_test_data", "project"
+                ), cache_mock.call_count
+
+        sequential_df, sequential_cache, sequential_checkpoints = build_tables(
+            1
+        )
+        parallel_df, parallel_cache, parallel_checkpoints = build_tables(2)
+
+        self.assertEqual(len(sequential_df), 2 * 25)
+        pd.testing.assert_frame_equal(parallel_df, sequential_df)
+        pd.testing.assert_frame_equal(parallel_cache, sequential_cache)
+        self.assertEqual(parallel_checkpoints, sequential_checkpoints)
+
+
+class _ColumnAccessCountingDataFrame(pd.DataFrame):
+    """Dataframe that counts how often the cache id column is accessed."""
+
+    num_accesses = 0
+
+    @property
+    def _constructor(self):
+        return _ColumnAccessCountingDataFrame
+
+    def __getitem__(self, key):
+        if isinstance(key, str) and key == CACHE_ID_COL:
+            _ColumnAccessCountingDataFrame.num_accesses += 1
+        return super().__getitem__(key)
+
+
+def _create_numbered_entry_data(entry: str):
+    entry_id, timestamp = entry.split("_")
+    return pd.DataFrame({"entry": [entry] * 2}), entry_id, timestamp
+
+
+class TestCacheStorage(unittest.TestCase):
+    """Test the storage backends for cached dataframes."""
+
+    TEST_DF = pd.DataFrame({
+        "revision": ["a", "b", "c"],
+        "amount": [1, 2, 3],
+        "fraction": [0.5, 0.25, 0.125]
+    })
+
+    def test_csv_round_trip(self):
+        """Check whether a dataframe is stored and loaded as csv file."""
         with replace_config():
-            # initialize cache with a,b,c
-            df = build_cached_report_table(
-                data_id, project_name, ["a", "b", "c"], [], create_empty_df,
-                create_cache_entry_data, get_entry_id, get_entry_timestamp,
-                is_newer_timestamp
+            cache_dataframe("storage_test", "project", self.TEST_DF)
+            self.assertTrue(
+                get_data_file_path("storage_test",
+                                   "project").name.endswith(".csv.gz")
             )
 
-            self.assertIn("a", df["entry"].values)
-            self.assertIn("b", df["entry"].values)
-            self.assertIn("c", df["entry"].values)
+            loaded_df = load_cached_df_or_none("storage_test", "project")
+            pd.testing.assert_frame_equal(loaded_df, self.TEST_DF)
 
-            # update c -> c2 and "update" b -> b
-            df = build_cached_report_table(
-                data_id, project_name, ["b", "c2"], [], create_empty_df,
-                create_cache_entry_data, get_entry_id, get_entry_timestamp,
-                is_newer_timestamp
+            projected_df = load_cached_df_or_none(
+                "storage_test", "project", ["amount"]
             )
+            self.assertEqual(list(projected_df.columns), ["amount"])
 
-            self.assertIn("a", df["entry"].values)
-            self.assertIn("b", df["entry"].values)
-            self.assertNotIn("c", df["entry"].values)
-            self.assertIn("c2", df["entry"].values)
+    def test_migrate_uncompressed_csv(self):
+        """Check whether uncompressed csv cache files are migrated."""
+        with replace_config():
+            file_path = get_data_file_path("storage_test", "project")
+            uncompressed_path = file_path.with_suffix("")
+            self.TEST_DF.to_csv(str(uncompressed_path))
+
+            loaded_df = load_cached_df_or_none("storage_test", "project")
+            pd.testing.assert_frame_equal(loaded_df, self.TEST_DF)
+            self.assertTrue(file_path.exists())
+            self.assertFalse(uncompressed_path.exists())
+
+    def test_fallback_to_csv(self):
+        """Check whether csv files are used if pyarrow is missing."""
+        with replace_config() as config:
+            config["caching"]["storage_format"] = "parquet"
+            with mock.patch.object(
+                ParquetCacheStorage, "is_available", return_value=False
+            ):
+                self.assertIsInstance(get_storage_backend(), CSVCacheStorage)
 
-            # delete a via a2
-            df = build_cached_report_table(
-                data_id, project_name, [], ["a"], create_empty_df,
-                create_cache_entry_data, get_entry_id, get_entry_timestamp,
-                is_newer_timestamp
+    def test_unknown_storage_format(self):
+        """Check whether unknown storage formats are rejected."""
+        with replace_config() as config:
+            config["caching"]["storage_format"] = "xlsx"
+            self.assertRaises(ValueError, get_storage_backend)
+
+    @unittest.skipUnless(ParquetCacheStorage.is_available(), "requires pyarrow")
+    def test_migrate_csv_to_parquet(self):
+        """Check whether csv cache files are migrated to parquet files."""
+        with replace_config() as config:
+            cache_dataframe("storage_test", "project", self.TEST_DF)
+            csv_path = get_data_file_path("storage_test", "project")
+
+            config["caching"]["storage_format"] = "parquet"
+            loaded_df = load_cached_df_or_none("storage_test", "project")
+            pd.testing.assert_frame_equal(loaded_df, self.TEST_DF)
+            self.assertFalse(csv_path.exists())
+            self.assertTrue(
+                get_data_file_path("storage_test", "project").exists()
             )
 
-            self.assertNotIn("a2", df["entry"].values)
-            self.assertIn("b", df["entry"].values)
-            self.assertIn("c2", df["entry"].values)
+            projected_df = load_cached_df_or_none(
+                "storage_test", "project", ["amount"]
+            )
+            self.assertEqual(list(projected_df.columns), ["amount"])
+            self.assertEqual(projected_df["amount"].dtype, "int64")
@@ -0,0 +1,233 @@
+"""Test the DataManager."""
+
+import tempfile
+import threading
+import os
+import time
+import unittest
+import unittest.mock as mock
+from pathlib import Path
+
+from tests.test_utils import replace_config
+from varats.data.data_manager import (
+    ChecksumIndex,
+    DataManager,
+    file_identity_key,
+    sha256_checksum,
+)
+from varats.report.report import BaseReport
+
+
+class CountingReport(BaseReport):
+    """Report that counts how often it was loaded."""
+
+    SHORTHAND = "CNT"
+    FILE_TYPE = "txt"
+
+    num_loads = 0
+    counter_lock = threading.Lock()
+
+    def __init__(self, path: Path) -> None:
+        super().__init__(path)
+        with CountingReport.counter_lock:
+            CountingReport.num_loads += 1
+        # give concurrent loaders a chance to overlap
+        time.sleep(0.05)
+        self.content = path.read_text()
+
+
+class FailingReport(BaseReport):
+    """Report that can not be loaded."""
+
+    SHORTHAND = "FAIL"
+    FILE_TYPE = "txt"
+
+    def __init__(self, path: Path) -> None:
+        super().__init__(path)
+        raise ValueError("Broken report")
+
+
+class TestDataManager(unittest.TestCase):
+    """Test caching and concurrent loading of the DataManager."""
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.files = []
+        for idx in range(3):
+            file_path = Path(self.tmp_dir.name) / f"report_{idx}.txt"
+            file_path.write_text(str(idx) * 100)
+            self.files.append(file_path)
+        CountingReport.num_loads = 0
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def test_cache_hit(self):
+        """Test if a file is only loaded once."""
+        data_manager = DataManager(file_size_budget=0)
+        first = data_manager.load_data_class_sync(self.files[0], CountingReport)
+        second = data_manager.load_data_class_sync(
+            self.files[0], CountingReport
+        )
+
+        self.assertIs(first, second)
+        self.assertEqual(CountingReport.num_loads, 1)
+        self.assertEqual(data_manager.statistics.hits, 1)
+        self.assertEqual(data_manager.statistics.misses, 1)
+        self.assertEqual(data_manager.statistics.num_entries, 1)
+        self.assertEqual(data_manager.statistics.size, 100)
+
+    def test_concurrent_loads_share_one_parse(self):
+        """Test if concurrent requests for the same file wait for a single
+        load."""
+        data_manager = DataManager(file_size_budget=0)
+        results = []
+
+        def load() -> None:
+            results.append(
+                data_manager.load_data_class_sync(
+                    self.files[0], CountingReport
+                )
+            )
+
+        threads = [threading.Thread(target=load) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(CountingReport.num_loads, 1)
+        self.assertEqual(len(results), 8)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(data_manager.statistics.misses, 1)
+        self.assertEqual(data_manager.statistics.hits, 7)
+
+    def test_lru_eviction(self):
+        """Test if the least recently used file is evicted when the file size
+        budget is exceeded."""
+        data_manager = DataManager(file_size_budget=250)
+        data_manager.load_data_class_sync(self.files[0], CountingReport)
+        data_manager.load_data_class_sync(self.files[1], CountingReport)
+        # touch the first file so that the second one is the oldest
+        data_manager.load_data_class_sync(self.files[0], CountingReport)
+        data_manager.load_data_class_sync(self.files[2], CountingReport)
+
+        self.assertEqual(data_manager.statistics.evictions, 1)
+        self.assertEqual(data_manager.statistics.num_entries, 2)
+        self.assertEqual(CountingReport.num_loads, 3)
+
+        data_manager.load_data_class_sync(self.files[0], CountingReport)
+        self.assertEqual(CountingReport.num_loads, 3)
+        data_manager.load_data_class_sync(self.files[1], CountingReport)
+        self.assertEqual(CountingReport.num_loads, 4)
+
+    def test_file_size_budget_setting(self):
+        """Test if the default file size budget is read in MiB from the
+        config."""
+        with replace_config() as config:
+            config["caching"]["data_manager_file_size_budget"] = 3
+            self.assertEqual(DataManager().file_size_budget, 3 * 1024 * 1024)
+        self.assertEqual(
+            DataManager(file_size_budget=250).file_size_budget, 250
+        )
+
+    def test_evict_and_clear(self):
+        """Test explicitly removing files from the cache."""
+        data_manager = DataManager(file_size_budget=0)
+        for file_path in self.files:
+            data_manager.load_data_class_sync(file_path, CountingReport)
+
+        self.assertTrue(data_manager.evict(self.files[0]))
+        self.assertFalse(data_manager.evict(self.files[0]))
+        self.assertEqual(data_manager.statistics.num_entries, 2)
+        self.assertEqual(data_manager.statistics.size, 200)
+
+        data_manager.clear()
+        self.assertEqual(data_manager.statistics.num_entries, 0)
+        self.assertEqual(data_manager.statistics.size, 0)
+
+        data_manager.load_data_class_sync(self.files[1], CountingReport)
+        self.assertEqual(CountingReport.num_loads, 4)
+
+    def test_failed_load(self):
+        """Test if a failing load does not block later requests."""
+        data_manager = DataManager(file_size_budget=0)
+        self.assertRaises(
+            ValueError, data_manager.load_data_class_sync, self.files[0],
+            FailingReport
+        )
+        self.assertRaises(
+            ValueError, data_manager.load_data_class_sync, self.files[0],
+            FailingReport
+        )
+        self.assertEqual(data_manager.statistics.num_entries, 0)
+
+    def test_identity_key_changes_with_file(self):
+        """Test if a modified file is loaded again in identity mode."""
+        data_manager = DataManager(file_size_budget=0, key_mode="identity")
+        first = data_manager.load_data_class_sync(self.files[0], CountingReport)
+
+        old_key = file_identity_key(self.files[0])
+        self.files[0].write_text("changed")
+        stat = os.stat(self.files[0])
+        os.utime(
+            self.files[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000)
+        )
+        self.assertNotEqual(file_identity_key(self.files[0]), old_key)
+
+        second = data_manager.load_data_class_sync(
+            self.files[0], CountingReport
+        )
+        self.assertEqual(second.content, "changed")
+        self.assertIsNot(first, second)
+        self.assertEqual(CountingReport.num_loads, 2)
+
+    def test_checksum_key_mode(self):
+        """Test if identical files share one cache entry in checksum mode."""
+        index_path = Path(self.tmp_dir.name) / "index.txt"
+        data_manager = DataManager(
+            file_size_budget=0,
+            key_mode="checksum",
+            checksum_index=ChecksumIndex(index_path)
+        )
+        copy_path = Path(self.tmp_dir.name) / "copy" / self.files[0].name
+        copy_path.parent.mkdir()
+        copy_path.write_text(self.files[0].read_text())
+
+        first = data_manager.load_data_class_sync(self.files[0], CountingReport)
+        second = data_manager.load_data_class_sync(copy_path, CountingReport)
+        self.assertIs(first, second)
+        self.assertEqual(CountingReport.num_loads, 1)
+
+
+class TestChecksumIndex(unittest.TestCase):
+    """Test the persistent checksum index."""
+
+    def test_checksum_is_computed_once(self):
+        """Test if checksums are stored and reused across index instances."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = Path(tmp_dir) / "report.txt"
+            file_path.write_text("content")
+            index_path = Path(tmp_dir) / "index" / "checksums.txt"
+
+            with mock.patch(
+                "varats.data.data_manager.sha256_checksum",
+                wraps=sha256_checksum
+            ) as checksum_mock:
+                checksum = ChecksumIndex(index_path).get_checksum(file_path)
+                self.assertEqual(checksum, sha256_checksum(file_path))
+                self.assertEqual(
+                    ChecksumIndex(index_path).get_checksum(file_path), checksum
+                )
+                self.assertEqual(checksum_mock.call_count, 1)
+
+                file_path.write_text("new content")
+                stat = os.stat(file_path)
+                os.utime(
+                    file_path,
+                    ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000)
+                )
+                self.assertNotEqual(
+                    ChecksumIndex(index_path).get_checksum(file_path), checksum
+                )
+                self.assertEqual(checksum_mock.call_count, 2)
@@ -4,7 +4,11 @@ import unittest
 
 from varats.data.reports.commit_report import CommitReport as CR
 from varats.data.reports.empty_report import EmptyReport
-from varats.report.report import FileStatusExtension, MetaReport
+from varats.report.report import (
+    FileStatusExtension,
+    MetaReport,
+    ResultFileName,
+)
 
 
 class TestMetaReport(unittest.TestCase):
@@ -146,3 +150,65 @@ class TestMetaReport(unittest.TestCase):
                 "fdb09c5a-4cee-42d8-bbdc-4afe7a7864be", "test", "txt"
             ), self.supplementary_filename
         )
+
+
+class TestResultFileName(unittest.TestCase):
+    """Test parsing of result file names."""
+
+    def test_parse_result_file_name(self):
+        """Check if all parts of a result file name are parsed."""
+        file_name = ResultFileName.parse(
+            "CR-foo-bar-7bb9ef5f8c_fdb09c5a-4cee-42d8_failed.tar.gz"
+        )
+        self.assertIsNotNone(file_name)
+        self.assertEqual(file_name.shorthand, "CR")
+        self.assertEqual(file_name.project_name, "foo")
+        self.assertEqual(file_name.binary_name, "bar")
+        self.assertEqual(file_name.commit_hash, "7bb9ef5f8c")
+        self.assertEqual(file_name.uuid, "fdb09c5a-4cee-42d8")
+        self.assertEqual(file_name.status, FileStatusExtension.Failed)
+        self.assertEqual(file_name.file_ext, ".tar.gz")
+        self.assertFalse(file_name.is_supplementary)
+
+    def test_parse_ambiguous_names(self):
+        """Check that separators in names are assigned like in the documented
+        file name template."""
+        file_name = ResultFileName.parse("A-B-x-y-z-42_1_.txt")
+        self.assertEqual(file_name.shorthand, "A-B-x")
+        self.assertEqual(file_name.commit_hash, "42")
+        self.assertIsNone(file_name.status)
+
+        file_name = ResultFileName.parse("CR-foo-foo-42_ab_12_success")
+        self.assertEqual(file_name.commit_hash, "42_ab")
+        self.assertEqual(file_name.uuid, "12")
+        self.assertIsNone(file_name.file_ext)
+
+    def test_parse_invalid_names(self):
+        """Check that malformed names are rejected."""
+        self.assertIsNone(ResultFileName.parse("CR-foo-42_1_success.txt"))
+        self.assertIsNone(ResultFileName.parse("CR-foo-foo-42_xy_success.txt"))
+        self.assertIsNone(ResultFileName.parse("CR-foo-foo-42_1_unknown.txt"))
+        self.assertIsNone(ResultFileName.parse(""))
+
+    def test_parse_supplementary_file_name(self):
+        """Check if all parts of a supplementary file name are parsed."""
+        file_name = ResultFileName.parse_supplementary(
+            "CR-SUPPL-foo-bar-7bb9ef5f8c_fdb09c5a_cfg_info.txt"
+        )
+        self.assertIsNotNone(file_name)
+        self.assertTrue(file_name.is_supplementary)
+        self.assertEqual(file_name.shorthand, "CR")
+        self.assertEqual(file_name.project_name, "foo")
+        self.assertEqual(file_name.binary_name, "bar")
+        self.assertEqual(file_name.commit_hash, "7bb9ef5f8c")
+        self.assertEqual(file_name.info_type, "cfg_info")
+        self.assertEqual(file_name.file_ext, ".txt")
+        self.assertIsNone(
+            ResultFileName.
+            parse_supplementary("CR-foo-bar-7bb9ef5f8c_fdb09c5a_success.txt")
+        )
+
+    def test_parsed_names_are_cached(self):
+        """Check that repeated lookups reuse the parsed name."""
+        name = "CR-foo-foo-7bb9ef5f8c_fdb09c5a_success.txt"
+        self.assertIs(ResultFileName.parse(name), ResultFileName.parse(name))
@@ -0,0 +1,294 @@
+"""Test binary sidecar files of parsed reports."""
+
+import os
+import shutil
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from varats.data.report_sidecar import (
+    get_sidecar_file_path,
+    load_report_sidecar,
+)
+from varats.data.reports.blame_report import BlameReport
+from varats.data.reports.commit_report import CommitReport
+from varats.data.reports.szz_report import SZZUnleashedReport
+from tests.test_utils import replace_config, TEST_INPUTS_DIR
+
+BLAME_REPORT_PATH = (
+    TEST_INPUTS_DIR / "results" / "xz" /
+    "BR-xz-xz-2f0bc9cd40_9e238675-ee7c-4325-8e9f-8ccf6fd3f05c_success.yaml"
+)
+
+YAML_COMMIT_REPORT = """---
+DocType:         CommitReport
+Version:         3
+...
+---
+function-info:
+  - id:              bi_init
+    region-id:       b8b25e7f1593f6dcc20660ff9fb1ed59ede15b7a
+    function-name:   bi_init
+region-mapping:
+  - id:              b8b25e7f1593f6dcc20660ff9fb1ed59ede15b7a
+    hash:            b8b25e7f1593f6dcc20660ff9fb1ed59ede15b7a
+  - id:              3ea7fe86ac3c1a887038e0e3e1c07ba4634ad1a5
+    hash:            3ea7fe86ac3c1a887038e0e3e1c07ba4634ad1a5
+...
+---
+- function-id:     bi_init
+  call-graph-edges:
+    - from-region:     3ea7fe86ac3c1a887038e0e3e1c07ba4634ad1a5
+      to-functions:
+        - llvm.dbg.value
+        - flush_outbuf
+  control-flow-edges:
+    - from:            3ea7fe86ac3c1a887038e0e3e1c07ba4634ad1a5
+      to:              b8b25e7f1593f6dcc20660ff9fb1ed59ede15b7a
+  data-flow-relations:
+...
+"""
+
+YAML_COMMIT_REPORT_INT_IDS = YAML_COMMIT_REPORT.replace(
+    "- function-id:     bi_init", "- function-id:     42"
+).replace("        - flush_outbuf", "        - 7")
+
+YAML_SZZ_REPORT = """---
+DocType:         SZZReport
+Version:         1
+...
+---
+szz_tool: SZZUnleashed
+bugs:
+  00e53c362677ba9363e89e859a54027581c60cf2:
+  - 4795b2913b85d70dd506d743ef7cb254e875b7a7
+  - e8999a84efbd9c3e739bff7af39500d14e61bfbc
+  029c5c8aaa410aa7ddb2bdf192201af4672e5af6:
+  - e8999a84efbd9c3e739bff7af39500d14e61bfbc
+...
+"""
+
+
+def _touch_later(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+
+
+class TestReportSidecar(unittest.TestCase):
+    """Test storing, loading, and invalidating report sidecars."""
+
+    def test_blame_report_sidecar(self):
+        """Test if a blame report loaded from its sidecar equals the parsed
+        report."""
+        with replace_config() as config:
+            config["caching"]["report_sidecars"] = True
+            report_path = Path(
+                str(config["data_cache"])
+            ).parent / "xz" / BLAME_REPORT_PATH.name
+            report_path.parent.mkdir()
+            shutil.copy(BLAME_REPORT_PATH, report_path)
+
+            parsed_report = BlameReport(report_path)
+            sidecar_path = get_sidecar_file_path(report_path)
+            self.assertTrue(sidecar_path.exists())
+
+            loaded_report = BlameReport(report_path)
+            self.assertEqual(
+                loaded_report.meta_data.num_functions,
+                parsed_report.meta_data.num_functions
+            )
+            self.assertEqual(
+                loaded_report.meta_data.num_instructions,
+                parsed_report.meta_data.num_instructions
+            )
+            self.assertEqual([
+                str(entry) for entry in loaded_report.function_entries
+            ], [str(entry) for entry in parsed_report.function_entries])
+
+    def test_commit_report_sidecar(self):
+        """Test if a commit report loaded from its sidecar equals the parsed
+        report."""
+        with replace_config() as config:
+            config["caching"]["report_sidecars"] = True
+            report_path = Path(
+                str(config["data_cache"])
+            ).parent / "CR-xz-xz-42_1_success.yaml"
+            report_path.write_text(YAML_COMMIT_REPORT)
+
+            parsed_report = CommitReport(report_path)
+            loaded_report = CommitReport(report_path)
+            self.assertTrue(get_sidecar_file_path(report_path).exists())
+
+            self.assertEqual({
+                name: str(finfo) for name, finfo in loaded_report.finfos.items()
+            }, {
+                name: str(finfo) for name, finfo in parsed_report.finfos.items()
+            })
+            self.assertEqual({
+                rid: str(r_map)
+                for rid, r_map in loaded_report.region_mappings.items()
+            }, {
+                rid: str(r_map)
+                for rid, r_map in parsed_report.region_mappings.items()
+            })
+            loaded_edges = loaded_report.graph_info["bi_init"]
+            self.assertEqual(
+                str(loaded_edges), str(parsed_report.graph_info["bi_init"])
+            )
+            self.assertEqual(len(loaded_edges.cg_edges), 2)
+            self.assertEqual(len(loaded_edges.cf_edges), 1)
+            self.assertEqual(len(loaded_edges.df_relations), 0)
+
+    def test_szz_report_sidecar(self):
+        """Test if a szz report loaded from its sidecar equals the parsed
+        report."""
+        with replace_config() as config:
+            config["caching"]["report_sidecars"] = True
+            report_path = Path(
+                str(config["data_cache"])
+            ).parent / "SZZU-xz-xz-42_1_success.yaml"
+            report_path.write_text(YAML_SZZ_REPORT)
+
+            parsed_report = SZZUnleashedReport(report_path)
+            loaded_report = SZZUnleashedReport(report_path)
+            self.assertTrue(get_sidecar_file_path(report_path).exists())
+
+            self.assertEqual(
+                loaded_report.get_all_raw_bugs(),
+                parsed_report.get_all_raw_bugs()
+            )
+            bug = loaded_report.get_raw_bug_by_fix(
+                "00e53c362677ba9363e89e859a54027581c60cf2"
+            )
+            self.assertEqual(
+                bug.introducing_commits, {
+                    "4795b2913b85d70dd506d743ef7cb254e875b7a7",
+                    "e8999a84efbd9c3e739bff7af39500d14e61bfbc"
+                }
+            )
+
+    def test_sidecar_invalidation(self):
+        """Test if a sidecar is ignored and replaced after the report file
+        changed."""
+        with replace_config() as config:
+            config["caching"]["report_sidecars"] = True
+            report_path = Path(
+                str(config["data_cache"])
+            ).parent / "SZZU-xz-xz-42_1_success.yaml"
+            report_path.write_text(YAML_SZZ_REPORT)
+            SZZUnleashedReport(report_path)
+
+            report_path.write_text(
+                YAML_SZZ_REPORT.replace(
+                    "  029c5c8aaa410aa7ddb2bdf192201af4672e5af6:\n"
+                    "  - e8999a84efbd9c3e739bff7af39500d14e61bfbc\n", ""
+                )
+            )
+            _touch_later(report_path)
+
+            report = SZZUnleashedReport(report_path)
+            self.assertEqual(len(report.get_all_raw_bugs()), 1)
+            self.assertEqual(
+                len(SZZUnleashedReport(report_path).get_all_raw_bugs()), 1
+            )
+
+    def test_sidecars_disabled(self):
+        """Test that no sidecar is written if sidecars are disabled."""
+        with replace_config() as config:
+            config["caching"]["report_sidecars"] = False
+            report_path = Path(
+                str(config["data_cache"])
+            ).parent / "SZZU-xz-xz-42_1_success.yaml"
+            report_path.write_text(YAML_SZZ_REPORT)
+
+            SZZUnleashedReport(report_path)
+            self.assertFalse(get_sidecar_file_path(report_path).exists())
+
+    def test_commit_report_sidecar_types(self):
+        """Test if a commit report loaded from its sidecar keeps the types of
+        function ids and call graph edges."""
+        with replace_config() as config:
+            config["caching"]["report_sidecars"] = True
+            report_path = Path(
+                str(config["data_cache"])
+            ).parent / "CR-xz-xz-42_1_success.yaml"
+            report_path.write_text(YAML_COMMIT_REPORT_INT_IDS)
+
+            parsed_report = CommitReport(report_path)
+            loaded_report = CommitReport(report_path)
+            self.assertTrue(get_sidecar_file_path(report_path).exists())
+
+            self.assertEqual(
+                list(loaded_report.graph_info), list(parsed_report.graph_info)
+            )
+            self.assertIsInstance(loaded_report.graph_info[42].fid, int)
+            self.assertEqual([
+                (edge.region, edge.function)
+                for edge in loaded_report.graph_info[42].cg_edges
+            ], [(edge.region, edge.function)
+                for edge in parsed_report.graph_info[42].cg_edges])
+            self.assertIsInstance(
+                loaded_report.graph_info[42].cg_edges[1].function, int
+            )
+
+    def test_sidecar_path(self):
+        """Test if reports with the same name in different directories get
+        different sidecars."""
+        with replace_config() as config:
+            config["caching"]["report_sidecars"] = True
+            base_dir = Path(str(config["data_cache"])).parent
+            report_paths = [
+                base_dir / result_dir / "xz" / "SZZU-xz-xz-42_1_success.yaml"
+                for result_dir in ("results_a", "results_b")
+            ]
+            for report_path in report_paths:
+                report_path.parent.mkdir(parents=True)
+                report_path.write_text(YAML_SZZ_REPORT)
+            report_paths[1].write_text(
+                YAML_SZZ_REPORT.replace(
+                    "  029c5c8aaa410aa7ddb2bdf192201af4672e5af6:\n"
+                    "  - e8999a84efbd9c3e739bff7af39500d14e61bfbc\n", ""
+                )
+            )
+
+            self.assertNotEqual(
+                get_sidecar_file_path(report_paths[0]),
+                get_sidecar_file_path(report_paths[1])
+            )
+            for report_path, num_bugs in zip(report_paths, (2, 1)):
+                SZZUnleashedReport(report_path)
+                self.assertEqual(
+                    len(SZZUnleashedReport(report_path).get_all_raw_bugs()),
+                    num_bugs
+                )
+
+    def test_sidecar_memory_mapped(self):
+        """Test if the arrays of a sidecar are memory mapped."""
+        with replace_config() as config:
+            config["caching"]["report_sidecars"] = True
+            report_path = Path(
+                str(config["data_cache"])
+            ).parent / "SZZU-xz-xz-42_1_success.yaml"
+            report_path.write_text(YAML_SZZ_REPORT)
+            SZZUnleashedReport(report_path)
+
+            sidecar = load_report_sidecar(report_path, "SZZReport", 1)
+            self.assertIsNotNone(sidecar)
+            self.assertTrue(
+                any(
+                    isinstance(array, np.memmap)
+                    for array in sidecar[1].values()
+                )
+            )
+
+    def test_sidecars_disabled_by_default(self):
+        """Test that sidecars are opt-in."""
+        with replace_config() as config:
+            report_path = Path(
+                str(config["data_cache"])
+            ).parent / "SZZU-xz-xz-42_1_success.yaml"
+            report_path.write_text(YAML_SZZ_REPORT)
+
+            SZZUnleashedReport(report_path)
+            self.assertFalse(get_sidecar_file_path(report_path).exists())
@@ -1,14 +1,44 @@
 """Test revision helper functions."""
 
+import os
+import tempfile
+import typing as tp
 import unittest
 import unittest.mock as mock
+from pathlib import Path
 
-from benchbuild.utils.revision_ranges import block_revisions, SingleRevision
+import numpy as np
+import plumbum as pb
+import pygit2
+from benchbuild.utils.revision_ranges import (
+    block_revisions,
+    RevisionRange,
+    SingleRevision,
+)
 
-from tests.test_utils import DummyGit
+from tests.test_utils import DummyGit, replace_config
+from varats.data.reports.commit_report import CommitReport
 from varats.projects.c_projects.glibc import Glibc
 from varats.projects.c_projects.gravity import Gravity
-from varats.revision.revisions import filter_blocked_revisions
+from varats.mapping.commit_map import generate_commit_map
+from varats.report.report import FileStatusExtension
+from varats.revision.blocked_revisions import (
+    get_blocked_revision_index,
+    get_blocked_revisions_cache_path,
+    get_block_declaration_hash,
+    get_revision_blocks,
+)
+from varats.revision.result_file_index import (
+    ResultFileIndex,
+    ResultFileRecord,
+)
+from varats.revision.revisions import (
+    filter_blocked_revisions,
+    get_failed_revisions_files,
+    get_processed_revisions_files,
+    get_supplementary_result_files,
+    is_revision_blocked,
+)
 
 
 class TestFilterBlockedRevisions(unittest.TestCase):
@@ -63,3 +93,250 @@ class TestFilterBlockedRevisions(unittest.TestCase):
         )
 
         self.assertLessEqual(unblocked_revisions, filtered_revisions)
+
+
+class LocalGit(DummyGit):
+    """A git source that uses an existing local repository."""
+
+    def fetch(self) -> pb.LocalPath:
+        return pb.LocalPath(self.local)
+
+
+class TestBlockedRevisionIndex(unittest.TestCase):
+    """Test the precomputed index of blocked revisions."""
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.repo = pygit2.init_repository(self.tmp_dir.name)
+        self.commits: tp.List[str] = []
+        for idx in range(5):
+            signature = pygit2.Signature(
+                "Test", "test@example.com", 1600000000 + 60 * idx
+            )
+            commit_id = self.repo.create_commit(
+                "refs/heads/main", signature, signature, f"commit {idx}",
+                self.repo.TreeBuilder().write(),
+                [pygit2.Oid(hex=self.commits[-1])] if self.commits else []
+            )
+            self.commits.append(str(commit_id))
+        self.repo.set_head("refs/heads/main")
+
+        self.blocks = [
+            SingleRevision(self.commits[0][:10]),
+            RevisionRange(self.commits[1], self.commits[3])
+        ]
+        self.source = block_revisions(self.blocks)(
+            LocalGit(remote="/dev/null", local=self.tmp_dir.name)
+        )
+
+        project_source_patcher = mock.patch(
+            'varats.revision.revisions.get_primary_project_source'
+        )
+        self.addCleanup(project_source_patcher.stop)
+        project_source_patcher.start().return_value = self.source
+
+        commit_map_patcher = mock.patch(
+            'varats.revision.blocked_revisions.get_commit_map',
+            side_effect=lambda _: generate_commit_map(Path(self.tmp_dir.name))
+        )
+        self.addCleanup(commit_map_patcher.stop)
+        self.commit_map_mock = commit_map_patcher.start()
+
+    def test_get_revision_blocks(self):
+        """Check if the block declaration of a source is found."""
+        self.assertEqual(get_revision_blocks(self.source), self.blocks)
+        self.assertIsNone(
+            get_revision_blocks(
+                DummyGit(remote="/dev/null", local="/dev/null")
+            )
+        )
+
+    def test_get_revision_blocks_benchbuild_layout(self):
+        """Check if the block declaration can be found with the layout of the
+        installed benchbuild version."""
+        blocks = [SingleRevision("7059e9fa34"), RevisionRange("a1", "b2")]
+        source = block_revisions(blocks)(
+            DummyGit(remote="/dev/null", local="/dev/null")
+        )
+
+        with mock.patch("varats.revision.blocked_revisions.LOG") as log_mock:
+            self.assertEqual(get_revision_blocks(source), blocks)
+            log_mock.warning.assert_not_called()
+
+    def test_get_revision_blocks_not_inspectable(self):
+        """Check if a warning is logged if a source has blocked revisions that
+        can not be inspected."""
+        source = DummyGit(remote="/dev/null", local="/dev/null")
+        source.is_blocked_revision = lambda rev_id: (False, None)
+
+        with self.assertLogs(
+            "varats.revision.blocked_revisions", level="WARNING"
+        ):
+            self.assertIsNone(get_revision_blocks(source))
+
+    @replace_config()
+    def test_blocked_revisions(self, config):
+        # pylint: disable=unused-argument
+        """Check if blocked revisions are looked up like benchbuild does."""
+        index = get_blocked_revision_index("gravity", self.source)
+
+        self.assertIsNotNone(index)
+        for revision in self.commits + [commit[:10] for commit in self.commits]:
+            self.assertEqual(
+                index.is_blocked(revision),
+                self.source.is_blocked_revision(revision)[0], revision
+            )
+        self.assertEqual(
+            index.blocked_time_ids.tolist(), [True, True, True, True, False]
+        )
+        self.assertEqual(
+            index.is_blocked_time_id(np.array([4, 2])).tolist(), [False, True]
+        )
+        self.assertTrue(is_revision_blocked(self.commits[2], Gravity))
+        self.assertFalse(is_revision_blocked(self.commits[4][:10], Gravity))
+
+    @replace_config()
+    def test_index_is_cached(self, config):
+        # pylint: disable=unused-argument
+        """Check if the index is stored in the data cache and reused."""
+        first_index = get_blocked_revision_index("gravity", self.source)
+        cache_path = get_blocked_revisions_cache_path(
+            "gravity", get_block_declaration_hash(self.blocks)
+        )
+        self.assertTrue(cache_path.exists())
+        self.assertIs(
+            get_blocked_revision_index("gravity", self.source), first_index
+        )
+
+        other_source = block_revisions(self.blocks)(
+            LocalGit(remote="/dev/null", local=self.tmp_dir.name)
+        )
+        with mock.patch(
+            'benchbuild.utils.revision_ranges.RevisionRange.init_cache'
+        ) as init_cache_mock:
+            cached_index = get_blocked_revision_index("gravity", other_source)
+            init_cache_mock.assert_not_called()
+        self.assertEqual(
+            cached_index.blocked_revisions, first_index.blocked_revisions
+        )
+        self.assertEqual(
+            cached_index.blocked_time_ids.tolist(),
+            first_index.blocked_time_ids.tolist()
+        )
+        self.assertEqual(self.commit_map_mock.call_count, 1)
+
+    @replace_config()
+    def test_disabled_index(self, config):
+        """Check if benchbuild's check is used if the index is disabled."""
+        config["caching"]["blocked_revision_index"] = False
+        self.assertIsNone(get_blocked_revision_index("gravity", self.source))
+        self.assertTrue(is_revision_blocked(self.commits[0][:10], Gravity))
+        self.assertFalse(is_revision_blocked(self.commits[0], Gravity))
+
+
+class TestResultFileIndex(unittest.TestCase):
+    """Test the result file index that backs the revision lookups."""
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.result_dir = Path(self.tmp_dir.name) / "results"
+        (self.result_dir / "xz").mkdir(parents=True)
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def add_result_file(
+        self, commit_hash: str, status: FileStatusExtension, mtime: int
+    ) -> Path:
+        """Create a commit report result file in the test result dir."""
+        file_path = self.result_dir / "xz" / CommitReport.get_file_name(
+            "xz", "xz", commit_hash, f"{mtime:08d}-0000-0000-0000-000000000000",
+            status
+        )
+        file_path.touch()
+        os.utime(file_path, (mtime, mtime))
+        return file_path
+
+    def test_revision_lookups(self):
+        """Check whether the revision lookups use the newest result files."""
+        with replace_config() as config:
+            config["result_dir"] = str(self.result_dir)
+            success = self.add_result_file(
+                "2f0bc9cd40", FileStatusExtension.Success, 1
+            )
+            self.add_result_file("c5c7ceb08a", FileStatusExtension.Success, 2)
+            failed = self.add_result_file(
+                "c5c7ceb08a", FileStatusExtension.Failed, 3
+            )
+            suppl_file = self.result_dir / "xz" / \
+                CommitReport.get_supplementary_file_name(
+                    "xz", "xz", "2f0bc9cd40",
+                    "00000001-0000-0000-0000-000000000000", "info", ".txt")
+            suppl_file.touch()
+
+            self.assertEqual(
+                get_processed_revisions_files("xz", CommitReport), [success]
+            )
+            self.assertEqual(
+                get_failed_revisions_files("xz", CommitReport), [failed]
+            )
+            self.assertEqual(
+                get_supplementary_result_files("xz", CommitReport),
+                [(suppl_file, "2f0bc9cd40", "info")]
+            )
+
+            # new files show up in later lookups
+            new_success = self.add_result_file(
+                "c5c7ceb08a", FileStatusExtension.Success, 4
+            )
+            self.assertEqual(
+                sorted(get_processed_revisions_files("xz", CommitReport)),
+                sorted([success, new_success])
+            )
+
+    def test_file_names_are_parsed_once(self):
+        """Check whether an unchanged directory is not rescanned."""
+        self.add_result_file("2f0bc9cd40", FileStatusExtension.Success, 1)
+        self.add_result_file("c5c7ceb08a", FileStatusExtension.Success, 2)
+        old_time = 1000000000
+        os.utime(self.result_dir / "xz", (old_time, old_time))
+
+        index = ResultFileIndex(self.result_dir / "xz")
+        with mock.patch(
+            "varats.revision.result_file_index.ResultFileRecord",
+            wraps=ResultFileRecord
+        ) as record_mock:
+            self.assertEqual(len(index.result_files(CommitReport)), 2)
+            self.assertEqual(len(index.result_files(CommitReport)), 2)
+            self.assertEqual(record_mock.call_count, 2)
+
+            self.add_result_file("ef364d3abc", FileStatusExtension.Success, 3)
+            os.utime(self.result_dir / "xz", (old_time + 1, old_time + 1))
+            self.assertEqual(len(index.result_files(CommitReport)), 3)
+            self.assertEqual(record_mock.call_count, 3)
+
+    def test_replaced_files_are_updated(self):
+        """Check whether records of replaced files are recreated during a
+        rescan."""
+        result_file = self.add_result_file(
+            "2f0bc9cd40", FileStatusExtension.Success, 1
+        )
+        old_time = 1000000000
+        os.utime(self.result_dir / "xz", (old_time, old_time))
+
+        index = ResultFileIndex(self.result_dir / "xz")
+        record = index.result_files(CommitReport)["2f0bc9cd40"][0]
+        self.assertEqual(record.mtime, 1)
+
+        result_file.write_text("new result")
+        os.utime(result_file, (5, 5))
+        self.add_result_file("ef364d3abc", FileStatusExtension.Success, 3)
+        os.utime(self.result_dir / "xz", (old_time + 1, old_time + 1))
+
+        new_record = index.result_files(CommitReport)["2f0bc9cd40"][0]
+        self.assertEqual(new_record.mtime, 5)
+        self.assertEqual(
+            new_record.identity,
+            ResultFileRecord.file_identity(result_file.stat())
+        )
@@ -0,0 +1,353 @@
+"""Test the CommitMap."""
+
+import io
+import tempfile
+import typing as tp
+import unittest
+from pathlib import Path
+
+import unittest.mock as mock
+
+import numpy as np
+import pandas as pd
+import pygit2
+
+import varats.mapping.commit_map as commit_map_module
+from tests.test_utils import replace_config
+from varats.mapping.commit_map import (
+    CommitMap,
+    generate_cached_commit_map,
+    generate_commit_map,
+    get_commit_map_cache_path,
+    load_commit_map_from_path,
+    store_commit_map_stream,
+)
+
+CMAP_LINES = [
+    "0, 8e5f2b7c1a3d9e0f4b6a2c8d1e7f3a9b5c0d4e2f\n",
+    "1, 2f0bc9cd40aa32b97ff4da6d1a7c53c3f3b6b8b6\n",
+    "3, 8e5f2b0000000000000000000000000000000000\n",
+    "4, a1b2c3d4e5f60718293a4b5c6d7e8f9012345678\n",
+]
+
+
+class TestCommitMap(unittest.TestCase):
+    """Test the lookups of the CommitMap."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.cmap = CommitMap(CMAP_LINES)
+
+    def test_time_id(self):
+        """Check if full hashes are mapped to their time ids."""
+        self.assertEqual(
+            self.cmap.time_id("2f0bc9cd40aa32b97ff4da6d1a7c53c3f3b6b8b6"), 1
+        )
+        self.assertRaises(KeyError, self.cmap.time_id, "2f0bc9cd40")
+
+    def test_time_ids(self):
+        """Check batch translation of full hashes."""
+        self.assertEqual(
+            self.cmap.time_ids([
+                "a1b2c3d4e5f60718293a4b5c6d7e8f9012345678",
+                "8e5f2b7c1a3d9e0f4b6a2c8d1e7f3a9b5c0d4e2f"
+            ]).tolist(), [4, 0]
+        )
+        self.assertEqual(self.cmap.time_ids([]).tolist(), [])
+        self.assertRaises(KeyError, self.cmap.time_ids, ["abc"])
+
+    def test_short_time_id(self):
+        """Check if short hashes are resolved by prefix."""
+        self.assertEqual(self.cmap.short_time_id("2f0bc9cd40"), 1)
+        self.assertEqual(self.cmap.short_time_id("a1b2"), 4)
+        self.assertRaises(KeyError, self.cmap.short_time_id, "ffff")
+        self.assertRaises(KeyError, self.cmap.short_time_id, "0")
+
+    def test_ambiguous_short_time_id(self):
+        """Check if ambiguous short hashes resolve to the smallest hash."""
+        with self.assertLogs("varats.mapping.commit_map", level="WARNING"):
+            self.assertEqual(self.cmap.short_time_id("8e5f2b"), 3)
+
+    def test_short_time_ids(self):
+        """Check batch resolution of short hashes."""
+        self.assertEqual(
+            self.cmap.short_time_ids(
+                pd.Series(["a1b2", "2f0bc9cd40", "a1b2c3", "8e5f2b7"])
+            ).tolist(), [4, 1, 4, 0]
+        )
+        self.assertEqual(self.cmap.short_time_ids([]).tolist(), [])
+        self.assertEqual(self.cmap.short_time_ids(iter(["2f0b"])).tolist(), [1])
+        self.assertRaises(KeyError, self.cmap.short_time_ids, ["a1", "ffff"])
+        self.assertRaises(KeyError, self.cmap.short_time_ids, ["0"])
+        self.assertRaises(KeyError, CommitMap([]).short_time_ids, ["a1"])
+
+    def test_short_time_ids_default(self):
+        """Check if unknown short hashes are mapped to a default time id."""
+        self.assertEqual(
+            self.cmap.short_time_ids(["a1b2", "ffff", "0", "2f0b"],
+                                     default=-1).tolist(), [4, -1, -1, 1]
+        )
+        self.assertEqual(
+            CommitMap([]).short_time_ids(["a1"], default=-1).tolist(), [-1]
+        )
+
+    def test_short_time_ids_match_short_time_id(self):
+        """Check that batch and single resolution agree."""
+        short_hashes = [
+            c_hash[:length]
+            for c_hash, _ in self.cmap.mapping_items()
+            for length in (7, 10, 40)
+        ]
+        self.assertEqual(
+            self.cmap.short_time_ids(short_hashes).tolist(), [
+                self.cmap.short_time_id(short_hash)
+                for short_hash in short_hashes
+            ]
+        )
+
+    def test_ambiguous_short_time_ids(self):
+        """Check if ambiguous short hashes are reported in batch mode."""
+        with self.assertLogs("varats.mapping.commit_map", level="WARNING"):
+            self.assertEqual(
+                self.cmap.short_time_ids(["8e5f2b", "8e5f2b"]).tolist(), [3, 3]
+            )
+
+    def test_c_hash(self):
+        """Check if time ids are mapped back to their hashes."""
+        self.assertEqual(
+            self.cmap.c_hash(4), "a1b2c3d4e5f60718293a4b5c6d7e8f9012345678"
+        )
+        self.assertRaises(KeyError, self.cmap.c_hash, 2)
+        self.assertRaises(KeyError, self.cmap.c_hash, 5)
+        self.assertRaises(KeyError, self.cmap.c_hash, -1)
+
+    def test_write_to_file(self):
+        """Check if a written commit map can be loaded again."""
+        buffer = io.StringIO()
+        self.cmap.write_to_file(buffer)
+        self.assertEqual(buffer.getvalue(), "".join(CMAP_LINES))
+
+        reloaded_cmap = CommitMap(buffer.getvalue().splitlines())
+        self.assertEqual(
+            dict(reloaded_cmap.mapping_items()),
+            dict(self.cmap.mapping_items())
+        )
+
+
+class TestGenerateCommitMap(unittest.TestCase):
+    """Test generating commit maps from a git repository."""
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.repo = pygit2.init_repository(self.tmp_dir.name)
+        self.commits = []
+        self.signature_time = 1600000000
+
+        # main: c0 - c1 - c2 ----- c4
+        #                   \     /
+        # feature:           c3 -
+        self.commits.append(self.__commit("refs/heads/main", []))
+        self.commits.append(self.__commit("refs/heads/main", [0]))
+        self.commits.append(self.__commit("refs/heads/main", [1]))
+        self.commits.append(self.__commit("refs/heads/feature", [1]))
+        self.commits.append(self.__commit("refs/heads/main", [2, 3]))
+        self.repo.set_head("refs/heads/feature")
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def __commit(self, ref: str, parents: tp.List[int]) -> str:
+        self.signature_time += 60
+        signature = pygit2.Signature(
+            "Test", "test@example.com", self.signature_time
+        )
+        tree = self.repo.TreeBuilder().write()
+        commit_id = self.repo.create_commit(
+            None, signature, signature, f"commit {len(self.commits)}", tree,
+            [self.repo.get(self.commits[idx]).id for idx in parents]
+        )
+        self.repo.references.create(ref, commit_id, force=True)
+        return str(commit_id)
+
+    def test_full_history(self):
+        """Check if commits are numbered with parents before children."""
+        cmap = generate_commit_map(
+            Path(self.tmp_dir.name), refspec="refs/heads/main"
+        )
+        self.assertEqual(
+            dict(cmap.mapping_items()),
+            {c_hash: idx for idx, c_hash in enumerate(self.commits)}
+        )
+        # the checked out branch was not changed
+        self.assertEqual(self.repo.head.name, "refs/heads/feature")
+
+    def test_commit_range(self):
+        """Check if only commits in the requested range are included."""
+        cmap = generate_commit_map(
+            Path(self.tmp_dir.name),
+            end=self.commits[3],
+            start=self.commits[0],
+            refspec="refs/heads/main"
+        )
+        self.assertEqual(
+            dict(cmap.mapping_items()), {
+                self.commits[1]: 1,
+                self.commits[3]: 3
+            }
+        )
+
+    def test_head_refers_to_refspec(self):
+        """Check if HEAD is resolved relative to the refspec."""
+        cmap = generate_commit_map(
+            Path(self.tmp_dir.name), end="HEAD~1", refspec="refs/heads/main"
+        )
+        self.assertEqual(
+            dict(cmap.mapping_items()),
+            {c_hash: idx for idx, c_hash in enumerate(self.commits[:3])}
+        )
+
+    def test_store_commit_map_stream(self):
+        """Check if a streamed commit map file equals the generated map."""
+        output_path = Path(self.tmp_dir.name) / "cmaps" / "test.cmap"
+        store_commit_map_stream(
+            str(output_path),
+            Path(self.tmp_dir.name),
+            end=self.commits[3],
+            refspec="refs/heads/main"
+        )
+
+        self.assertEqual(
+            dict(load_commit_map_from_path(output_path).mapping_items()),
+            dict(
+                generate_commit_map(
+                    Path(self.tmp_dir.name),
+                    end=self.commits[3],
+                    refspec="refs/heads/main"
+                ).mapping_items()
+            )
+        )
+        self.assertEqual(list(output_path.parent.iterdir()), [output_path])
+
+    @replace_config()
+    def test_cached_commit_map(self, config):
+        """Check if cached commit maps are reused and extended with new
+        commits."""
+        repo_path = Path(self.tmp_dir.name)
+        cmap = generate_cached_commit_map(
+            "test", repo_path, refspec="refs/heads/main"
+        )
+        self.assertTrue(
+            get_commit_map_cache_path("test",
+                                      refspec="refs/heads/main").exists()
+        )
+        self.assertEqual(
+            dict(cmap.mapping_items()),
+            {c_hash: idx for idx, c_hash in enumerate(self.commits)}
+        )
+
+        with mock.patch.object(
+            commit_map_module,
+            "_walk_commit_map",
+            wraps=commit_map_module._walk_commit_map
+        ) as walk_mock:
+            cached_cmap = generate_cached_commit_map(
+                "test", repo_path, refspec="refs/heads/main"
+            )
+            walk_mock.assert_not_called()
+            self.assertEqual(
+                dict(cached_cmap.mapping_items()), dict(cmap.mapping_items())
+            )
+
+            self.commits.append(self.__commit("refs/heads/main", [4]))
+            updated_cmap = generate_cached_commit_map(
+                "test", repo_path, refspec="refs/heads/main"
+            )
+            self.assertEqual(walk_mock.call_count, 1)
+            self.assertEqual(
+                walk_mock.call_args[0][4],
+                self.repo.get(self.commits[4]).id
+            )
+
+        self.assertEqual(
+            dict(updated_cmap.mapping_items()),
+            {c_hash: idx for idx, c_hash in enumerate(self.commits)}
+        )
+
+    @replace_config()
+    def test_cached_commit_map_merged_old_branch(self, config):
+        """Check if a cached commit map equals a fresh one after a branch with
+        older commits was merged."""
+        repo_path = Path(self.tmp_dir.name)
+        generate_cached_commit_map("test", repo_path, refspec="refs/heads/main")
+
+        # main: c0 - c1 - c2 ----- c4 ----- c7
+        #         \         \     /        /
+        # feature: \         c3 -         /
+        # old:      c5 - c6 -------------
+        newest_time = self.signature_time
+        self.signature_time = 1600000000
+        self.commits.append(self.__commit("refs/heads/old", [0]))
+        self.commits.append(self.__commit("refs/heads/old", [5]))
+        self.signature_time = newest_time
+        self.commits.append(self.__commit("refs/heads/main", [4, 6]))
+
+        self.assertEqual(
+            dict(
+                generate_cached_commit_map(
+                    "test", repo_path, refspec="refs/heads/main"
+                ).mapping_items()
+            ),
+            dict(
+                generate_commit_map(repo_path,
+                                    refspec="refs/heads/main").mapping_items()
+            )
+        )
+
+    @replace_config()
+    def test_cached_commit_map_stale_head(self, config):
+        """Check if a cached commit map whose head is no longer part of the
+        repository is replaced by a fresh one."""
+        repo_path = Path(self.tmp_dir.name)
+        generate_cached_commit_map("test", repo_path, refspec="refs/heads/main")
+
+        cache_path = get_commit_map_cache_path(
+            "test", refspec="refs/heads/main"
+        )
+        with np.load(cache_path) as npz_file:
+            arrays = {key: npz_file[key] for key in npz_file.files}
+        arrays["head"] = np.frombuffer(bytes.fromhex("ab" * 20), dtype=np.uint8)
+        arrays["end"] = arrays["head"]
+        np.savez(cache_path, **arrays)
+
+        self.commits.append(self.__commit("refs/heads/main", [4]))
+        self.assertEqual(
+            dict(
+                generate_cached_commit_map(
+                    "test", repo_path, refspec="refs/heads/main"
+                ).mapping_items()
+            ), {c_hash: idx for idx, c_hash in enumerate(self.commits)}
+        )
+        with np.load(cache_path) as npz_file:
+            self.assertEqual(
+                npz_file["head"].tobytes(),
+                self.repo.get(self.commits[-1]).id.raw
+            )
+
+    @replace_config()
+    def test_cached_commit_map_range(self, config):
+        """Check if cached commit maps respect the requested range."""
+        repo_path = Path(self.tmp_dir.name)
+        for _ in range(2):
+            cmap = generate_cached_commit_map(
+                "test",
+                repo_path,
+                end=self.commits[3],
+                start=self.commits[0],
+                refspec="refs/heads/main"
+            )
+            self.assertEqual(
+                dict(cmap.mapping_items()), {
+                    self.commits[1]: 1,
+                    self.commits[3]: 3
+                }
+            )
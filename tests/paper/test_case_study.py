@@ -138,6 +138,48 @@ class TestCaseStudy(unittest.TestCase):
         )
         self.assertFalse(self.case_study.has_revision("42"))
 
+    def test_has_revisions_bulk(self):
+        """Check if multiple revisions can be looked up at once."""
+        self.assertEqual(
+            self.case_study.has_revisions([
+                "b8b25e7f15", "42", "a3",
+                "7620b817357d6f14356afd004ace2da426cf8c36"
+            ]), [True, False, True, True]
+        )
+        self.assertEqual(
+            self.case_study.has_revisions_in_stage(["b8b25e7f15", "42"], 0),
+            [True, False]
+        )
+        self.assertEqual(
+            self.case_study.has_revisions_in_stage(["b8b25e7f15"], 42), [False]
+        )
+
+    def test_add_revision_updates_index(self):
+        """Check if added revisions can be found by prefix."""
+        stage = CS.CSStage(revisions=[CS.CSEntry("c0ffee", 2)])
+        self.assertFalse(stage.has_revision("ab"))
+
+        stage.add_revision("abc123", 1, [3])
+        stage.add_revision("ab0000", 0)
+        self.assertTrue(stage.has_revision("ab"))
+        self.assertTrue(stage.has_revision("abc"))
+        self.assertFalse(stage.has_revision("abd"))
+        self.assertEqual(
+            stage.has_revisions(["c0", "ab0", "f"]), [True, True, False]
+        )
+        self.assertEqual(
+            sorted(stage.get_config_ids_for_revision("ab")), [-1, 3]
+        )
+
+        case_study = CS.CaseStudy("gzip", 1)
+        case_study.include_revisions([("deadbeef", 4), ("beef", 5)], 1)
+        self.assertEqual(
+            case_study.has_revisions(["dead", "be", "ee"]), [True, True, False]
+        )
+        self.assertEqual(
+            case_study.has_revisions_in_stage(["dead"], 0), [False]
+        )
+
     def test_gen_filter(self):
         """Check if the project generates a revision filter."""
         revision_filter = self.case_study.get_revision_filter()
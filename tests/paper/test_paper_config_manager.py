@@ -16,6 +16,10 @@ from tests.paper.test_case_study import mocked_create_lazy_commit_map_loader
 from tests.test_utils import DummyGit
 from varats.data.reports.commit_report import CommitReport
 from varats.paper.case_study import load_case_study_from_file
+from varats.paper_mgmt.case_study import (
+    RevisionStatusCache,
+    get_revisions_status_df_for_case_study,
+)
 from varats.projects.c_projects.gzip import Gzip
 from varats.report.report import FileStatusExtension
 
@@ -427,3 +431,69 @@ Total:         (  1/14) processed [1/1/1/10/1]"""
         )
 
         mock_get_tagged_revisions.assert_called()
+
+    @mock.patch(
+        'varats.paper_mgmt.paper_config_manager.create_lazy_commit_map_loader',
+        side_effect=mocked_create_lazy_commit_map_loader
+    )
+    @mock.patch('varats.paper_mgmt.case_study.get_tagged_revisions')
+    def test_status_with_shared_cache(
+        self, mock_get_tagged_revisions, mock_cmap_loader
+    ):
+        # pylint: disable=unused-argument
+        """Check if a shared status cache looks up the tagged revisions of a
+        project only once."""
+        mock_get_tagged_revisions.return_value = [
+            ('b8b25e7f15', FileStatusExtension.Success),
+            ('622e9b1d02', FileStatusExtension.Failed)
+        ]
+
+        status_cache = RevisionStatusCache()
+        short_status = PCM.get_short_status(
+            self.case_study, CommitReport, 5, status_cache=status_cache
+        )
+        status = PCM.get_status(
+            self.case_study,
+            CommitReport,
+            5,
+            True,
+            False,
+            status_cache=status_cache
+        )
+
+        self.assertEqual(
+            short_status, 'CS: gzip_1: (  1/10) processed [1/1/0/8/0]'
+        )
+        self.assertTrue(status.startswith(short_status))
+        self.assertIn("    622e9b1d02 [Failed]\n", status)
+        mock_get_tagged_revisions.assert_called_once()
+
+    @mock.patch('varats.paper_mgmt.case_study.get_tagged_revisions')
+    def test_status_dataframe(self, mock_get_tagged_revisions):
+        """Check if the revision status can be computed as a dataframe."""
+        mock_get_tagged_revisions.return_value = [
+            ('b8b25e7f15', FileStatusExtension.Success),
+            ('1e7e3769dc', FileStatusExtension.CompileError)
+        ]
+
+        status_df = get_revisions_status_df_for_case_study(
+            self.case_study, CommitReport, stage_num=0
+        )
+
+        self.assertEqual(list(status_df.columns), ["revision", "file_status"])
+        self.assertEqual(len(status_df), 10)
+        self.assertEqual(
+            status_df["revision"].tolist()[:3],
+            ['b8b25e7f15', '7620b81735', '622e9b1d02']
+        )
+        self.assertEqual(
+            status_df["file_status"].tolist()[:3], [
+                FileStatusExtension.Success.get_status_extension(),
+                FileStatusExtension.Missing.get_status_extension(),
+                FileStatusExtension.Missing.get_status_extension()
+            ]
+        )
+        self.assertEqual(
+            status_df["file_status"].tolist()[8],
+            FileStatusExtension.CompileError.get_status_extension()
+        )
@@ -1,7 +1,31 @@
 """Test VaRA git utilities."""
+import tempfile
+import typing as tp
 import unittest
+import unittest.mock as mock
+from pathlib import Path
 
-from varats.utils.git_util import ChurnConfig, CommitRepoPair
+import pygit2
+from plumbum import ProcessExecutionError
+
+import varats.utils.git_util as git_util
+from tests.test_utils import replace_config
+from varats.utils.git_util import (
+    COMMIT_AUTHOR_EMAIL,
+    COMMIT_AUTHOR_NAME,
+    COMMIT_PARENTS,
+    COMMIT_TIME,
+    ChurnConfig,
+    CommitChurnStore,
+    CommitMetadataCache,
+    CommitRepoPair,
+    calc_code_churn,
+    calc_code_churn_pairs,
+    calc_code_churn_range,
+    calc_commit_code_churn,
+    get_commit_churn_store,
+    parse_shortstat_log,
+)
 
 
 class TestChurnConfig(unittest.TestCase):
@@ -125,3 +149,291 @@ class TestCommitRepoPair(unittest.TestCase):
 
     def test_to_string(self):
         self.assertEqual(str(self.cr_pair), "foo_repo[42]")
+
+
+class TestShortstatParser(unittest.TestCase):
+    """Test parsing of git log --shortstat output."""
+
+    def test_parse_log(self):
+        """Check if commits with and without summaries are parsed."""
+        log_lines = [
+            "a1\n", "\n", " 3 files changed, 4 insertions(+), 1 deletion(-)\n",
+            "b2\n", "c3\n", "\n", " 1 file changed, 2 deletions(-)\n"
+        ]
+        self.assertEqual(
+            list(parse_shortstat_log(log_lines)), [("a1", (3, 4, 1)),
+                                                   ("b2", (0, 0, 0)),
+                                                   ("c3", (1, 0, 2))]
+        )
+        self.assertEqual(list(parse_shortstat_log([])), [])
+
+    def test_summary_without_commit(self):
+        """Check that a summary without a preceding commit is rejected."""
+        with self.assertRaises(ValueError):
+            list(parse_shortstat_log([" 1 file changed, 1 insertion(+)\n"]))
+
+
+class TestCodeChurn(unittest.TestCase):
+    """Test the in-process code churn calculation."""
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.repo = pygit2.init_repository(self.tmp_dir.name)
+        self.signature_time = 1600000000
+        self.commits: tp.List[pygit2.Commit] = []
+
+        self.__commit({"a.c": "1\n2\n3\n", "README": "x\ny\n"})
+        self.__commit({
+            "a.c": "1\nchanged\n3\n",
+            "b.h": "int b;\nint c;\n",
+            "README": "x\ny\nz\n"
+        })
+        self.__commit({
+            "c.c": "1\nchanged\n3\n",
+            "b.h": "int b;\nint c;\n",
+            "README": "x\ny\nz\n"
+        })
+        self.repo.set_head("refs/heads/main")
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def __commit(self, files: tp.Dict[str, str]) -> None:
+        self.signature_time += 60
+        signature = pygit2.Signature(
+            "Test", "test@example.com", self.signature_time
+        )
+        tree_builder = self.repo.TreeBuilder()
+        for file_name, content in files.items():
+            tree_builder.insert(
+                file_name, self.repo.create_blob(content.encode()),
+                pygit2.GIT_FILEMODE_BLOB
+            )
+        commit_id = self.repo.create_commit(
+            "refs/heads/main", signature, signature, "commit",
+            tree_builder.write(), [self.commits[-1].id] if self.commits else []
+        )
+        self.commits.append(self.repo.get(commit_id))
+
+    def test_calc_code_churn(self):
+        """Check churn between two commits with and without a file filter."""
+        self.assertEqual(
+            calc_code_churn(self.repo, self.commits[0], self.commits[1]),
+            (3, 4, 1)
+        )
+        self.assertEqual(
+            calc_code_churn(
+                self.repo, self.commits[0], self.commits[1],
+                ChurnConfig.create_c_style_languages_config()
+            ), (2, 3, 1)
+        )
+
+    def test_renamed_file(self):
+        """Check that renamed files are counted once like git does."""
+        self.assertEqual(
+            calc_code_churn(self.repo, self.commits[1], self.commits[2]),
+            (1, 0, 0)
+        )
+
+    def test_calc_commit_code_churn(self):
+        """Check churn of single commits, including the root commit."""
+        self.assertEqual(
+            calc_commit_code_churn(self.repo, self.commits[0]), (2, 5, 0)
+        )
+        self.assertEqual(
+            calc_commit_code_churn(
+                self.repo, self.commits[1],
+                ChurnConfig.create_c_language_config()
+            ), (2, 3, 1)
+        )
+
+    def test_calc_code_churn_pairs(self):
+        """Check batched churn calculation for many commit pairs."""
+        churn = calc_code_churn_pairs(
+            self.repo, [(self.commits[0], self.commits[1]),
+                        (str(self.commits[1].id), str(self.commits[2].id)),
+                        (self.commits[1], self.commits[0])],
+            num_workers=2
+        )
+        self.assertEqual(
+            churn["commit_a"].tolist(), [
+                str(self.commits[0].id),
+                str(self.commits[1].id),
+                str(self.commits[1].id)
+            ]
+        )
+        self.assertEqual(churn["changed_files"].tolist(), [3, 1, 3])
+        self.assertEqual(churn["insertions"].tolist(), [4, 0, 1])
+        self.assertEqual(churn["deletions"].tolist(), [1, 0, 4])
+        self.assertTrue(calc_code_churn_pairs(self.repo, []).empty)
+
+    @replace_config()
+    def test_calc_code_churn_range(self, config):
+        """Check if churn of commit ranges is answered from the churn store and
+        only new commits are calculated."""
+        c_config = ChurnConfig.create_c_language_config()
+        expected_churn = {
+            str(self.commits[0].id): (1, 3, 0),
+            str(self.commits[1].id): (2, 3, 1),
+            str(self.commits[2].id): (1, 0, 0)
+        }
+        self.assertEqual(
+            calc_code_churn_range(self.repo, c_config), expected_churn
+        )
+        self.assertTrue(
+            get_commit_churn_store(self.repo.path, c_config).store_path.exists()
+        )
+
+        with mock.patch.object(
+            git_util,
+            "_calc_commits_churn_with_git",
+            wraps=git_util._calc_commits_churn_with_git
+        ) as churn_mock:
+            self.assertEqual(
+                calc_code_churn_range(self.repo, c_config), expected_churn
+            )
+            churn_mock.assert_not_called()
+
+            self.__commit({
+                "c.c": "1\n",
+                "b.h": "int b;\nint c;\n",
+                "README": "x\ny\nz\n"
+            })
+            churn = calc_code_churn_range(self.repo, c_config)
+            self.assertEqual(churn_mock.call_count, 1)
+            self.assertEqual(churn_mock.call_args[0][1], [self.commits[3].id])
+            self.assertEqual(churn[str(self.commits[3].id)], (1, 0, 2))
+
+        self.assertEqual(
+            calc_code_churn_range(
+                self.repo, c_config, self.commits[1], self.commits[2]
+            ), {
+                str(self.commits[1].id): (2, 3, 1),
+                str(self.commits[2].id): (1, 0, 0)
+            }
+        )
+        self.assertEqual(
+            calc_code_churn_range(
+                self.repo, c_config, end_range=str(self.commits[0].id)
+            ), {str(self.commits[0].id): (1, 3, 0)}
+        )
+
+    def test_rename_limit_matches_git(self):
+        """Check that renames in large diffs are detected like with git."""
+        self.__commit({f"file_{idx}.c": f"{idx}\n" * 10 for idx in range(1500)})
+        self.__commit({
+            f"renamed_{idx}.c": f"{idx}\n" * 10 + "x\n" for idx in range(1500)
+        })
+
+        self.assertEqual(
+            calc_commit_code_churn(self.repo, self.commits[-1]),
+            (1500, 1500, 0)
+        )
+        self.assertEqual(
+            git_util._calc_commits_churn_with_git(
+                self.repo.path, [self.commits[-1].id],
+                ChurnConfig.create_default_config()
+            ), {self.commits[-1].id: (1500, 1500, 0)}
+        )
+
+    def test_git_churn_error(self):
+        """Check that errors of git are reported with git's message."""
+        with self.assertRaises(ProcessExecutionError) as context:
+            git_util._calc_commits_churn_with_git(
+                self.repo.path, [pygit2.Oid(hex="1" * 40)],
+                ChurnConfig.create_default_config()
+            )
+        self.assertIn("1" * 40, context.exception.stderr)
+
+    def test_churn_store_skips_partial_records(self):
+        """Check that a partially written record does not corrupt the
+        store."""
+        store_path = Path(self.tmp_dir.name) / "store.churn"
+        CommitChurnStore(store_path).add({self.commits[0].id: (1, 2, 3)})
+        with open(store_path, "ab") as store_file:
+            store_file.write(b"partial")
+
+        store = CommitChurnStore(store_path)
+        self.assertEqual(
+            store.lookup([self.commits[0].id, self.commits[1].id]),
+            {self.commits[0].id: (1, 2, 3)}
+        )
+        store.add({self.commits[1].id: (4, 5, 6)})
+        self.assertEqual(
+            CommitChurnStore(store_path).lookup([
+                self.commits[0].id, self.commits[1].id
+            ]), {
+                self.commits[0].id: (1, 2, 3),
+                self.commits[1].id: (4, 5, 6)
+            }
+        )
+
+
+class TestCommitMetadataCache(unittest.TestCase):
+    """Test the bounded commit metadata cache."""
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.repo = pygit2.init_repository(self.tmp_dir.name)
+        self.commits: tp.List[pygit2.Commit] = []
+        for idx in range(3):
+            signature = pygit2.Signature(
+                f"Author {idx}", f"author{idx}@example.com", 1600000000 + idx
+            )
+            tree_builder = self.repo.TreeBuilder()
+            tree_builder.insert(
+                "file", self.repo.create_blob(str(idx).encode()),
+                pygit2.GIT_FILEMODE_BLOB
+            )
+            commit_id = self.repo.create_commit(
+                "refs/heads/main", signature, signature, "commit",
+                tree_builder.write(),
+                [self.commits[-1].id] if self.commits else []
+            )
+            self.commits.append(self.repo.get(commit_id))
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def test_metadata(self):
+        """Check that only author, time, and parents are kept."""
+        cache = CommitMetadataCache()
+        metadata = cache.get(self.repo, str(self.commits[1].id))
+        self.assertEqual(metadata[COMMIT_AUTHOR_NAME], "Author 1")
+        self.assertEqual(metadata[COMMIT_AUTHOR_EMAIL], "author1@example.com")
+        self.assertEqual(metadata[COMMIT_TIME], 1600000001)
+        self.assertEqual(metadata[COMMIT_PARENTS], (str(self.commits[0].id),))
+        self.assertEqual(cache.get(self.repo, str(self.commits[0].id))[3], ())
+        self.assertRaises(LookupError, cache.get, self.repo, "0" * 40)
+
+    def test_lru_bound(self):
+        """Check that the least recently used commits are evicted."""
+        cache = CommitMetadataCache(max_entries=2)
+        cache.prefetch(
+            self.repo, [str(commit.id) for commit in self.commits] + ["0" * 40]
+        )
+        self.assertEqual(cache.num_entries, 2)
+
+        with mock.patch.object(self.repo, "get", wraps=self.repo.get) as get:
+            cache.get(self.repo, str(self.commits[2].id))
+            self.assertEqual(get.call_count, 0)
+            cache.get(self.repo, str(self.commits[0].id))
+            self.assertEqual(get.call_count, 1)
+
+    @replace_config()
+    def test_persistent_table(self, config):
+        """Check that metadata is reused from the persistent table."""
+        c_hashes = [str(commit.id) for commit in self.commits]
+        CommitMetadataCache(use_table=True).prefetch(self.repo, c_hashes)
+        self.assertTrue(
+            CommitMetadataCache.get_table_path(self.repo.path).exists()
+        )
+
+        cache = CommitMetadataCache(use_table=True)
+        with mock.patch.object(self.repo, "get", wraps=self.repo.get) as get:
+            metadata = cache.get(self.repo, c_hashes[2])
+            self.assertEqual(get.call_count, 0)
+        self.assertEqual(
+            metadata,
+            ("Author 2", "author2@example.com", 1600000002, (c_hashes[1],))
+        )
@@ -1,31 +1,76 @@
 """Commit map module."""
 
+import hashlib
 import logging
+import os
+import tempfile
 import typing as tp
-from collections.abc import ItemsView
+from bisect import bisect_left
 from pathlib import Path
 
-from benchbuild.utils.cmd import git, mkdir
-from plumbum import local
-from pygtrie import CharTrie
+import numpy as np
+import pandas as pd
+import pygit2
+from benchbuild.utils.cmd import mkdir
 
 from varats.project.project_util import (
     get_local_project_git_path,
     get_primary_project_source,
 )
-from varats.utils.git_util import get_current_branch
+from varats.utils.settings import vara_cfg
 
 LOG = logging.getLogger(__name__)
 
+_SHORT_TIME_ID_MEMO_SIZE = 4096
+
+# Bump this version whenever the layout of cached commit maps changes.
+_COMMIT_MAP_CACHE_VERSION = 1
+_OID_SIZE = 20
+
 
 class CommitMap():
-    """Provides a mapping from commit hash to additional information."""
+    """
+    Provides a bidirectional mapping between commit hashes and time ids.
+
+    Hashes are mapped to time ids with a dict, time ids are mapped back to
+    hashes with a dense list indexed by time id, and short hashes are resolved
+    by bisecting a sorted list of all hashes.
+    """
 
     def __init__(self, stream: tp.Iterable[str]) -> None:
-        self.__hash_to_id: CharTrie = CharTrie()
+        hash_to_id: tp.Dict[str, int] = {}
         for line in stream:
             slices = line.strip().split(', ')
-            self.__hash_to_id[slices[1]] = int(slices[0])
+            hash_to_id[slices[1]] = int(slices[0])
+        self.__init_lookup_tables(hash_to_id)
+
+    @staticmethod
+    def from_mapping(hash_to_id: tp.Mapping[str, int]) -> 'CommitMap':
+        """
+        Create a commit map from a mapping of commit hashes to time ids.
+
+        Args:
+            hash_to_id: mapping from commit hash to time id
+
+        Returns:
+            initialized ``CommitMap``
+        """
+        cmap = CommitMap([])
+        cmap.__init_lookup_tables(dict(hash_to_id))
+        return cmap
+
+    def __init_lookup_tables(self, hash_to_id: tp.Dict[str, int]) -> None:
+        self.__hash_to_id = hash_to_id
+        self.__id_to_hash: tp.List[
+            tp.Optional[str]
+        ] = [None] * (max(self.__hash_to_id.values(), default=-1) + 1)
+        for c_hash, time_id in self.__hash_to_id.items():
+            self.__id_to_hash[time_id] = c_hash
+
+        self.__sorted_hashes: tp.List[str] = sorted(self.__hash_to_id)
+        self.__sorted_hash_array: tp.Optional[np.ndarray] = None
+        self.__sorted_id_array: tp.Optional[np.ndarray] = None
+        self.__short_time_id_memo: tp.Dict[str, int] = {}
 
     def time_id(self, c_hash: str) -> int:
         """
@@ -39,7 +84,26 @@ class CommitMap():
         Returns:
             unique time-ordered id
         """
-        return tp.cast(int, self.__hash_to_id[c_hash])
+        return self.__hash_to_id[c_hash]
+
+    def time_ids(self, c_hashes: tp.Iterable[str]) -> np.ndarray:
+        """
+        Convert multiple commit hashes to their time ids.
+
+        Args:
+            c_hashes: commit hashes, e.g., a list or a ``pd.Series``
+
+        Returns:
+            array with the time id of every commit hash
+
+        Test:
+        >>> cmap = CommitMap(["0, a1", "1, b2", "2, c3"])
+        >>> cmap.time_ids(["c3", "a1"]).tolist()
+        [2, 0]
+        """
+        return np.fromiter(
+            map(self.__hash_to_id.__getitem__, c_hashes), dtype=np.int64
+        )
 
     def short_time_id(self, c_hash: str) -> int:
         """
@@ -47,8 +111,8 @@ class CommitMap():
         the commits, based on the c_map, e.g., created from the analyzed git
         history.
 
-        The first time id is returend where the hash belonging to it starts
-        with the short hash.
+        If the short hash is ambiguous, the time id of the lexicographically
+        smallest hash that starts with the short hash is returned.
 
         Args:
             c_hash: commit hash
@@ -56,12 +120,110 @@ class CommitMap():
         Returns:
             unique time-ordered id
         """
-        subtrie = self.__hash_to_id.items(prefix=c_hash)
-        if subtrie:
-            if len(subtrie) > 1:
+        time_id = self.__short_time_id_memo.get(c_hash, None)
+        if time_id is not None:
+            return time_id
+
+        idx = bisect_left(self.__sorted_hashes, c_hash)
+        if idx < len(self.__sorted_hashes) and \
+                self.__sorted_hashes[idx].startswith(c_hash):
+            if idx + 1 < len(self.__sorted_hashes) and \
+                    self.__sorted_hashes[idx + 1].startswith(c_hash):
                 LOG.warning(f"Short commit hash is ambiguous: {c_hash}.")
-            return tp.cast(int, subtrie[0][1])
-        raise KeyError
+            time_id = self.__hash_to_id[self.__sorted_hashes[idx]]
+            if len(self.__short_time_id_memo) >= _SHORT_TIME_ID_MEMO_SIZE:
+                self.__short_time_id_memo.clear()
+            self.__short_time_id_memo[c_hash] = time_id
+            return time_id
+        raise KeyError(c_hash)
+
+    def short_time_ids(
+        self,
+        c_hashes: tp.Iterable[str],
+        default: tp.Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Convert multiple short commit hashes to their time ids.
+
+        Every distinct short hash is only resolved once, so this is cheap for
+        large tables that contain the same revisions in many rows.
+
+        Args:
+            c_hashes: short commit hashes, e.g., a list or a ``pd.Series``
+            default: time id of hashes that are not in the commit map; if not
+                     given, a ``KeyError`` is raised for such hashes
+
+        Returns:
+            array with the time id of every short commit hash
+
+        Test:
+        >>> cmap = CommitMap(["0, a1b2", "1, b2c3", "2, c3d4"])
+        >>> cmap.short_time_ids(["c3", "a1", "c3", "b2c3"]).tolist()
+        [2, 0, 2, 1]
+        >>> cmap.short_time_ids(["c3", "ff"], default=-1).tolist()
+        [2, -1]
+        """
+        if not isinstance(c_hashes, tp.Sized):
+            c_hashes = list(c_hashes)
+        codes, short_hashes = pd.factorize(np.asarray(c_hashes, dtype=object))
+        if (codes < 0).any() and default is None:
+            raise KeyError(None)
+        if len(short_hashes) == 0:
+            return np.full(
+                len(codes),
+                default if default is not None else 0,
+                dtype=np.int64
+            )
+
+        sorted_hashes, sorted_ids = self.__get_sorted_arrays()
+        if len(sorted_hashes) == 0:
+            if default is None:
+                raise KeyError(short_hashes[0])
+            return np.full(len(codes), default, dtype=np.int64)
+        queries = np.char.encode(np.asarray(short_hashes, dtype=str), "utf-8")
+
+        # the first hash that is not smaller than a short hash is the only
+        # candidate that can start with it
+        idxs = np.searchsorted(sorted_hashes, queries, side="left")
+        last_idx = len(sorted_hashes) - 1
+        found = (idxs <= last_idx) & np.char.startswith(
+            sorted_hashes[np.minimum(idxs, last_idx)], queries
+        )
+        if not found.all() and default is None:
+            raise KeyError(short_hashes[np.argmin(found)])
+
+        ambiguous = found & (idxs < last_idx) & np.char.startswith(
+            sorted_hashes[np.minimum(idxs + 1, last_idx)], queries
+        )
+        for short_hash in short_hashes[ambiguous]:
+            LOG.warning(f"Short commit hash is ambiguous: {short_hash}.")
+
+        time_ids = np.where(
+            found, sorted_ids[np.minimum(idxs, last_idx)],
+            default if default is not None else 0
+        )
+        # hashes that could not be factorized, e.g., missing values
+        return tp.cast(
+            np.ndarray,
+            np.where(
+                codes >= 0, time_ids[codes],
+                default if default is not None else 0
+            )
+        )
+
+    def __get_sorted_arrays(self) -> tp.Tuple[np.ndarray, np.ndarray]:
+        """Lazily create the sorted hash and time id arrays used for batch
+        lookups."""
+        if self.__sorted_hash_array is None or self.__sorted_id_array is None:
+            self.__sorted_hash_array = np.asarray(
+                self.__sorted_hashes, dtype=str
+            ).astype(np.bytes_)
+            self.__sorted_id_array = np.fromiter(
+                map(self.__hash_to_id.__getitem__, self.__sorted_hashes),
+                dtype=np.int64,
+                count=len(self.__sorted_hashes)
+            )
+        return self.__sorted_hash_array, self.__sorted_id_array
 
     def c_hash(self, time_id: int) -> str:
         """
@@ -73,14 +235,15 @@ class CommitMap():
         Returns:
             commit hash
         """
-        for c_hash, t_id in self.__hash_to_id.items():
-            if t_id == time_id:
-                return tp.cast(str, c_hash)
-        raise KeyError
+        if 0 <= time_id < len(self.__id_to_hash):
+            c_hash = self.__id_to_hash[time_id]
+            if c_hash is not None:
+                return c_hash
+        raise KeyError(time_id)
 
     def mapping_items(self) -> tp.ItemsView[str, int]:
         """Get an iterator over the mapping items."""
-        return ItemsView(self.__hash_to_id)
+        return self.__hash_to_id.items()
 
     def write_to_file(self, target_file: tp.TextIO) -> None:
         """
@@ -89,13 +252,101 @@ class CommitMap():
         Args:
             target_file: needs to be a writable stream, i.e., support .write()
         """
-        for item in self.__hash_to_id.items():
-            target_file.write("{}, {}\n".format(item[1], item[0]))
+        target_file.writelines(
+            "{}, {}\n".format(time_id, c_hash)
+            for c_hash, time_id in self.__hash_to_id.items()
+        )
 
     def __str__(self) -> str:
         return str(self.__hash_to_id)
 
 
+def _resolve_commit(
+    repo: pygit2.Repository, rev: str, refspec: str
+) -> pygit2.Commit:
+    """Resolve a revision to a commit, where ``HEAD`` refers to the checked out
+    ``refspec``."""
+    if rev.startswith("HEAD"):
+        rev = refspec + rev[len("HEAD"):]
+    return repo.revparse_single(rev).peel(pygit2.Commit)
+
+
+def _walk_commit_map(
+    repo: pygit2.Repository,
+    head_id: pygit2.Oid,
+    end_id: pygit2.Oid,
+    start_id: tp.Optional[pygit2.Oid],
+    known_head_id: tp.Optional[pygit2.Oid] = None,
+    first_time_id: int = 0
+) -> tp.Generator[tp.Tuple[int, pygit2.Oid, bool], None, None]:
+    """
+    Walk the history of ``head_id``, parents before children and otherwise by
+    commit time.
+
+    Args:
+        repo: the repository
+        head_id: commit whose history is numbered
+        end_id: last commit that should be included
+        start_id: parent of the first commit that should be included
+        known_head_id: if given, only commits that are not reachable from this
+                       commit are walked
+        first_time_id: time id of the first walked commit
+
+    Returns: generator of tuples (time id, commit id, is in range)
+    """
+    wanted_commits: tp.Optional[tp.Set[pygit2.Oid]] = None
+    if start_id is not None or end_id != head_id:
+        range_walker = repo.walk(end_id, pygit2.GIT_SORT_NONE)
+        for hidden_id in (start_id, known_head_id):
+            if hidden_id is not None:
+                range_walker.hide(hidden_id)
+        wanted_commits = {commit.id for commit in range_walker}
+
+    walker = repo.walk(
+        head_id, pygit2.GIT_SORT_TOPOLOGICAL | pygit2.GIT_SORT_TIME |
+        pygit2.GIT_SORT_REVERSE
+    )
+    if known_head_id is not None:
+        walker.hide(known_head_id)
+    for time_id, commit in enumerate(walker, first_time_id):
+        yield time_id, commit.id, \
+            wanted_commits is None or commit.id in wanted_commits
+
+
+def generate_commit_map_stream(
+    path: Path,
+    end: str = "HEAD",
+    start: tp.Optional[str] = None,
+    refspec: str = "HEAD"
+) -> tp.Generator[str, None, None]:
+    """
+    Generate the lines of a commit map for a repository.
+
+    The history of ``refspec`` is walked with pygit2, parents before children
+    and otherwise by commit time, so neither the working tree of the
+    repository is touched nor the full history is kept in memory.
+
+    Range of commits that get included in the map: `]start..end]`
+
+    Args:
+        path: to the repository
+        end: last commit that should be included
+        start: parent of the first commit that should be included
+        refspec: that is used to number the commits
+
+    Returns: generator of commit map lines, i.e., ``"{time_id}, {hash}\\n"``
+    """
+    repo = pygit2.Repository(pygit2.discover_repository(str(path)))
+    for time_id, commit_id, in_range in _walk_commit_map(
+        repo,
+        _resolve_commit(repo, "HEAD", refspec).id,
+        _resolve_commit(repo, end, refspec).id,
+        _resolve_commit(repo, start, refspec).id if start else None
+    ):
+        if in_range:
+            yield "{}, {}\n".format(time_id, commit_id)
+
+
 def generate_commit_map(
     path: Path,
     end: str = "HEAD",
@@ -111,35 +362,189 @@ def generate_commit_map(
         path: to the repository
         end: last commit that should be included
         start: parent of the first commit that should be included
-        refspec: that should be checked out
+        refspec: that is used to number the commits
 
     Returns: initalized ``CommitMap``
     """
-    search_range = ""
-    if start is not None:
-        search_range += start + ".."
-    search_range += end
-
-    with local.cwd(path):
-        old_head = get_current_branch()
-        git("checkout", refspec)
-        full_out = git("--no-pager", "log", "--pretty=format:'%H'")
-        wanted_out = git(
-            "--no-pager", "log", "--pretty=format:'%H'", search_range
-        )
+    return CommitMap(generate_commit_map_stream(path, end, start, refspec))
+
+
+def get_commit_map_cache_path(
+    project_name: str,
+    end: str = "HEAD",
+    start: tp.Optional[str] = None,
+    refspec: str = "HEAD"
+) -> Path:
+    """
+    Compute the path of the cached commit map of a project.
+
+    Args:
+        project_name: name of the project
+        end: last commit that is included in the map
+        start: commit before the first commit that is included in the map
+        refspec: that is used to number the commits
+
+    Returns:
+        path to the cache file in the data cache
+    """
+    range_key = hashlib.sha256(
+        "\0".join([refspec, start or "", end]).encode("utf-8")
+    ).hexdigest()[:16]
+    return Path(
+        str(vara_cfg()["data_cache"])
+    ) / "commit_maps" / f"{project_name}-{range_key}.npz"
+
+
+def _load_commit_map_cache(
+    cache_path: Path
+) -> tp.Optional[tp.Dict[str, np.ndarray]]:
+    if not cache_path.exists():
+        return None
+    try:
+        with np.load(cache_path, allow_pickle=False) as npz_file:
+            arrays = {key: npz_file[key] for key in npz_file.files}
+        if int(arrays["format_version"]) != _COMMIT_MAP_CACHE_VERSION:
+            return None
+        return arrays
+    except (OSError, ValueError, KeyError) as err:
+        LOG.debug(f"Ignoring invalid commit map cache {cache_path}: {err}")
+        return None
+
+
+def _store_commit_map_cache(
+    cache_path: Path, arrays: tp.Dict[str, np.ndarray]
+) -> None:
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=cache_path.parent, suffix=".tmp", delete=False
+        ) as tmp_file:
+            np.savez(tmp_file, **arrays)
+        os.replace(tmp_file.name, cache_path)
+    except OSError as err:
+        LOG.warning(f"Could not store commit map cache {cache_path}: {err}")
+
+
+def _oid_to_array(oid: tp.Optional[pygit2.Oid]) -> np.ndarray:
+    return np.frombuffer(
+        oid.raw if oid is not None else bytes(_OID_SIZE), dtype=np.uint8
+    )
+
+
+def _oids_to_hashes(oids: np.ndarray) -> tp.List[str]:
+    hex_hashes = oids.tobytes().hex()
+    hash_len = 2 * _OID_SIZE
+    return [
+        hex_hashes[idx:idx + hash_len]
+        for idx in range(0, len(hex_hashes), hash_len)
+    ]
+
+
+def _is_linear_extension(
+    repo: pygit2.Repository, head_id: pygit2.Oid, known_head_id: pygit2.Oid
+) -> bool:
+    """
+    Check if ``head_id`` only adds a chain of non-merge commits on top of
+    ``known_head_id``.
+
+    Only then, walking the full history of ``head_id`` numbers the history of
+    ``known_head_id`` like before and the new commits after it. Merges can
+    bring in commits that are sorted before already known commits.
+    """
+    # the known head may be gone, e.g., after a re-clone or rewritten history
+    if known_head_id not in repo or \
+            not repo.descendant_of(head_id, known_head_id):
+        return False
+    walker = repo.walk(head_id, pygit2.GIT_SORT_NONE)
+    walker.hide(known_head_id)
+    return all(len(commit.parent_ids) == 1 for commit in walker)
 
-        def format_stream() -> tp.Generator[str, None, None]:
-            wanted_cm = set()
-            for line in wanted_out.split('\n'):
-                wanted_cm.add(line[1:-1])
 
-            for number, line in enumerate(reversed(full_out.split('\n'))):
-                line = line[1:-1]
-                if line in wanted_cm:
-                    yield "{}, {}\n".format(number, line)
+def generate_cached_commit_map(
+    project_name: str,
+    path: Path,
+    end: str = "HEAD",
+    start: tp.Optional[str] = None,
+    refspec: str = "HEAD"
+) -> CommitMap:
+    """
+    Get a commit map from the commit map cache in the data cache.
+
+    The cache is only used as long as the resolved ``refspec``, ``start``, and
+    ``end`` commits did not change. If ``end`` is ``HEAD`` and the repository
+    only gained a chain of new non-merge commits on top of the cached
+    ``HEAD``, only the new commits are walked and appended to the cached map.
+    Otherwise, e.g., after a merge, the full history is walked again, so the
+    map always equals the one of :func:`generate_commit_map`.
+
+    Range of commits that get included in the map: `]start..end]`
+
+    Args:
+        project_name: name of the project
+        path: to the repository
+        end: last commit that should be included
+        start: parent of the first commit that should be included
+        refspec: that is used to number the commits
 
-        git("checkout", old_head)
-        return CommitMap(format_stream())
+    Returns: initalized ``CommitMap``
+    """
+    repo = pygit2.Repository(pygit2.discover_repository(str(path)))
+    head_id = _resolve_commit(repo, "HEAD", refspec).id
+    end_id = _resolve_commit(repo, end, refspec).id
+    start_id = _resolve_commit(repo, start, refspec).id if start else None
+
+    cache_path = get_commit_map_cache_path(project_name, end, start, refspec)
+    cached = _load_commit_map_cache(cache_path)
+
+    oids: tp.List[bytes] = []
+    time_ids: tp.List[int] = []
+    known_head_id: tp.Optional[pygit2.Oid] = None
+    num_commits = 0
+    if cached is not None and \
+            cached["start"].tobytes() == _oid_to_array(start_id).tobytes():
+        cached_head_id = pygit2.Oid(raw=cached["head"].tobytes())
+        cached_end_id = pygit2.Oid(raw=cached["end"].tobytes())
+        if cached_head_id == head_id and cached_end_id == end_id:
+            return CommitMap.from_mapping(
+                dict(
+                    zip(
+                        _oids_to_hashes(cached["oids"]),
+                        cached["time_ids"].tolist()
+                    )
+                )
+            )
+        if cached_end_id == cached_head_id and end_id == head_id and \
+                _is_linear_extension(repo, head_id, cached_head_id):
+            LOG.debug(f"Appending new commits to cached commit map {path}")
+            oids.append(cached["oids"].tobytes())
+            time_ids.extend(cached["time_ids"].tolist())
+            known_head_id = cached_head_id
+            num_commits = int(cached["num_commits"])
+
+    for time_id, commit_id, in_range in _walk_commit_map(
+        repo, head_id, end_id, start_id, known_head_id, num_commits
+    ):
+        num_commits = time_id + 1
+        if in_range:
+            oids.append(commit_id.raw)
+            time_ids.append(time_id)
+
+    oid_array = np.frombuffer(b"".join(oids),
+                              dtype=np.uint8).reshape(-1, _OID_SIZE)
+    _store_commit_map_cache(
+        cache_path, {
+            "format_version": np.array(_COMMIT_MAP_CACHE_VERSION),
+            "head": _oid_to_array(head_id),
+            "end": _oid_to_array(end_id),
+            "start": _oid_to_array(start_id),
+            "num_commits": np.array(num_commits),
+            "oids": oid_array,
+            "time_ids": np.array(time_ids, dtype=np.int64)
+        }
+    )
+    return CommitMap.from_mapping(
+        dict(zip(_oids_to_hashes(oid_array), time_ids))
+    )
 
 
 def store_commit_map(cmap: CommitMap, output_file_path: str) -> None:
@@ -150,12 +555,65 @@ def store_commit_map(cmap: CommitMap, output_file_path: str) -> None:
         cmap.write_to_file(c_map_file)
 
 
+def store_commit_map_stream(
+    output_file_path: str,
+    path: Path,
+    end: str = "HEAD",
+    start: tp.Optional[str] = None,
+    refspec: str = "HEAD"
+) -> None:
+    """
+    Walk the history of a repository and write the commit map lines directly
+    to a file, without creating a ``CommitMap`` in memory.
+
+    Range of commits that get included in the map: `]start..end]`
+
+    Args:
+        output_file_path: path to the commit map file
+        path: to the repository
+        end: last commit that should be included
+        start: parent of the first commit that should be included
+        refspec: that is used to number the commits
+    """
+    output_dir = Path(output_file_path).parent
+    mkdir("-p", output_dir)
+
+    # write to a temporary file first so that an interrupted walk does not
+    # leave a truncated commit map behind
+    with tempfile.NamedTemporaryFile(
+        mode="w", dir=output_dir, suffix=".tmp", delete=False
+    ) as tmp_file:
+        try:
+            tmp_file.writelines(
+                generate_commit_map_stream(path, end, start, refspec)
+            )
+        except BaseException:
+            tmp_file.close()
+            os.unlink(tmp_file.name)
+            raise
+    os.replace(tmp_file.name, output_file_path)
+
+
 def load_commit_map_from_path(cmap_path: Path) -> CommitMap:
     """Load a commit map from a given `.cmap` file path."""
     with open(cmap_path, "r") as c_map_file:
         return CommitMap(c_map_file.readlines())
 
 
+def get_project_refspec(project_name: str) -> str:
+    """
+    Get the refspec that is used to number the commits of a project.
+
+    Args:
+        project_name: name of the project
+
+    Returns:
+        the refspec of the project's primary source, or ``HEAD`` if it has none
+    """
+    primary_source = get_primary_project_source(project_name)
+    return str(getattr(primary_source, "refspec", "HEAD"))
+
+
 def get_commit_map(
     project_name: str,
     cmap_path: tp.Optional[Path] = None,
@@ -177,11 +635,12 @@ def get_commit_map(
     """
     if cmap_path is None:
         project_git_path = get_local_project_git_path(project_name)
-        primary_source = get_primary_project_source(project_name)
-        refspec = "HEAD"
-        if hasattr(primary_source, "refspec"):
-            refspec = primary_source.refspec
+        refspec = get_project_refspec(project_name)
 
+        if vara_cfg()["caching"]["commit_map_cache"].value:
+            return generate_cached_commit_map(
+                project_name, project_git_path, end, start, refspec
+            )
         return generate_commit_map(project_git_path, end, start, refspec)
 
     return load_commit_map_from_path(cmap_path)
@@ -2,6 +2,7 @@
 analysed for a project."""
 
 import typing as tp
+from bisect import bisect_left, bisect_right
 from pathlib import Path
 
 from varats.base.configuration import Configuration
@@ -97,6 +98,15 @@ class CSStage():
         self.__revisions: tp.List[CSEntry
                                  ] = revisions if revisions is not None else []
 
+        # Prefix index of the revisions, i.e., all entries sorted by their
+        # commit hash, so that all entries with a common prefix are adjacent.
+        self.__sorted_entries = sorted(
+            self.__revisions, key=lambda entry: entry.commit_hash
+        )
+        self.__sorted_hashes = [
+            entry.commit_hash for entry in self.__sorted_entries
+        ]
+
     @property
     def revisions(self) -> tp.List[str]:
         """Project revisions that are part of this case study."""
@@ -143,11 +153,31 @@ class CSStage():
             ``True``, in case the revision is part of the case study,
             ``False`` otherwise.
         """
-        for cs_revision in self.__revisions:
-            if cs_revision.commit_hash.startswith(revision):
-                return True
+        idx = bisect_left(self.__sorted_hashes, revision)
+        return idx < len(self.__sorted_hashes) and \
+            self.__sorted_hashes[idx].startswith(revision)
 
-        return False
+    def has_revisions(self, revisions: tp.Iterable[str]) -> tp.List[bool]:
+        """
+        Check for multiple revisions if they are part of this case study.
+
+        Args:
+            revisions: project revisions to check
+
+        Returns:
+            a list that contains for every revision whether it is part of the
+            case study
+        """
+        return [self.has_revision(revision) for revision in revisions]
+
+    def __entries_with_prefix(self, revision: str) -> tp.Iterator[CSEntry]:
+        """Iterate over all entries whose commit hash starts with
+        ``revision``."""
+        idx = bisect_left(self.__sorted_hashes, revision)
+        while idx < len(self.__sorted_hashes) and \
+                self.__sorted_hashes[idx].startswith(revision):
+            yield self.__sorted_entries[idx]
+            idx += 1
 
     def add_revision(
         self,
@@ -164,7 +194,11 @@ class CSStage():
             config_ids: list of configuration IDs
         """
         if not self.has_revision(revision):
-            self.__revisions.append(CSEntry(revision, commit_id, config_ids))
+            entry = CSEntry(revision, commit_id, config_ids)
+            self.__revisions.append(entry)
+            idx = bisect_right(self.__sorted_hashes, revision)
+            self.__sorted_hashes.insert(idx, revision)
+            self.__sorted_entries.insert(idx, entry)
 
     def get_config_ids_for_revision(self, revision: str) -> tp.List[int]:
         """
@@ -176,8 +210,7 @@ class CSStage():
         Returns: list of config IDs
         """
         return list({
-            config_id for entry in self.__revisions
-            if entry.commit_hash.startswith(revision)
+            config_id for entry in self.__entries_with_prefix(revision)
             for config_id in entry.config_ids
         })
 
@@ -308,6 +341,27 @@ class CaseStudy():
 
         return False
 
+    def has_revisions(self, revisions: tp.Iterable[str]) -> tp.List[bool]:
+        """
+        Check for multiple revisions if they are part of this case study.
+
+        Args:
+            revisions: project revisions to check
+
+        Returns:
+            a list that contains for every revision whether it was found in
+            one of the stages
+        """
+        revision_list = list(revisions)
+        found = [False] * len(revision_list)
+        for stage in self.__stages:
+            found = [
+                in_case_study or in_stage for in_case_study, in_stage in
+                zip(found, stage.has_revisions(revision_list))
+            ]
+
+        return found
+
     def has_revision_in_stage(self, revision: str, num_stage: int) -> bool:
         """
         Checks if a revision is in a specific stage.
@@ -320,6 +374,20 @@ class CaseStudy():
             return False
         return self.__stages[num_stage].has_revision(revision)
 
+    def has_revisions_in_stage(
+        self, revisions: tp.Iterable[str], num_stage: int
+    ) -> tp.List[bool]:
+        """
+        Checks for multiple revisions if they are in a specific stage.
+
+        Returns:
+            a list that contains for every revision whether it was found in the
+            specified stage
+        """
+        if self.num_stages <= num_stage:
+            return [False for _ in revisions]
+        return self.__stages[num_stage].has_revisions(revisions)
+
     def get_config_ids_for_revision(self, revision: str) -> tp.List[int]:
         """
         Returns a list of all configuration IDs specified for this revision.
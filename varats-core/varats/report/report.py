@@ -1,7 +1,7 @@
 """The Report module implements basic report functionalities and provides a
 minimal interface ``BaseReport`` to implement own reports."""
 
-import re
+import functools
 import typing as tp
 from abc import abstractmethod
 from enum import Enum
@@ -100,31 +100,222 @@ class FileStatusExtension(Enum):
         raise ValueError(f"Unknown file status extension name: {status_name}")
 
 
+class ResultFileName():
+    """
+    Structured representation of a parsed result file name.
+
+    Result file names have the form
+    ``{shorthand}-{project_name}-{binary_name}-{commit_hash}_{UUID}_``
+    ``{status_ext}{file_ext}``; supplementary result files have the form
+    ``{shorthand}-SUPPL-{project_name}-{binary_name}-{commit_hash}_{UUID}_``
+    ``{info_type}{file_ext}``. Names are parsed with anchored splits on these
+    separators and parsed names are cached, so every name is only parsed once.
+    """
+
+    __SUPPLEMENTARY_MARKER = "-SUPPL-"
+    __STATUS_EXTENSIONS = {
+        status.get_status_extension(): status for status in FileStatusExtension
+    }
+    __UUID_CHARS = frozenset("0123456789abcdefABCDEF-")
+
+    def __init__(
+        self,
+        shorthand: str,
+        project_name: str,
+        binary_name: str,
+        commit_hash: str,
+        uuid: str,
+        status: tp.Optional[FileStatusExtension],
+        info_type: tp.Optional[str],
+        file_ext: tp.Optional[str],
+        is_supplementary: bool = False
+    ) -> None:
+        self.__shorthand = shorthand
+        self.__project_name = project_name
+        self.__binary_name = binary_name
+        self.__commit_hash = commit_hash
+        self.__uuid = uuid
+        self.__status = status
+        self.__info_type = info_type
+        self.__file_ext = file_ext
+        self.__is_supplementary = is_supplementary
+
+    @property
+    def shorthand(self) -> str:
+        """Shorthand of the report type."""
+        return self.__shorthand
+
+    @property
+    def project_name(self) -> str:
+        """Name of the analyzed project."""
+        return self.__project_name
+
+    @property
+    def binary_name(self) -> str:
+        """Name of the analyzed binary."""
+        return self.__binary_name
+
+    @property
+    def commit_hash(self) -> str:
+        """Analyzed revision of the project."""
+        return self.__commit_hash
+
+    @property
+    def uuid(self) -> str:
+        """Benchbuild UUID of the experiment run."""
+        return self.__uuid
+
+    @property
+    def status(self) -> tp.Optional[FileStatusExtension]:
+        """File status of a result file, if the name contains one."""
+        return self.__status
+
+    @property
+    def info_type(self) -> tp.Optional[str]:
+        """Info type of a supplementary result file."""
+        return self.__info_type
+
+    @property
+    def file_ext(self) -> tp.Optional[str]:
+        """File extension including the leading ``.``, if present."""
+        return self.__file_ext
+
+    @property
+    def is_supplementary(self) -> bool:
+        """True, if this is the name of a supplementary result file."""
+        return self.__is_supplementary
+
+    @staticmethod
+    def __split_uuid(file_name: str,
+                     tail_end: int) -> tp.Optional[tp.Tuple[str, str]]:
+        """Split ``file_name[:tail_end]`` into the part before the UUID and the
+        UUID."""
+        uuid_start = file_name.rfind("_", 0, tail_end) + 1
+        if uuid_start == 0:
+            return None
+        uuid = file_name[uuid_start:tail_end]
+        if not ResultFileName.__UUID_CHARS.issuperset(uuid):
+            return None
+        return file_name[:uuid_start - 1], uuid
+
+    @staticmethod
+    @functools.lru_cache(maxsize=2**17)
+    def parse(file_name: str) -> tp.Optional['ResultFileName']:
+        """
+        Parse a result file name.
+
+        Args:
+            file_name: name of the file
+
+        Returns:
+            the parsed file name, or ``None`` if the name is not formated like
+            a result file
+
+        Test:
+        >>> name = ResultFileName.parse(
+        ...     "BR-xz-xz-2f0bc9cd40_9e238675-ee7c-4325_success.yaml")
+        >>> name.shorthand, name.project_name, name.commit_hash, name.uuid
+        ('BR', 'xz', '2f0bc9cd40', '9e238675-ee7c-4325')
+        >>> name.status, name.file_ext
+        (<FileStatusExtension.Success: ('success', <ANSIStyle: Green>)>, \
+'.yaml')
+        >>> ResultFileName.parse("BR-xz-2f0bc9cd40_9e23_success.yaml") is None
+        True
+        """
+        # The UUID is followed by '_', an optional status, and an optional file
+        # extension that starts with '.'. Prefer the right-most candidate.
+        tail_end = len(file_name)
+        while True:
+            tail_end = file_name.rfind("_", 0, tail_end)
+            if tail_end < 0:
+                return None
+
+            tail = file_name[tail_end + 1:]
+            status_ext, dot, ext = tail.partition(".")
+            if status_ext and status_ext not in \
+                    ResultFileName.__STATUS_EXTENSIONS:
+                continue
+
+            head_uuid = ResultFileName.__split_uuid(file_name, tail_end)
+            if head_uuid is None:
+                continue
+            head, uuid = head_uuid
+
+            parts = head.rsplit("-", 3)
+            if len(parts) != 4:
+                continue
+
+            return ResultFileName(
+                parts[0], parts[1], parts[2], parts[3], uuid,
+                ResultFileName.__STATUS_EXTENSIONS.get(status_ext, None), None,
+                dot + ext if dot else None
+            )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=2**17)
+    def parse_supplementary(file_name: str) -> tp.Optional['ResultFileName']:
+        """
+        Parse a supplementary result file name.
+
+        Args:
+            file_name: name of the file
+
+        Returns:
+            the parsed file name, or ``None`` if the name is not formated like
+            a supplementary result file
+
+        Test:
+        >>> name = ResultFileName.parse_supplementary(
+        ...     "CR-SUPPL-xz-xz-2f0bc9cd40_9e238675-ee7c_cfg_info.txt")
+        >>> name.shorthand, name.commit_hash, name.info_type, name.file_ext
+        ('CR', '2f0bc9cd40', 'cfg_info', '.txt')
+        """
+        # The UUID is followed by '_', an info type without '.', and an optional
+        # file extension that starts with '.'. Prefer the right-most candidate.
+        tail_end = len(file_name)
+        while True:
+            tail_end = file_name.rfind("_", 0, tail_end)
+            if tail_end < 0:
+                return None
+
+            head_uuid = ResultFileName.__split_uuid(file_name, tail_end)
+            if head_uuid is None:
+                continue
+            head, uuid = head_uuid
+
+            parts = head.rsplit("-", 2)
+            if len(parts) != 3:
+                continue
+            marker_start = parts[0].rfind(ResultFileName.__SUPPLEMENTARY_MARKER)
+            if marker_start < 0:
+                continue
+
+            info_type, dot, ext = file_name[tail_end + 1:].partition(".")
+            return ResultFileName(
+                parts[0][:marker_start],
+                parts[0][marker_start +
+                         len(ResultFileName.__SUPPLEMENTARY_MARKER):],
+                parts[1],
+                parts[2],
+                uuid,
+                None,
+                info_type,
+                dot + ext if dot else None,
+                is_supplementary=True
+            )
+
+
 class MetaReport(type):
     """Meta class for report to manage all reports and implement the basic
     static functionality for handling report-file names."""
 
     REPORT_TYPES: tp.Dict[str, 'MetaReport'] = dict()
 
-    __RESULT_FILE_REGEX = re.compile(
-        r"(?P<project_shorthand>.*)-" +
-        r"(?P<project_name>.*)-(?P<binary_name>.*)-" +
-        r"(?P<file_commit_hash>.*)_(?P<UUID>[0-9a-fA-F\-]*)_" +
-        FileStatusExtension.get_regex_grp() + r"?(?P<file_ext>\..*)?" + "$"
-    )
-
     __RESULT_FILE_TEMPLATE = (
         "{shorthand}-" + "{project_name}-" + "{binary_name}-" +
         "{project_version}_" + "{project_uuid}_" + "{status_ext}" + "{file_ext}"
     )
 
-    __SUPPLEMENTARY_RESULT_FILE_REGEX = re.compile(
-        r"(?P<project_shorthand>.*)-" + r"SUPPL-" +
-        r"(?P<project_name>.*)-(?P<binary_name>.*)-" +
-        r"(?P<file_commit_hash>.*)_(?P<UUID>[0-9a-fA-F\-]*)_" +
-        r"(?P<info_type>[^\.]*)" + r"?(?P<file_ext>\..*)?" + "$"
-    )
-
     __SUPPLEMENTARY_RESULT_FILE_TEMPLATE = (
         "{shorthand}-" + "SUPPL-" + "{project_name}-" + "{binary_name}-" +
         "{project_version}_" + "{project_uuid}_" + "{info_type}" + "{file_ext}"
@@ -181,11 +372,12 @@ class MetaReport(type):
         Returns:
             corresponding report class
         """
-        match = MetaReport.__RESULT_FILE_REGEX.search(file_name)
-        if match:
-            short_hand = match.group("project_shorthand")
+        result_file_name = ResultFileName.parse(file_name)
+        if result_file_name:
             for report_type in MetaReport.REPORT_TYPES.values():
-                if getattr(report_type, "SHORTHAND") == short_hand:
+                if getattr(
+                    report_type, "SHORTHAND"
+                ) == result_file_name.shorthand:
                     return report_type
         return None
 
@@ -279,11 +471,9 @@ class MetaReport(type):
             True, if the file name is for a file with the the specified
             ``extension_type``
         """
-        match = MetaReport.__RESULT_FILE_REGEX.search(file_name)
-        if match:
-            return match.group("status_ext") == (
-                FileStatusExtension.get_status_extension(extension_type)
-            )
+        result_file_name = ResultFileName.parse(file_name)
+        if result_file_name:
+            return result_file_name.status == extension_type
         return False
 
     @staticmethod
@@ -297,8 +487,7 @@ class MetaReport(type):
         Returns:
             True, if the file name is correctly formated
         """
-        match = MetaReport.__RESULT_FILE_REGEX.search(file_name)
-        return match is not None
+        return ResultFileName.parse(file_name) is not None
 
     @staticmethod
     def is_result_file_supplementary(file_name: str) -> bool:
@@ -311,10 +500,7 @@ class MetaReport(type):
         Returns:
             True, if the file name is a supplementary file
         """
-        match = MetaReport.__SUPPLEMENTARY_RESULT_FILE_REGEX.search(file_name)
-        if match:
-            return True
-        return False
+        return ResultFileName.parse_supplementary(file_name) is not None
 
     @staticmethod
     def get_info_type_from_supplementary_result_file(file_name: str) -> str:
@@ -327,9 +513,9 @@ class MetaReport(type):
         Returns:
             the info type of a supplementray results file name
         """
-        match = MetaReport.__SUPPLEMENTARY_RESULT_FILE_REGEX.search(file_name)
-        if match:
-            return match.group("info_type")
+        result_file_name = ResultFileName.parse_supplementary(file_name)
+        if result_file_name:
+            return tp.cast(str, result_file_name.info_type)
 
         raise ValueError(
             'File {file_name} name was wrongly formated.'.format(
@@ -348,9 +534,9 @@ class MetaReport(type):
         Returns:
             the commit hash from a supplementary result file name
         """
-        match = MetaReport.__SUPPLEMENTARY_RESULT_FILE_REGEX.search(file_name)
-        if match:
-            return match.group("file_commit_hash")
+        result_file_name = ResultFileName.parse_supplementary(file_name)
+        if result_file_name:
+            return result_file_name.commit_hash
 
         raise ValueError(
             'File {file_name} name was wrongly formated.'.format(
@@ -369,9 +555,9 @@ class MetaReport(type):
         Returns:
             the commit hash from a result file name
         """
-        match = MetaReport.__RESULT_FILE_REGEX.search(file_name)
-        if match:
-            return match.group("file_commit_hash")
+        result_file_name = ResultFileName.parse(file_name)
+        if result_file_name:
+            return result_file_name.commit_hash
 
         raise ValueError(
             'File {file_name} name was wrongly formated.'.format(
@@ -390,11 +576,13 @@ class MetaReport(type):
         Returns:
             the FileStatusExtension of the result file
         """
-        match = MetaReport.__RESULT_FILE_REGEX.search(file_name)
-        if match:
-            return FileStatusExtension.get_file_status_from_str(
-                match.group("status_ext")
-            )
+        result_file_name = ResultFileName.parse(file_name)
+        if result_file_name:
+            if result_file_name.status is None:
+                raise ValueError(
+                    f"File {file_name} name does not have a status extension."
+                )
+            return result_file_name.status
 
         raise ValueError(
             'File {file_name} name was wrongly formated.'.format(
@@ -493,11 +681,9 @@ class MetaReport(type):
         Returns:
             True, if the file belongs to this report type
         """
-        match = MetaReport.__RESULT_FILE_REGEX.search(file_name)
-        if match:
-            return match.group("project_shorthand") == str(
-                getattr(cls, "SHORTHAND")
-            )
+        result_file_name = ResultFileName.parse(file_name)
+        if result_file_name:
+            return result_file_name.shorthand == str(getattr(cls, "SHORTHAND"))
         return False
 
 
@@ -0,0 +1,343 @@
+"""
+Precomputed sets of blocked revisions.
+
+Projects declare blocked revisions with benchbuild's ``block_revisions``
+decorator on their primary source. Checking a revision against these
+declarations resolves revision ranges with git ancestry walks and compares the
+revision to every blocked commit. The :class:`BlockedRevisionIndex` resolves
+the declaration once, stores the blocked commits as a bitmap over the time ids
+of the project's commit map in the data cache, and answers lookups with a
+binary search. Cached indices are reused as long as the ``HEAD`` of the
+repository and the block declaration did not change.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import typing as tp
+import weakref
+from bisect import bisect_left
+from pathlib import Path
+from threading import Lock
+
+import numpy as np
+import pygit2
+from benchbuild.source import FetchableSource
+from benchbuild.utils.revision_ranges import (
+    AbstractRevisionRange,
+    block_revisions,
+)
+
+from varats.mapping.commit_map import get_commit_map
+from varats.utils.settings import vara_cfg
+
+LOG = logging.getLogger(__name__)
+
+# Bump this version whenever the layout of cached blocked revision indices
+# changes.
+_BLOCKED_REVISIONS_CACHE_VERSION = 1
+
+
+def get_revision_blocks(
+    source: FetchableSource
+) -> tp.Optional[tp.List[AbstractRevisionRange]]:
+    """
+    Get the revision ranges that were declared as blocked on a source with
+    benchbuild's ``block_revisions`` decorator.
+
+    Args:
+        source: the project source
+
+    Returns:
+        the declared revision ranges, or ``None`` if the source has no block
+        declaration that can be inspected; a warning is logged if the source
+        has blocked revisions that can not be inspected
+    """
+    is_blocked_revision = getattr(source, "is_blocked_revision", None)
+    if is_blocked_revision is None:
+        return None
+
+    # benchbuild has no accessor for the declared blocks, so they are looked up
+    # in the closure of the ``is_blocked_revision`` method that
+    # ``block_revisions`` adds to the source
+    for cell in getattr(is_blocked_revision, "__closure__", None) or []:
+        try:
+            cell_content = cell.cell_contents
+        except ValueError:
+            continue
+        if isinstance(cell_content, block_revisions):
+            blocks = getattr(cell_content, "_block_revisions__blocks", None)
+            if blocks is not None:
+                return list(blocks)
+
+    LOG.warning(
+        f"Could not inspect the blocked revisions of {source}, falling back "
+        "to benchbuild's is_blocked_revision check."
+    )
+    return None
+
+
+def get_block_declaration_hash(blocks: tp.List[AbstractRevisionRange]) -> str:
+    """
+    Compute a hash that identifies a block declaration.
+
+    Args:
+        blocks: the declared revision ranges
+
+    Returns:
+        hex digest of the declaration
+
+    Test:
+    >>> from benchbuild.utils.revision_ranges import SingleRevision
+    >>> get_block_declaration_hash([SingleRevision("a1")])[:16]
+    'b849ee6a35cf9b67'
+    """
+    declaration = "\n".join(
+        f"{type(block).__name__}:{block}" for block in blocks
+    )
+    return hashlib.sha256(declaration.encode("utf-8")).hexdigest()
+
+
+class BlockedRevisionIndex():
+    """
+    Index of all blocked revisions of a project.
+
+    Blocked revisions are matched like benchbuild does, i.e., a revision is
+    blocked if a blocked commit starts with it.
+
+    Args:
+        blocked_revisions: commit hashes of all blocked commits
+        blocked_time_ids: bitmap over the time ids of the project's commit map,
+                          where blocked commits are set
+    """
+
+    def __init__(
+        self, blocked_revisions: tp.Iterable[str], blocked_time_ids: np.ndarray
+    ) -> None:
+        self.__sorted_revisions = sorted(set(blocked_revisions))
+        self.__blocked_time_ids = blocked_time_ids.astype(bool)
+
+    @property
+    def blocked_revisions(self) -> tp.List[str]:
+        """Sorted list of all blocked commits."""
+        return list(self.__sorted_revisions)
+
+    @property
+    def blocked_time_ids(self) -> np.ndarray:
+        """Bitmap over the time ids of the project's commit map, where blocked
+        commits are set."""
+        return self.__blocked_time_ids
+
+    def is_blocked(self, revision: str) -> bool:
+        """
+        Check if a revision is blocked.
+
+        Args:
+            revision: the (short) commit hash
+
+        Returns:
+            True, if a blocked commit starts with the revision
+
+        Test:
+        >>> index = BlockedRevisionIndex(["a1b2", "c3d4"], np.zeros(0))
+        >>> index.is_blocked("c3"), index.is_blocked("b2")
+        (True, False)
+        """
+        idx = bisect_left(self.__sorted_revisions, revision)
+        return idx < len(self.__sorted_revisions) and \
+            self.__sorted_revisions[idx].startswith(revision)
+
+    def is_blocked_time_id(self, time_ids: np.ndarray) -> np.ndarray:
+        """
+        Check which time ids belong to blocked commits.
+
+        Args:
+            time_ids: time ids of the project's commit map
+
+        Returns:
+            boolean array that is true for blocked commits
+
+        Test:
+        >>> index = BlockedRevisionIndex([], np.array([False, True]))
+        >>> index.is_blocked_time_id(np.array([1, 0, 5])).tolist()
+        [True, False, False]
+        """
+        time_ids = np.asarray(time_ids, dtype=np.int64)
+        in_range = (time_ids >= 0) & (time_ids < len(self.__blocked_time_ids))
+        result = np.zeros(len(time_ids), dtype=bool)
+        result[in_range] = self.__blocked_time_ids[time_ids[in_range]]
+        return result
+
+
+def get_blocked_revisions_cache_path(
+    project_name: str, declaration_hash: str
+) -> Path:
+    """
+    Compute the path of the cached blocked revision index of a project.
+
+    Args:
+        project_name: name of the project
+        declaration_hash: hash of the block declaration
+
+    Returns:
+        path to the cache file in the data cache
+
+    Test:
+    >>> str(get_blocked_revisions_cache_path("xz", "0123456789abcdef0123"))
+    'data_cache/blocked_revisions/xz-0123456789abcdef.npz'
+    """
+    return Path(
+        str(vara_cfg()["data_cache"])
+    ) / "blocked_revisions" / f"{project_name}-{declaration_hash[:16]}.npz"
+
+
+def _load_blocked_revisions_cache(
+    cache_path: Path, head: str, declaration_hash: str
+) -> tp.Optional[BlockedRevisionIndex]:
+    if not cache_path.exists():
+        return None
+    try:
+        with np.load(cache_path, allow_pickle=False) as npz_file:
+            arrays = {key: npz_file[key] for key in npz_file.files}
+        if int(arrays["format_version"]) != _BLOCKED_REVISIONS_CACHE_VERSION \
+                or str(arrays["head"]) != head \
+                or str(arrays["declaration"]) != declaration_hash:
+            return None
+        return BlockedRevisionIndex(
+            arrays["revisions"].tolist(),
+            np.unpackbits(arrays["bitmap"],
+                          count=int(arrays["num_commits"])).astype(bool)
+        )
+    except (OSError, ValueError, KeyError) as err:
+        LOG.debug(
+            f"Ignoring invalid blocked revision cache {cache_path}: {err}"
+        )
+        return None
+
+
+def _store_blocked_revisions_cache(
+    cache_path: Path, head: str, declaration_hash: str,
+    index: BlockedRevisionIndex
+) -> None:
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=cache_path.parent, suffix=".tmp", delete=False
+        ) as tmp_file:
+            np.savez(
+                tmp_file,
+                format_version=np.array(_BLOCKED_REVISIONS_CACHE_VERSION),
+                head=np.array(head),
+                declaration=np.array(declaration_hash),
+                revisions=np.array(index.blocked_revisions, dtype=str),
+                num_commits=np.array(len(index.blocked_time_ids)),
+                bitmap=np.packbits(index.blocked_time_ids)
+            )
+        os.replace(tmp_file.name, cache_path)
+    except OSError as err:
+        LOG.warning(
+            f"Could not store blocked revision cache {cache_path}: {err}"
+        )
+
+
+def generate_blocked_revision_index(
+    project_name: str, source: FetchableSource
+) -> tp.Optional[BlockedRevisionIndex]:
+    """
+    Create the blocked revision index of a project, or load it from the data
+    cache.
+
+    Args:
+        project_name: name of the project
+        source: primary source of the project
+
+    Returns:
+        the blocked revision index, or ``None`` if the block declaration or the
+        repository of the project are not available
+    """
+    blocks = get_revision_blocks(source)
+    if blocks is None:
+        return None
+
+    source_path = str(source.fetch())
+    repo_path = pygit2.discover_repository(source_path)
+    if repo_path is None:
+        return None
+    repo = pygit2.Repository(repo_path)
+    refspec = str(getattr(source, "refspec", "HEAD"))
+    try:
+        head = str(repo.revparse_single(refspec).peel(pygit2.Commit).id)
+    except (KeyError, ValueError, pygit2.GitError):
+        return None
+
+    declaration_hash = get_block_declaration_hash(blocks)
+    cache_path = get_blocked_revisions_cache_path(
+        project_name, declaration_hash
+    )
+    index = _load_blocked_revisions_cache(cache_path, head, declaration_hash)
+    if index is not None:
+        return index
+
+    LOG.debug(f"Resolving blocked revisions of {project_name}")
+    blocked_revisions: tp.List[str] = []
+    for block in blocks:
+        block.init_cache(source_path)
+        blocked_revisions.extend(block)
+
+    cmap = get_commit_map(project_name)
+    time_ids = []
+    for blocked_revision in blocked_revisions:
+        try:
+            time_ids.append(cmap.short_time_id(blocked_revision))
+        except KeyError:
+            # blocked commits that are not part of the analyzed history
+            pass
+    bitmap = np.zeros(
+        max((time_id for _, time_id in cmap.mapping_items()), default=-1) + 1,
+        dtype=bool
+    )
+    bitmap[time_ids] = True
+
+    index = BlockedRevisionIndex(blocked_revisions, bitmap)
+    _store_blocked_revisions_cache(cache_path, head, declaration_hash, index)
+    return index
+
+
+_BLOCKED_REVISION_INDICES: tp.MutableMapping[
+    FetchableSource,
+    tp.Optional[BlockedRevisionIndex]] = weakref.WeakKeyDictionary()
+_BLOCKED_REVISION_INDICES_LOCK = Lock()
+
+
+def get_blocked_revision_index(
+    project_name: str, source: FetchableSource
+) -> tp.Optional[BlockedRevisionIndex]:
+    """
+    Get the blocked revision index for the primary source of a project.
+
+    The index is created once per source and process.
+
+    Args:
+        project_name: name of the project
+        source: primary source of the project
+
+    Returns:
+        the blocked revision index, or ``None`` if it can not be created, e.g.,
+        because the index is disabled
+    """
+    if not vara_cfg()["caching"]["blocked_revision_index"].value:
+        return None
+
+    with _BLOCKED_REVISION_INDICES_LOCK:
+        if source not in _BLOCKED_REVISION_INDICES:
+            try:
+                index = generate_blocked_revision_index(project_name, source)
+            except (OSError, pygit2.GitError) as err:
+                LOG.warning(
+                    "Could not create blocked revision index for "
+                    f"{project_name}: {err}"
+                )
+                index = None
+            _BLOCKED_REVISION_INDICES[source] = index
+        return _BLOCKED_REVISION_INDICES[source]
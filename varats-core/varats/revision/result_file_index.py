@@ -0,0 +1,245 @@
+"""
+Index of the result files of a project.
+
+Looking up result files requires listing the result directory of a project and
+parsing the names of all files in it. The :class:`ResultFileIndex` does this
+once per file and only rescans the directory if its modification time changed,
+i.e., if files were added, removed, or renamed. Records of files that were
+replaced or modified in the meantime are recreated during a rescan.
+"""
+
+import os
+import time
+import typing as tp
+from pathlib import Path
+from threading import Lock
+
+from varats.report.report import (
+    FileStatusExtension,
+    MetaReport,
+    ResultFileName,
+)
+from varats.utils.settings import vara_cfg
+
+# Directory modification times that are more recent than this (in ns) are not
+# trusted, as files could be added in the same timestamp granule without
+# changing the directory's modification time.
+_RACY_MTIME_WINDOW_NS = 2 * 10**9
+
+
+class ResultFileRecord():
+    """
+    Parsed information about a single file in a result directory.
+
+    Args:
+        path: path to the file
+        stat: status of the file
+    """
+
+    def __init__(self, path: Path, stat: os.stat_result) -> None:
+        self.__path = path
+        self.__mtime = stat.st_mtime
+        self.__identity = ResultFileRecord.file_identity(stat)
+
+        file_name = path.name
+        result_file_name = ResultFileName.parse(file_name)
+        if result_file_name is None:
+            result_file_name = ResultFileName.parse_supplementary(file_name)
+        self.__result_file_name = result_file_name
+
+    @property
+    def path(self) -> Path:
+        """Path to the file."""
+        return self.__path
+
+    @property
+    def mtime(self) -> float:
+        """Modification time of the file."""
+        return self.__mtime
+
+    @property
+    def identity(self) -> tp.Tuple[int, int, int]:
+        """Inode, modification time in ns, and size of the file."""
+        return self.__identity
+
+    @staticmethod
+    def file_identity(stat: os.stat_result) -> tp.Tuple[int, int, int]:
+        """
+        Compute the identity of a file that changes whenever the file is
+        replaced or modified.
+
+        Args:
+            stat: status of the file
+
+        Returns:
+            tuple of inode, modification time in ns, and size of the file
+        """
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    @property
+    def is_result_file(self) -> bool:
+        """True, if the file name is formated like a result file."""
+        return self.__result_file_name is not None and \
+            not self.__result_file_name.is_supplementary
+
+    @property
+    def is_supplementary(self) -> bool:
+        """True, if the file is a supplementary result file."""
+        return self.__result_file_name is not None and \
+            self.__result_file_name.is_supplementary
+
+    @property
+    def commit_hash(self) -> tp.Optional[str]:
+        """Commit hash of the result file."""
+        if self.__result_file_name is None:
+            return None
+        return self.__result_file_name.commit_hash
+
+    @property
+    def status(self) -> tp.Optional[FileStatusExtension]:
+        """File status of a result file."""
+        if self.__result_file_name is None:
+            return None
+        return self.__result_file_name.status
+
+    @property
+    def info_type(self) -> tp.Optional[str]:
+        """Info type of a supplementary result file."""
+        if self.__result_file_name is None:
+            return None
+        return self.__result_file_name.info_type
+
+    def is_correct_report_type(self, result_file_type: MetaReport) -> bool:
+        """
+        Check if the file belongs to the given report type.
+
+        Args:
+            result_file_type: the report type
+
+        Returns:
+            True, if the file is a result file of the given report type
+        """
+        return self.is_result_file and tp.cast(
+            ResultFileName, self.__result_file_name
+        ).shorthand == str(getattr(result_file_type, "SHORTHAND"))
+
+
+class ResultFileIndex():
+    """
+    Index of all files in a result directory.
+
+    Args:
+        result_dir: the result directory of a project
+    """
+
+    def __init__(self, result_dir: Path) -> None:
+        self.__result_dir = result_dir
+        self.__dir_mtime_ns: tp.Optional[int] = None
+        self.__records: tp.Dict[str, ResultFileRecord] = {}
+        self.__report_type_cache: tp.Dict[str, tp.Dict[
+            str, tp.List[ResultFileRecord]]] = {}
+        self.__lock = Lock()
+
+    @property
+    def result_dir(self) -> Path:
+        """The indexed result directory."""
+        return self.__result_dir
+
+    def refresh(self) -> None:
+        """Rescan the result directory if it changed since the last scan."""
+        with self.__lock:
+            try:
+                dir_mtime_ns = os.stat(self.__result_dir).st_mtime_ns
+            except OSError:
+                self.__dir_mtime_ns = None
+                self.__records = {}
+                self.__report_type_cache = {}
+                return
+
+            if dir_mtime_ns == self.__dir_mtime_ns:
+                return
+
+            records: tp.Dict[str, ResultFileRecord] = {}
+            with os.scandir(self.__result_dir) as dir_entries:
+                for dir_entry in dir_entries:
+                    try:
+                        stat = dir_entry.stat()
+                    except OSError:
+                        # file was removed while scanning
+                        continue
+                    record = self.__records.get(dir_entry.name, None)
+                    if record is None or record.identity != \
+                            ResultFileRecord.file_identity(stat):
+                        record = ResultFileRecord(Path(dir_entry.path), stat)
+                    records[dir_entry.name] = record
+
+            self.__records = records
+            self.__report_type_cache = {}
+            if time.time_ns() - dir_mtime_ns > _RACY_MTIME_WINDOW_NS:
+                self.__dir_mtime_ns = dir_mtime_ns
+            else:
+                self.__dir_mtime_ns = None
+
+    def result_files(
+        self, result_file_type: MetaReport
+    ) -> tp.Dict[str, tp.List[ResultFileRecord]]:
+        """
+        Look up the result files of a report type.
+
+        Args:
+            result_file_type: the type of the result files
+
+        Returns:
+            a dict that maps commit hashes to the result files for the commit
+        """
+        self.refresh()
+        with self.__lock:
+            shorthand = str(getattr(result_file_type, "SHORTHAND"))
+            if shorthand not in self.__report_type_cache:
+                result_files: tp.Dict[str, tp.List[ResultFileRecord]] = {}
+                for record in self.__records.values():
+                    if record.is_correct_report_type(result_file_type):
+                        result_files.setdefault(
+                            tp.cast(str, record.commit_hash), []
+                        ).append(record)
+                self.__report_type_cache[shorthand] = result_files
+
+            return {
+                commit_hash: list(records) for commit_hash, records in
+                self.__report_type_cache[shorthand].items()
+            }
+
+    def supplementary_result_files(self) -> tp.List[ResultFileRecord]:
+        """
+        Look up all supplementary result files.
+
+        Returns:
+            a list of all supplementary result files
+        """
+        self.refresh()
+        with self.__lock:
+            return [
+                record for record in self.__records.values()
+                if record.is_supplementary
+            ]
+
+
+_RESULT_FILE_INDICES: tp.Dict[Path, ResultFileIndex] = {}
+_RESULT_FILE_INDICES_LOCK = Lock()
+
+
+def get_result_file_index(project_name: str) -> ResultFileIndex:
+    """
+    Get the result file index for the result directory of a project.
+
+    Args:
+        project_name: target project
+
+    Returns:
+        the result file index of the project
+    """
+    result_dir = Path(f"{vara_cfg()['result_dir']}/{project_name}/")
+    with _RESULT_FILE_INDICES_LOCK:
+        if result_dir not in _RESULT_FILE_INDICES:
+            _RESULT_FILE_INDICES[result_dir] = ResultFileIndex(result_dir)
+        return _RESULT_FILE_INDICES[result_dir]
@@ -18,22 +18,35 @@ from varats.project.project_util import (
     get_primary_project_source,
 )
 from varats.report.report import FileStatusExtension, MetaReport
-from varats.utils.settings import vara_cfg
+from varats.revision.blocked_revisions import get_blocked_revision_index
+from varats.revision.result_file_index import (
+    ResultFileRecord,
+    get_result_file_index,
+)
 
 
 def is_revision_blocked(revision: str, project_cls: tp.Type[Project]) -> bool:
     """
     Checks if a revision is blocked on a given project.
 
+    Blocked revisions are looked up in the project's
+    :class:`~varats.revision.blocked_revisions.BlockedRevisionIndex` if it is
+    available.
+
     Args:
         revision: the revision
         project_cls: the project class the revision belongs to
 
     Returns:
-        filtered revision list
+        True, if the revision is blocked
     """
     source = get_primary_project_source(project_cls.NAME)
     if hasattr(source, "is_blocked_revision"):
+        blocked_revision_index = get_blocked_revision_index(
+            project_cls.NAME, source
+        )
+        if blocked_revision_index is not None:
+            return blocked_revision_index.is_blocked(revision)
         return tp.cast(bool, source.is_blocked_revision(revision)[0])
     return False
 
@@ -58,7 +71,7 @@ def filter_blocked_revisions(
 
 def __get_result_files_dict(
     project_name: str, result_file_type: MetaReport
-) -> tp.Dict[str, tp.List[Path]]:
+) -> tp.Dict[str, tp.List[ResultFileRecord]]:
     """
     Returns a dict that maps the commit_hash to a list of all result files, of
     type result_file_type, for that commit.
@@ -67,31 +80,14 @@ def __get_result_files_dict(
         project_name: target project
         result_file_type: the type of the result file
     """
-    res_dir = Path(f"{vara_cfg()['result_dir']}/{project_name}/")
-
-    result_files: tp.DefaultDict[str, tp.List[Path]] = defaultdict(
-        list
-    )  # maps commit hash -> list of res files (success or fail)
-    if not res_dir.exists():
-        return result_files
-
-    for res_file in res_dir.iterdir():
-        if result_file_type.is_result_file(
-            res_file.name
-        ) and result_file_type.is_correct_report_type(res_file.name):
-            commit_hash = result_file_type.get_commit_hash_from_result_file(
-                res_file.name
-            )
-            result_files[commit_hash].append(res_file)
-
-    return result_files
+    return get_result_file_index(project_name).result_files(result_file_type)
 
 
 def __get_supplementary_result_files_dict(
     project_name: str,
     result_file_type: MetaReport,
     revision: tp.Optional[str] = None,
-) -> tp.Dict[tp.Tuple[str, str], tp.List[Path]]:
+) -> tp.Dict[tp.Tuple[str, str], tp.List[ResultFileRecord]]:
     """
     Returns a dict that maps the commit_hash and the info_type to a list of all
     supplementary result files for that commit and info_type. If an (optional)
@@ -106,24 +102,17 @@ def __get_supplementary_result_files_dict(
     Returns:
         Dict that maps (commit_hash, info_type) to list of result files
     """
-    res_dir = Path(f"{vara_cfg()['result_dir']}/{project_name}/")
-
     result_files: tp.DefaultDict[tp.Tuple[
-        str, str], tp.List[Path]] = defaultdict(
+        str, str], tp.List[ResultFileRecord]] = defaultdict(
             list
         )  # maps (commit_hash, suppl._file_type) -> list of res files
 
-    if res_dir.exists():
-        for res_file in res_dir.iterdir():
-            if result_file_type.is_result_file_supplementary(res_file.name):
-                commit_hash = result_file_type.\
-                    get_commit_hash_from_supplementary_result_file(
-                        res_file.name)
-                info_type = result_file_type.\
-                    get_info_type_from_supplementary_result_file(
-                        res_file.name)
-                if revision is None or commit_hash == revision:
-                    result_files[(commit_hash, info_type)].append(res_file)
+    for record in get_result_file_index(project_name
+                                       ).supplementary_result_files():
+        commit_hash = tp.cast(str, record.commit_hash)
+        if revision is None or commit_hash == revision:
+            result_files[(commit_hash,
+                          tp.cast(str, record.info_type))].append(record)
 
     return result_files
 
@@ -156,17 +145,15 @@ def __get_files_with_status(
     result_files = __get_result_files_dict(project_name, result_file_type)
     for value in result_files.values():
         sorted_res_files = sorted(
-            value, key=lambda x: Path(x).stat().st_mtime, reverse=True
+            value, key=lambda record: record.mtime, reverse=True
         )
         if only_newest:
             sorted_res_files = [sorted_res_files[0]]
         for result_file in sorted_res_files:
-            if file_name_filter(result_file.name):
+            if file_name_filter(result_file.path.name):
                 continue
-            if result_file_type.get_status_from_result_file(
-                result_file.name
-            ) in file_statuses:
-                processed_revisions_paths.append(result_file)
+            if result_file.status in file_statuses:
+                processed_revisions_paths.append(result_file.path)
 
     return processed_revisions_paths
 
@@ -289,8 +276,8 @@ def get_failed_revisions(project_name: str,
 
     result_files = __get_result_files_dict(project_name, result_file_type)
     for commit_hash, value in result_files.items():
-        newest_res_file = max(value, key=lambda x: Path(x).stat().st_mtime)
-        if result_file_type.result_file_has_status_failed(newest_res_file.name):
+        newest_res_file = max(value, key=lambda record: record.mtime)
+        if newest_res_file.status == FileStatusExtension.Failed:
             failed_revisions.append(commit_hash)
 
     return failed_revisions
@@ -298,7 +285,7 @@ def get_failed_revisions(project_name: str,
 
 def __get_tag_for_revision(
     revision: str,
-    file_list: tp.List[Path],
+    file_list: tp.List[ResultFileRecord],
     project_cls: tp.Type[Project],
     result_file_type: MetaReport,
     tag_blocked: bool = True
@@ -318,11 +305,10 @@ def __get_tag_for_revision(
     if tag_blocked and is_revision_blocked(revision, project_cls):
         return FileStatusExtension.Blocked
 
-    newest_res_file = max(file_list, key=lambda x: x.stat().st_mtime)
-    if result_file_type.is_correct_report_type(str(newest_res_file.name)):
-        return result_file_type.get_status_from_result_file(
-            str(newest_res_file)
-        )
+    newest_res_file = max(file_list, key=lambda record: record.mtime)
+    if newest_res_file.is_correct_report_type(result_file_type) and \
+            newest_res_file.status is not None:
+        return newest_res_file.status
 
     return FileStatusExtension.Missing
 
@@ -414,7 +400,7 @@ def get_supplementary_result_files(
 
     for (commit_hash, info_type), file_list in result_files.items():
         if (suppl_info_type is None) or (info_type == suppl_info_type):
-            newest_res_file = max(file_list, key=lambda x: x.stat().st_mtime)
-            result.append((newest_res_file, commit_hash, info_type))
+            newest_res_file = max(file_list, key=lambda record: record.mtime)
+            result.append((newest_res_file.path, commit_hash, info_type))
 
     return result
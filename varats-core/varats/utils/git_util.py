@@ -1,19 +1,31 @@
 """Utility module for handling git repos."""
 
+import hashlib
+import logging
 import os
-import re
+import subprocess
+import sys
+import tempfile
+import threading
 import typing as tp
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
 import pygit2
 from benchbuild.utils.cmd import git
-from plumbum import local
+from plumbum import ProcessExecutionError, local
 
 from varats.project.project_util import (
     get_local_project_git,
     get_primary_project_source,
 )
+from varats.utils.settings import vara_cfg
+
+LOG = logging.getLogger(__name__)
 
 ################################################################################
 # Git interaction helpers
@@ -294,106 +306,730 @@ class CommitRepoPair():
         return f"{self.repository_name}[{self.commit_hash}]"
 
 
+# Hash that marks uncommitted changes
+UNCOMMITTED_COMMIT_HASH = "0000000000000000000000000000000000000000"
+
 MappedCommitResultType = tp.TypeVar("MappedCommitResultType")
+LookedUpCommitTy = tp.TypeVar("LookedUpCommitTy")
 
 
 def map_commits(
-    func: tp.Callable[[pygit2.Commit], MappedCommitResultType],
+    func: tp.Callable[[LookedUpCommitTy], MappedCommitResultType],
     cr_pair_list: tp.Iterable[CommitRepoPair],
-    commit_lookup: tp.Callable[[str, str], pygit2.Commit],
+    commit_lookup: tp.Callable[[str, str], LookedUpCommitTy],
 ) -> tp.Sequence[MappedCommitResultType]:
     """Maps a function over a range of commits."""
     # Skip 0000 hashes that we added to mark uncommitted files
     return [
         func(commit_lookup(cr_pair.commit_hash, cr_pair.repository_name))
         for cr_pair in cr_pair_list
-        if cr_pair.commit_hash != "0000000000000000000000000000000000000000"
+        if cr_pair.commit_hash != UNCOMMITTED_COMMIT_HASH
     ]
 
 
-GIT_LOG_MATCHER = re.compile(
-    r"\'(?P<hash>.*)\'\n?" + r"( (?P<files>\d*) files? changed)?" +
-    r"(, (?P<insertions>\d*) insertions?\(\+\))?" +
-    r"(, (?P<deletions>\d*) deletions?\(-\))?"
-)
-GIT_DIFF_MATCHER = re.compile(
-    r"( (?P<files>\d*) files? changed)?" +
-    r"(, (?P<insertions>\d*) insertions?\(\+\))?" +
-    r"(, (?P<deletions>\d*) deletions?\(-\))?"
-)
+def _get_repo_cache_name(repo_path: str) -> str:
+    """Unique name of a repository for files in the data cache that combines
+    the name of the repository folder with a hash of its location."""
+    repo_dir = Path(os.path.realpath(repo_path))
+    if repo_dir.name == ".git":
+        repo_dir = repo_dir.parent
+    repo_key = hashlib.sha256(str(repo_dir).encode("utf-8")).hexdigest()[:8]
+    return f"{repo_dir.name}-{repo_key}"
 
 
-def __calc_code_churn_range_impl(
-    repo_path: str,
-    churn_config: ChurnConfig,
-    start_range: tp.Optional[str] = None,
-    end_range: tp.Optional[str] = None
-) -> tp.Dict[str, tp.Tuple[int, int, int]]:
+# Commit metadata is stored as a tuple
+# (author_name, author_email, commit_time, parent_hashes).
+CommitMetadataTy = tp.Tuple[str, str, int, tp.Tuple[str, ...]]
+COMMIT_AUTHOR_NAME = 0
+COMMIT_AUTHOR_EMAIL = 1
+COMMIT_TIME = 2
+COMMIT_PARENTS = 3
+
+
+def _sanitize_table_field(field: str) -> str:
+    return field.replace("\t", " ").replace("\n", " ")
+
+
+class CommitMetadataCache():
     """
-    Calculates all churn values for the commits in the specified range.
+    Bounded cache for the metadata of commits, i.e., author, commit time, and
+    parents, of any number of repositories.
 
-    [start..end]. If no range is supplied, the churn values of all commits are
-    calculated.
+    Metadata is kept as compact tuples (see :data:`CommitMetadataTy`), the least
+    recently used entries are evicted once ``max_entries`` is exceeded. If
+    ``use_table`` is set, the metadata of every looked up commit is also
+    written to a persistent table per repository in the ``data_cache``, which
+    is used to fill the cache before any commit of the repository is read
+    from git.
+
+    Args:
+        max_entries: maximal number of cached commits, 0 disables the limit
+        use_table: whether to use the persistent metadata tables
+    """
+
+    def __init__(self, max_entries: int = 0, use_table: bool = False) -> None:
+        self.__max_entries = max_entries
+        self.__use_table = use_table
+        self.__entries: tp.OrderedDict[tp.Tuple[str, str],
+                                       CommitMetadataTy] = OrderedDict()
+        self.__loaded_tables: tp.Set[str] = set()
+        self.__lock = threading.Lock()
+
+    @property
+    def max_entries(self) -> int:
+        """Maximal number of cached commits."""
+        return self.__max_entries
+
+    @property
+    def num_entries(self) -> int:
+        """Number of currently cached commits."""
+        return len(self.__entries)
+
+    @staticmethod
+    def get_table_path(repo_path: str) -> Path:
+        """
+        Path of the persistent metadata table of a repository.
+
+        Args:
+            repo_path: path to the git repository
+
+        Returns:
+            path to the table in the data cache
+        """
+        return Path(
+            str(vara_cfg()["data_cache"])
+        ) / "commit_metadata" / (f"{_get_repo_cache_name(repo_path)}.tsv")
+
+    def __insert(
+        self, repo_key: str, c_hash: str, metadata: CommitMetadataTy
+    ) -> None:
+        self.__entries[(repo_key, c_hash)] = metadata
+        self.__entries.move_to_end((repo_key, c_hash))
+        if self.__max_entries:
+            while len(self.__entries) > self.__max_entries:
+                self.__entries.popitem(last=False)
+
+    def __load_table(self, repo_key: str) -> None:
+        if not self.__use_table or repo_key in self.__loaded_tables:
+            return
+
+        self.__loaded_tables.add(repo_key)
+        table_path = self.get_table_path(repo_key)
+        if not table_path.exists():
+            return
+
+        with open(table_path, "r", encoding="utf-8") as table_file:
+            for line in table_file:
+                fields = line.rstrip("\n").split("\t")
+                if len(fields) != 5:
+                    # skip a partially written line of an interrupted run
+                    continue
+                c_hash, name, email, commit_time, parents = fields
+                self.__insert(
+                    repo_key, c_hash, (
+                        sys.intern(name), sys.intern(email), int(commit_time),
+                        tuple(parents.split())
+                    )
+                )
+
+    def __store_in_table(
+        self, repo_key: str, new_entries: tp.Dict[str, CommitMetadataTy]
+    ) -> None:
+        if not self.__use_table or not new_entries:
+            return
+
+        table_path = self.get_table_path(repo_key)
+        try:
+            table_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(table_path, "a", encoding="utf-8") as table_file:
+                table_file.writelines(
+                    f"{c_hash}\t{_sanitize_table_field(name)}\t"
+                    f"{_sanitize_table_field(email)}\t{commit_time}\t"
+                    f"{' '.join(parents)}\n"
+                    for c_hash, (name, email, commit_time,
+                                 parents) in new_entries.items()
+                )
+        except OSError as err:
+            LOG.warning(
+                f"Could not update commit metadata table {table_path}: {err}"
+            )
+
+    @staticmethod
+    def __read_commit(repo: pygit2.Repository,
+                      c_hash: str) -> tp.Optional[CommitMetadataTy]:
+        try:
+            commit = repo.get(c_hash)
+        except ValueError:
+            return None
+        if not isinstance(commit, pygit2.Commit):
+            return None
+        return (
+            sys.intern(commit.author.name), sys.intern(commit.author.email),
+            commit.commit_time,
+            tuple(str(parent_id) for parent_id in commit.parent_ids)
+        )
+
+    def __lookup(self, repo: pygit2.Repository,
+                 c_hashes: tp.Iterable[str]) -> tp.Dict[str, CommitMetadataTy]:
+        repo_key = os.path.realpath(repo.path)
+        found: tp.Dict[str, CommitMetadataTy] = {}
+        new_entries: tp.Dict[str, CommitMetadataTy] = {}
+        with self.__lock:
+            self.__load_table(repo_key)
+            for c_hash in c_hashes:
+                metadata = self.__entries.get((repo_key, c_hash), None)
+                if metadata is not None:
+                    self.__entries.move_to_end((repo_key, c_hash))
+                else:
+                    metadata = self.__read_commit(repo, c_hash)
+                    if metadata is None:
+                        continue
+                    self.__insert(repo_key, c_hash, metadata)
+                    new_entries[c_hash] = metadata
+                found[c_hash] = metadata
+            self.__store_in_table(repo_key, new_entries)
+        return found
+
+    def get(self, repo: pygit2.Repository, c_hash: str) -> CommitMetadataTy:
+        """
+        Look up the metadata of a commit.
+
+        Args:
+            repo: repository that contains the commit
+            c_hash: hash of the commit
+
+        Returns:
+            the metadata of the commit
+        """
+        metadata = self.__lookup(repo, [c_hash]).get(c_hash, None)
+        if metadata is None:
+            raise LookupError(f"Could not find commit {c_hash} in {repo.path}")
+        return metadata
+
+    def prefetch(
+        self, repo: pygit2.Repository, c_hashes: tp.Iterable[str]
+    ) -> None:
+        """
+        Load the metadata of multiple commits into the cache at once.
+
+        Hashes of commits that are not part of the repository are ignored.
+
+        Args:
+            repo: repository that contains the commits
+            c_hashes: hashes of the commits
+        """
+        self.__lookup(repo, c_hashes)
 
-    git log --pretty=format:'%H' --date=short --shortstat -- ':*.[enabled_exts]'
+    def clear(self) -> None:
+        """Remove all commits from the cache."""
+        with self.__lock:
+            self.__entries.clear()
+            self.__loaded_tables.clear()
+
+
+_COMMIT_METADATA_CACHE: tp.Optional[CommitMetadataCache] = None
+_COMMIT_METADATA_CACHE_LOCK = threading.Lock()
+
+
+def get_commit_metadata_cache() -> CommitMetadataCache:
+    """
+    Get the process-wide commit metadata cache.
+
+    Returns:
+        the commit metadata cache configured in the ``caching`` settings
+    """
+    global _COMMIT_METADATA_CACHE  # pylint: disable=global-statement
+    with _COMMIT_METADATA_CACHE_LOCK:
+        if _COMMIT_METADATA_CACHE is None:
+            _COMMIT_METADATA_CACHE = CommitMetadataCache(
+                int(vara_cfg()["caching"]["commit_metadata_cache_size"].value),
+                bool(vara_cfg()["caching"]["commit_metadata_table"].value)
+            )
+        return _COMMIT_METADATA_CACHE
+
+
+class CommitMetadataLookup():
+    """
+    Looks up the metadata of commits in the repositories of a project using
+    the process-wide :class:`CommitMetadataCache`.
 
     Args:
-        repo_path: path to the git repository
-        churn_config: churn config to customize churn generation
-        start_range: begin churn calculation at start commit
-        end_range: end churn calculation at end commit
+        project_name: name of the given benchbuild project
+    """
+
+    def __init__(self, project_name: str) -> None:
+        self.__project_name = project_name
+        self.__primary_source_name = os.path.basename(
+            get_primary_project_source(project_name).local
+        )
+        self.__repos: tp.Dict[str, pygit2.Repository] = {}
+        self.__cache = get_commit_metadata_cache()
+
+    def __get_repo(self, git_name: tp.Optional[str]) -> pygit2.Repository:
+        if git_name == "Unknown" or not git_name:
+            git_name = self.__primary_source_name
+
+        if git_name not in self.__repos:
+            if git_name == self.__primary_source_name:
+                self.__repos[git_name] = get_local_project_git(
+                    self.__project_name
+                )
+            else:
+                self.__repos[git_name] = get_local_project_git(
+                    self.__project_name, git_name
+                )
+        return self.__repos[git_name]
+
+    def __call__(
+        self,
+        c_hash: str,
+        git_name: tp.Optional[str] = None
+    ) -> CommitMetadataTy:
+        """
+        Gets the metadata of a commit within its corresponding repository.
+
+        Args:
+            c_hash: commit hash of the searched commit
+            git_name: name of the repository, wherein the commit is being
+                      searched. If no git_name is provided, the name of the
+                      primary source is used.
+
+        Returns:
+            metadata of the commit
+        """
+        try:
+            return self.__cache.get(self.__get_repo(git_name), c_hash)
+        except LookupError:
+            raise LookupError(
+                f"Could not find commit {c_hash} in "
+                f"project {self.__project_name} within git repository "
+                f"{git_name or self.__primary_source_name}"
+            ) from None
+
+    def prefetch(self, cr_pairs: tp.Iterable[CommitRepoPair]) -> None:
+        """
+        Load the metadata of multiple commits into the cache at once.
+
+        Args:
+            cr_pairs: commits to load
+        """
+        hashes_per_repo: tp.Dict[str, tp.Set[str]] = defaultdict(set)
+        for cr_pair in cr_pairs:
+            hashes_per_repo[cr_pair.repository_name].add(cr_pair.commit_hash)
+
+        for git_name, c_hashes in hashes_per_repo.items():
+            self.__cache.prefetch(self.__get_repo(git_name), c_hashes)
+
+
+CommitMetadataLookupTy = tp.Callable[[str, str], CommitMetadataTy]
+
+
+def create_commit_metadata_lookup_helper(
+    project_name: str
+) -> CommitMetadataLookup:
+    """
+    Creates a commit metadata lookup function for project repositories.
+
+    In contrast to :func:`create_commit_lookup_helper`, all lookup functions
+    share one bounded cache that only keeps the commit metadata.
+
+    Args:
+        project_name: name of the given benchbuild project
+
+    Returns:
+        a Callable that maps a commit hash and repository name to the
+        metadata of the corresponding commit.
+    """
+    return CommitMetadataLookup(project_name)
+
+
+def _is_churn_relevant_file(churn_config: ChurnConfig, file_path: str) -> bool:
+    """Checks if a changed file is considered for code churn, like the
+    ``*.ext`` pathspecs passed to git."""
+    if churn_config.include_everything:
+        return True
+    _, dot, file_extension = file_path.rpartition(".")
+    return bool(dot) and churn_config.is_enabled(file_extension)
+
+
+def _calc_diff_churn(diff: pygit2.Diff,
+                     churn_config: ChurnConfig) -> tp.Tuple[int, int, int]:
+    """
+    Calculates the churn of a diff, counting renamed files like git.
+
+    Rename detection is not limited, like with ``git log -l0``, whereas
+    libgit2 skips it by default for diffs with many added and deleted files.
+
+    Returns:
+        churn triple (files changed, insertions, deletions)
     """
+    # libgit2 treats a rename limit of 0 as its default limit
+    diff.find_similar(rename_limit=sys.maxsize)
+    if churn_config.include_everything:
+        stats = diff.stats
+        return stats.files_changed, stats.insertions, stats.deletions
+
+    files_changed = insertions = deletions = 0
+    for idx, delta in enumerate(diff.deltas):
+        if not _is_churn_relevant_file(churn_config, delta.new_file.path) and \
+                not _is_churn_relevant_file(churn_config, delta.old_file.path):
+            continue
+        _, patch_insertions, patch_deletions = diff[idx].line_stats
+        files_changed += 1
+        insertions += patch_insertions
+        deletions += patch_deletions
+    return files_changed, insertions, deletions
 
-    churn_values: tp.Dict[str, tp.Tuple[int, int, int]] = {}
 
-    if start_range is None and end_range is None:
-        revision_range = None
-    elif start_range is None:
-        revision_range = "..{}".format(end_range)
-    elif end_range is None:
-        revision_range = "{}~..".format(start_range)
+def _calc_commit_pair_churn(
+    repo: pygit2.Repository, commit_a: tp.Optional[pygit2.Commit],
+    commit_b: pygit2.Commit, churn_config: ChurnConfig
+) -> tp.Tuple[int, int, int]:
+    """Calculates the churn between two commits, where a missing ``commit_a``
+    refers to the empty tree."""
+    if commit_a is None:
+        diff = commit_b.tree.diff_to_tree(swap=True)
     else:
-        revision_range = "{}~..{}".format(start_range, end_range)
+        diff = repo.diff(commit_a, commit_b)
+    return _calc_diff_churn(diff, churn_config)
 
-    repo_git = git["-C", repo_path]
-    log_base_params = ["log", "--pretty=%H"]
-    diff_base_params = [
-        "log", "--pretty=format:'%H'", "--date=short", "--shortstat", "-l0"
-    ]
-    if revision_range:
-        log_base_params.append(revision_range)
-        diff_base_params.append(revision_range)
 
+ItemTy = tp.TypeVar("ItemTy")
+ResultTy = tp.TypeVar("ResultTy")
+
+
+def _map_with_thread_local_repo(
+    repo_path: str, func: tp.Callable[[pygit2.Repository, ItemTy], ResultTy],
+    items: tp.Sequence[ItemTy], num_workers: tp.Optional[int]
+) -> tp.List[ResultTy]:
+    """Maps ``func`` over ``items`` on a thread pool, passing every thread its
+    own handle of the repository, as libgit2 repositories must not be shared
+    between threads."""
+    thread_data = threading.local()
+
+    def call_func(item: ItemTy) -> ResultTy:
+        if not hasattr(thread_data, "repo"):
+            thread_data.repo = pygit2.Repository(repo_path)
+        return func(thread_data.repo, item)
+
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        return list(executor.map(call_func, items))
+
+
+def _calc_commit_churn(
+    repo: pygit2.Repository, commit: pygit2.Commit, churn_config: ChurnConfig
+) -> tp.Tuple[int, int, int]:
+    """Calculates the churn a commit introduced compared to its parent."""
+    if len(commit.parents) > 1:
+        # like git log, merge commits do not have churn on their own
+        return 0, 0, 0
+    return _calc_commit_pair_churn(
+        repo, commit.parents[0] if commit.parents else None, commit,
+        churn_config
+    )
+
+
+def calc_code_churn_pairs(
+    repo: tp.Union[pygit2.Repository, str],
+    commit_pairs: tp.Iterable[tp.Tuple[tp.Union[pygit2.Commit, str],
+                                       tp.Union[pygit2.Commit, str]]],
+    churn_config: tp.Optional[ChurnConfig] = None,
+    num_workers: tp.Optional[int] = None
+) -> pd.DataFrame:
+    """
+    Calculates the churn between many pairs of commits.
+
+    All diffs are computed with pygit2 inside this process, distributed over a
+    pool of threads that each use their own handle of the repository.
+
+    Args:
+        repo: git repository
+        commit_pairs: pairs (commit_a, commit_b) of base and target commit
+        churn_config: churn config to customize churn generation
+        num_workers: number of threads, by default chosen by
+                     ``ThreadPoolExecutor``
+
+    Returns:
+        data frame with the columns ``commit_a``, ``commit_b``,
+        ``changed_files``, ``insertions``, and ``deletions``, with one row per
+        commit pair in the given order
+    """
+    churn_config = ChurnConfig.init_as_default_if_none(churn_config)
+    repo_path = repo.path if isinstance(repo, pygit2.Repository) else repo
+    hash_pairs = [(
+        str(commit_a.id) if isinstance(commit_a, pygit2.Commit) else commit_a,
+        str(commit_b.id) if isinstance(commit_b, pygit2.Commit) else commit_b
+    ) for commit_a, commit_b in commit_pairs]
+
+    def calc_pair_churn(
+        thread_repo: pygit2.Repository, hash_pair: tp.Tuple[str, str]
+    ) -> tp.Tuple[int, int, int]:
+        return _calc_commit_pair_churn(
+            thread_repo,
+            thread_repo.revparse_single(hash_pair[0]).peel(pygit2.Commit),
+            thread_repo.revparse_single(hash_pair[1]).peel(pygit2.Commit),
+            churn_config
+        )
+
+    churn_values = _map_with_thread_local_repo(
+        repo_path, calc_pair_churn, hash_pairs, num_workers
+    )
+
+    return pd.DataFrame({
+        "commit_a":
+            pd.Series([pair[0] for pair in hash_pairs], dtype=object),
+        "commit_b":
+            pd.Series([pair[1] for pair in hash_pairs], dtype=object),
+        "changed_files":
+            pd.Series([churn[0] for churn in churn_values], dtype='int64'),
+        "insertions":
+            pd.Series([churn[1] for churn in churn_values], dtype='int64'),
+        "deletions":
+            pd.Series([churn[2] for churn in churn_values], dtype='int64')
+    })
+
+
+def _parse_shortstat_line(line: str) -> tp.Tuple[int, int, int]:
+    """
+    Parse a ``git --shortstat`` summary line.
+
+    Test:
+    >>> _parse_shortstat_line(" 2 files changed, 5 insertions(+)")
+    (2, 5, 0)
+    >>> _parse_shortstat_line(" 1 file changed, 1 deletion(-)")
+    (1, 0, 1)
+    """
+    churn = [0, 0, 0]
+    for part in line.split(","):
+        value, _, kind = part.strip().partition(" ")
+        if kind.startswith("file"):
+            churn[0] = int(value)
+        elif kind.startswith("insertion"):
+            churn[1] = int(value)
+        elif kind.startswith("deletion"):
+            churn[2] = int(value)
+    return churn[0], churn[1], churn[2]
+
+
+def parse_shortstat_log(
+    lines: tp.Iterable[str]
+) -> tp.Generator[tp.Tuple[str, tp.Tuple[int, int, int]], None, None]:
+    """
+    Parse the output of ``git log --pretty=%H --shortstat`` line by line.
+
+    Every line is either empty, a commit hash, or the summary of the commit
+    whose hash came before it, so the parser only needs to remember the last
+    seen hash. Commits without a summary, e.g., merge commits, have no churn.
+
+    Args:
+        lines: output lines of git log
+
+    Returns:
+        generator of tuples (commit hash, (files changed, insertions,
+        deletions))
+
+    Test:
+    >>> list(parse_shortstat_log([
+    ...     "a1\\n", "\\n", " 1 file changed, 2 insertions(+)\\n", "b2\\n"]))
+    [('a1', (1, 2, 0)), ('b2', (0, 0, 0))]
+    """
+    current_hash: tp.Optional[str] = None
+    current_churn = (0, 0, 0)
+    for line in lines:
+        if not line.strip():
+            continue
+        if line.startswith(" "):
+            if current_hash is None:
+                raise ValueError(f"Summary line without commit: {line!r}")
+            current_churn = _parse_shortstat_line(line)
+            continue
+        if current_hash is not None:
+            yield current_hash, current_churn
+        current_hash = line.strip()
+        current_churn = (0, 0, 0)
+    if current_hash is not None:
+        yield current_hash, current_churn
+
+
+def _calc_commits_churn_with_git(
+    repo_path: str, commit_ids: tp.Sequence[pygit2.Oid],
+    churn_config: ChurnConfig
+) -> tp.Dict[pygit2.Oid, tp.Tuple[int, int, int]]:
+    """
+    Calculates the churn of commits with a single streamed ``git log`` process.
+
+    The commits are passed to git on stdin and its output is parsed while it
+    is produced, so memory does not grow with the length of the output.
+    """
+    churn: tp.Dict[pygit2.Oid,
+                   tp.Tuple[int, int,
+                            int]] = {oid: (0, 0, 0) for oid in commit_ids}
+    log_params = [
+        "-C", repo_path, "log", "--no-walk=unsorted", "--stdin", "--pretty=%H",
+        "--shortstat", "-l0"
+    ]
     if not churn_config.include_everything:
-        diff_base_params.append("--")
-        # builds a regex to select files that git includes into churn calc
-        diff_base_params = diff_base_params + \
-                           churn_config.get_extensions_repr('*.')
-
-    if revision_range:
-        stdout = repo_git(diff_base_params)
-        revs = repo_git(log_base_params).strip().split()
-    else:
-        stdout = repo_git(diff_base_params)
-        revs = repo_git(log_base_params).strip().split()
-    # initialize with 0 as otherwise commits without changes would be
-    # missing from the churn data
-    for rev in revs:
-        churn_values[rev] = (0, 0, 0)
-    for match in GIT_LOG_MATCHER.finditer(stdout):
-        commit_hash = match.group('hash')
+        log_params.append("--")
+        log_params.extend(churn_config.get_extensions_repr('*.'))
+
+    # stderr is written to a file, as a full stderr pipe would block git while
+    # stdout is read
+    with tempfile.TemporaryFile(mode="w+") as stderr_file:
+        # shortstat summaries are translated, so force the untranslated output
+        with git.with_env(LC_ALL="C")[log_params].popen(
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=stderr_file,
+            universal_newlines=True
+        ) as log_process:
+
+            def write_commits() -> None:
+                try:
+                    for oid in commit_ids:
+                        log_process.stdin.write(f"{oid}\n")
+                finally:
+                    log_process.stdin.close()
+
+            writer = threading.Thread(target=write_commits, daemon=True)
+            writer.start()
+            for commit_hash, commit_churn in parse_shortstat_log(
+                log_process.stdout
+            ):
+                churn[pygit2.Oid(hex=commit_hash)] = commit_churn
+            writer.join()
+
+        if log_process.returncode != 0:
+            stderr_file.seek(0)
+            raise ProcessExecutionError(["git"] + log_params,
+                                        log_process.returncode, "",
+                                        stderr_file.read())
+    return churn
+
+
+class CommitChurnStore():
+    """
+    Persistent store for the code churn of single commits.
+
+    The churn of every commit is stored as a fixed size record in an
+    append-only file, so only commits that were never seen before need to be
+    computed and a partially written record at the end of the file, e.g., from
+    an interrupted process, can be skipped safely.
 
-        def value_or_zero(match_result: tp.Any) -> int:
-            if match_result is not None:
-                return int(match_result)
-            return 0
+    Args:
+        store_path: path to the store file
+    """
+
+    RECORD_TYPE = np.dtype([("oid", np.uint8, (20,)), ("churn", "<i8", (3,))])
+
+    def __init__(self, store_path: Path) -> None:
+        self.__store_path = store_path
+        self.__churn: tp.Dict[bytes, tp.Tuple[int, int, int]] = {}
+        self.__read_offset = 0
+        self.__lock = threading.Lock()
+
+    @property
+    def store_path(self) -> Path:
+        """Path to the store file."""
+        return self.__store_path
 
-        files_changed = value_or_zero(match.group('files'))
-        insertions = value_or_zero(match.group('insertions'))
-        deletions = value_or_zero(match.group('deletions'))
-        churn_values[commit_hash] = (files_changed, insertions, deletions)
+    def __read_new_records(self) -> None:
+        """Read records that were appended since the last read."""
+        try:
+            with open(self.__store_path, "rb") as store_file:
+                store_file.seek(self.__read_offset)
+                data = store_file.read()
+        except FileNotFoundError:
+            return
+
+        num_records = len(data) // self.RECORD_TYPE.itemsize
+        records = np.frombuffer(data, dtype=self.RECORD_TYPE, count=num_records)
+        for oid, churn in zip(records["oid"], records["churn"].tolist()):
+            self.__churn[oid.tobytes()] = tuple(churn)
+        self.__read_offset += num_records * self.RECORD_TYPE.itemsize
+
+    def lookup(
+        self, oids: tp.Iterable[pygit2.Oid]
+    ) -> tp.Dict[pygit2.Oid, tp.Tuple[int, int, int]]:
+        """
+        Look up the stored churn of commits.
 
-    return churn_values
+        Args:
+            oids: ids of the commits
+
+        Returns:
+            dict from commit id to churn triple for all stored commits
+        """
+        with self.__lock:
+            self.__read_new_records()
+            found = {}
+            for oid in oids:
+                churn = self.__churn.get(oid.raw, None)
+                if churn is not None:
+                    found[oid] = churn
+            return found
+
+    def add(
+        self, churn: tp.Mapping[pygit2.Oid, tp.Tuple[int, int, int]]
+    ) -> None:
+        """
+        Add the churn of commits to the store.
+
+        Args:
+            churn: dict from commit id to churn triple
+        """
+        if not churn:
+            return
+
+        records = np.zeros(len(churn), dtype=self.RECORD_TYPE)
+        records["oid"] = np.frombuffer(
+            b"".join(oid.raw for oid in churn), dtype=np.uint8
+        ).reshape(-1, 20)
+        records["churn"] = np.array(list(churn.values()), dtype=np.int64)
+
+        with self.__lock:
+            self.__read_new_records()
+            self.__store_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.__store_path, "ab") as store_file:
+                if store_file.tell() % self.RECORD_TYPE.itemsize != 0:
+                    # drop a partially written record of an interrupted run
+                    store_file.truncate(
+                        store_file.tell() -
+                        store_file.tell() % self.RECORD_TYPE.itemsize
+                    )
+                store_file.write(records.tobytes())
+            for oid, commit_churn in churn.items():
+                self.__churn[oid.raw] = commit_churn
+
+
+_CHURN_STORES: tp.Dict[Path, CommitChurnStore] = {}
+_CHURN_STORES_LOCK = threading.Lock()
+
+
+def get_commit_churn_store(
+    repo_path: str, churn_config: ChurnConfig
+) -> CommitChurnStore:
+    """
+    Get the churn store for a repository and churn config.
+
+    Args:
+        repo_path: path to the git repository
+        churn_config: churn config the stored churn was computed with
+
+    Returns:
+        the churn store in the data cache
+    """
+    if churn_config.include_everything:
+        config_key = "all"
+    else:
+        config_key = "_".join(churn_config.get_extensions_repr())
+    store_path = Path(
+        str(vara_cfg()["data_cache"])
+    ) / "churn" / (f"{_get_repo_cache_name(repo_path)}-{config_key}.churn")
+
+    with _CHURN_STORES_LOCK:
+        if store_path not in _CHURN_STORES:
+            _CHURN_STORES[store_path] = CommitChurnStore(store_path)
+        return _CHURN_STORES[store_path]
 
 
 def calc_code_churn_range(
@@ -408,6 +1044,10 @@ def calc_code_churn_range(
     [start..end]. If no range is supplied, the churn values of all commits are
     calculated.
 
+    The churn of every commit is kept in a :class:`CommitChurnStore` in the
+    data cache, so only commits that were not seen before are calculated with
+    one streamed ``git log --shortstat`` process.
+
     Args:
         repo: git repository
         churn_config: churn config to customize churn generation
@@ -417,12 +1057,38 @@ def calc_code_churn_range(
         (files changed, insertions, deletions)
     """
     churn_config = ChurnConfig.init_as_default_if_none(churn_config)
-    return __calc_code_churn_range_impl(
-        repo.path if isinstance(repo, pygit2.Repository) else repo,
-        churn_config, start_range.id
-        if isinstance(start_range, pygit2.Commit) else start_range,
-        end_range.id if isinstance(end_range, pygit2.Commit) else end_range
-    )
+    if not isinstance(repo, pygit2.Repository):
+        repo = pygit2.Repository(repo)
+
+    def resolve_commit(commit: tp.Union[pygit2.Commit, str]) -> pygit2.Commit:
+        if isinstance(commit, pygit2.Commit):
+            return commit
+        return repo.revparse_single(commit).peel(pygit2.Commit)
+
+    end_commit = resolve_commit(end_range if end_range else "HEAD")
+    walker = repo.walk(end_commit.id, pygit2.GIT_SORT_TIME)
+    if start_range is not None:
+        for parent_id in resolve_commit(start_range).parent_ids[:1]:
+            walker.hide(parent_id)
+    commit_ids = [commit.id for commit in walker]
+
+    store: tp.Optional[CommitChurnStore] = None
+    if vara_cfg()["caching"]["churn_store"].value:
+        store = get_commit_churn_store(repo.path, churn_config)
+        stored_churn = store.lookup(commit_ids)
+    else:
+        stored_churn = {}
+
+    missing_ids = [oid for oid in commit_ids if oid not in stored_churn]
+    if missing_ids:
+        missing_churn = _calc_commits_churn_with_git(
+            repo.path, missing_ids, churn_config
+        )
+        if store is not None:
+            store.add(missing_churn)
+        stored_churn.update(missing_churn)
+
+    return {str(oid): stored_churn[oid] for oid in commit_ids}
 
 
 def calc_commit_code_churn(
@@ -442,8 +1108,7 @@ def calc_commit_code_churn(
         (files changed, insertions, deletions)
     """
     churn_config = ChurnConfig.init_as_default_if_none(churn_config)
-    return calc_code_churn_range(repo, churn_config, commit,
-                                 commit)[str(commit.id)]
+    return _calc_commit_churn(repo, commit, churn_config)
 
 
 def calc_code_churn(
@@ -466,36 +1131,7 @@ def calc_code_churn(
         (files changed, insertions, deletions)
     """
     churn_config = ChurnConfig.init_as_default_if_none(churn_config)
-    repo_git = git["-C", repo.path]
-    diff_base_params = [
-        "diff", "--shortstat", "-l0",
-        str(commit_a.id),
-        str(commit_b.id)
-    ]
-
-    if not churn_config.include_everything:
-        diff_base_params.append("--")
-        # builds a regex to select files that git includes into churn calc
-        diff_base_params = diff_base_params + \
-                           churn_config.get_extensions_repr('*.')
-
-    stdout = repo_git(diff_base_params)
-    # initialize with 0 as otherwise commits without changes would be
-    # missing from the churn data
-    match = GIT_DIFF_MATCHER.match(stdout)
-    if match:
-
-        def value_or_zero(match_result: tp.Any) -> int:
-            if match_result is not None:
-                return int(match_result)
-            return 0
-
-        files_changed = value_or_zero(match.group('files'))
-        insertions = value_or_zero(match.group('insertions'))
-        deletions = value_or_zero(match.group('deletions'))
-        return files_changed, insertions, deletions
-
-    return 0, 0, 0
+    return _calc_commit_pair_churn(repo, commit_a, commit_b, churn_config)
 
 
 def calc_repo_code_churn(
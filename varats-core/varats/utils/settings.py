@@ -146,6 +146,102 @@ _CFG['experiment'] = {
     },
 }
 
+_CFG['caching'] = {
+    "report_sidecars": {
+        "default": False,
+        "desc":
+            "Store parsed reports as binary sidecar files in the data cache "
+            "to speed up reloading them."
+    },
+    "data_manager_file_size_budget": {
+        "default": 2048,
+        "desc":
+            "Total size on disk (in MiB) of the loaded files the DataManager "
+            "keeps. Least recently used files are evicted when the budget is "
+            "exceeded. Loaded files usually need more memory than their file "
+            "size. A budget of 0 disables the limit."
+    },
+    "data_manager_key_mode": {
+        "default": "identity",
+        "desc":
+            "How the DataManager identifies loaded files: 'identity' uses "
+            "path, inode, size, and modification time, 'checksum' uses the "
+            "sha256 hash of the file content, which is computed once per file "
+            "version and stored in the data cache."
+    },
+    "cache_build_workers": {
+        "default": 1,
+        "desc":
+            "Number of worker processes used to create missing or outdated "
+            "entries of cached report tables. 1 creates entries sequentially."
+    },
+    "cache_build_checkpoint_interval": {
+        "default": 50,
+        "desc":
+            "Number of newly created entries after which a cached report "
+            "table is written to disk while it is built. 0 disables "
+            "checkpoints."
+    },
+    "storage_format": {
+        "default": "csv",
+        "desc":
+            "File format of cached report tables in the data cache: 'csv', "
+            "'parquet', or 'feather'. Parquet and feather preserve column "
+            "types and require pyarrow. Existing cache files are migrated to "
+            "the selected format when they are loaded."
+    },
+    "segmented_report_tables": {
+        "default": False,
+        "desc":
+            "Store cached report tables as immutable segments plus a manifest, "
+            "so that adding, updating, or dropping entries only writes the "
+            "changed entries. Segmented tables can be compacted with "
+            "compact_cached_report_table."
+    },
+    "commit_map_cache": {
+        "default": True,
+        "desc":
+            "Cache generated commit maps in the data cache. Cached maps are "
+            "reused as long as the analyzed revisions did not change and are "
+            "extended with new commits when the repository HEAD moved forward."
+    },
+    "churn_store": {
+        "default": True,
+        "desc":
+            "Store the code churn of every analyzed commit in the data cache, "
+            "so that churn is only calculated for commits that were not seen "
+            "before."
+    },
+    "commit_metadata_cache_size": {
+        "default": 500000,
+        "desc":
+            "Maximal number of commits whose metadata, i.e., author, commit "
+            "time, and parents, is kept in memory for commit lookups. 0 "
+            "disables the limit."
+    },
+    "commit_metadata_table": {
+        "default": False,
+        "desc":
+            "Store the metadata of looked up commits in a table per "
+            "repository in the data cache, so that it does not need to be "
+            "read from git again."
+    },
+    "query_cache_memory_budget": {
+        "default": 1024,
+        "desc":
+            "Approximate amount of memory (in MiB) used to keep the results of "
+            "evaluation database queries, so that repeated queries do not load "
+            "the same cache files again. A budget of 0 disables the limit."
+    },
+    "blocked_revision_index": {
+        "default": True,
+        "desc":
+            "Resolve the blocked revisions of a project once and store them in "
+            "the data cache, so that checking if a revision is blocked does "
+            "not need to walk the git history again."
+    },
+}
+
 _CFG['plots'] = {
     "plot_dir": {
         "desc": "Folder for generated plots",
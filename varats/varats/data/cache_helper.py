@@ -1,7 +1,14 @@
 """Utility functions and class to allow easier caching of pandas dataframes and
 other data."""
+import abc
+import csv
+import importlib.util
 import logging
+import multiprocessing
+import os
 import typing as tp
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 import pandas as pd
@@ -14,7 +21,159 @@ CACHE_ID_COL = 'cache_revision'
 CACHE_TIMESTAMP_COL = 'cache_timestamp'
 
 
-def get_data_file_path(data_id: str, project_name: str) -> Path:
+class CacheStorageBackend(abc.ABC):
+    """Storage format for cached dataframes."""
+
+    NAME: str
+    FILE_EXTENSION: str
+
+    @staticmethod
+    def is_available() -> bool:
+        """Check whether all libraries required by this backend are
+        installed."""
+        return True
+
+    @abc.abstractmethod
+    def load(
+        self,
+        file_path: Path,
+        columns: tp.Optional[tp.List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Load a cached dataframe.
+
+        Args:
+            file_path: path to the cache file
+            columns: if given, only load these columns
+
+        Returns:
+            the loaded dataframe
+        """
+
+    @abc.abstractmethod
+    def store(self, file_path: Path, dataframe: pd.DataFrame) -> None:
+        """
+        Store a dataframe in a cache file.
+
+        Args:
+            file_path: path to the cache file
+            dataframe: pandas dataframe to store
+        """
+
+
+class CSVCacheStorage(CacheStorageBackend):
+    """Stores cached dataframes as gzip compressed csv files."""
+
+    NAME = "csv"
+    FILE_EXTENSION = "csv.gz"
+
+    def load(
+        self,
+        file_path: Path,
+        columns: tp.Optional[tp.List[str]] = None
+    ) -> pd.DataFrame:
+        dataframe = pd.read_csv(
+            str(file_path), index_col=0, compression='infer'
+        )
+        if columns is not None:
+            return dataframe[columns]
+        return dataframe
+
+    def store(self, file_path: Path, dataframe: pd.DataFrame) -> None:
+        dataframe.to_csv(str(file_path), compression='infer')
+
+
+class ParquetCacheStorage(CacheStorageBackend):
+    """Stores cached dataframes as parquet files, which preserves dtypes and
+    allows to load only selected columns."""
+
+    NAME = "parquet"
+    FILE_EXTENSION = "parquet"
+
+    @staticmethod
+    def is_available() -> bool:
+        return importlib.util.find_spec("pyarrow") is not None
+
+    def load(
+        self,
+        file_path: Path,
+        columns: tp.Optional[tp.List[str]] = None
+    ) -> pd.DataFrame:
+        return pd.read_parquet(str(file_path), columns=columns)
+
+    def store(self, file_path: Path, dataframe: pd.DataFrame) -> None:
+        dataframe.to_parquet(str(file_path))
+
+
+class FeatherCacheStorage(CacheStorageBackend):
+    """
+    Stores cached dataframes as feather files, which preserves dtypes and
+    allows to load only selected columns.
+
+    Feather files do not support custom indices, so the index of a dataframe is
+    not stored.
+    """
+
+    NAME = "feather"
+    FILE_EXTENSION = "feather"
+
+    @staticmethod
+    def is_available() -> bool:
+        return importlib.util.find_spec("pyarrow") is not None
+
+    def load(
+        self,
+        file_path: Path,
+        columns: tp.Optional[tp.List[str]] = None
+    ) -> pd.DataFrame:
+        return pd.read_feather(str(file_path), columns=columns)
+
+    def store(self, file_path: Path, dataframe: pd.DataFrame) -> None:
+        dataframe.reset_index(drop=True).to_feather(str(file_path))
+
+
+_STORAGE_BACKENDS: tp.Dict[str, CacheStorageBackend] = {
+    backend.NAME: backend for backend in
+    [CSVCacheStorage(),
+     ParquetCacheStorage(),
+     FeatherCacheStorage()]
+}
+
+
+def get_storage_backend() -> CacheStorageBackend:
+    """
+    Get the storage backend selected by ``vara_cfg()["caching"]
+    ["storage_format"]``.
+
+    Falls back to csv files if the libraries required by the selected backend
+    are not installed.
+
+    Returns:
+        the storage backend for cached dataframes
+    """
+    storage_format = str(vara_cfg()["caching"]["storage_format"])
+    if storage_format not in _STORAGE_BACKENDS:
+        raise ValueError(
+            f"Unknown cache storage format '{storage_format}'. Available "
+            f"formats: {', '.join(_STORAGE_BACKENDS)}"
+        )
+
+    backend = _STORAGE_BACKENDS[storage_format]
+    if not backend.is_available():
+        LOG.warning(
+            f"Cache storage format '{storage_format}' requires pyarrow, "
+            "falling back to csv."
+        )
+        return _STORAGE_BACKENDS[CSVCacheStorage.NAME]
+
+    return backend
+
+
+def get_data_file_path(
+    data_id: str,
+    project_name: str,
+    backend: tp.Optional[CacheStorageBackend] = None
+) -> Path:
     """
     Compose the identifier and project into a file path that points to the
     corresponding cache file in the cache directory.
@@ -22,39 +181,87 @@ def get_data_file_path(data_id: str, project_name: str) -> Path:
     Args:
         data_id: identifier or identifier_name of the dataframe
         project_name: name of the project
+        backend: storage backend of the cache file; defaults to the configured
+                 backend
 
     Test:
     >>> str(get_data_file_path("foo", "tmux"))
     'data_cache/foo-tmux.csv.gz'
 
+    >>> str(get_data_file_path("foo", "tmux", ParquetCacheStorage()))
+    'data_cache/foo-tmux.parquet'
+
     >>> isinstance(get_data_file_path("foo.csv", "tmux"), Path)
     True
     """
+    if backend is None:
+        backend = get_storage_backend()
+
     return Path(
         str(vara_cfg()["data_cache"])
-    ) / f"{data_id}-{project_name}.csv.gz"
+    ) / f"{data_id}-{project_name}.{backend.FILE_EXTENSION}"
+
+
+def __find_cache_file_to_migrate(
+    data_id: str, project_name: str, backend: CacheStorageBackend
+) -> tp.Optional[tp.Tuple[Path, CacheStorageBackend]]:
+    """Find a cache file that was stored with a different backend or as
+    uncompressed csv file."""
+    csv_backend = _STORAGE_BACKENDS[CSVCacheStorage.NAME]
+    csv_file_path = get_data_file_path(data_id, project_name, csv_backend)
+    candidates = [
+        (
+            get_data_file_path(data_id, project_name,
+                               other_backend), other_backend
+        )
+        for other_backend in _STORAGE_BACKENDS.values()
+        if other_backend is not backend and other_backend.is_available()
+    ]
+    # uncompressed files from before cache file compression was introduced
+    candidates.append((Path(str(csv_file_path)[:-3]), csv_backend))
+
+    for candidate in candidates:
+        if candidate[0].exists():
+            return candidate
+    return None
 
 
-def load_cached_df_or_none(data_id: str,
-                           project_name: str) -> tp.Optional[pd.DataFrame]:
+def load_cached_df_or_none(
+    data_id: str,
+    project_name: str,
+    columns: tp.Optional[tp.List[str]] = None
+) -> tp.Optional[pd.DataFrame]:
     """
     Load cached dataframe from disk, otherwise return None.
 
+    Cache files that were stored in another format are transparently migrated
+    to the configured storage format.
+
     Args:
         data_id: identifier or identifier_name of the dataframe
         project_name: name of the project
+        columns: if given, only load these columns
     """
+    backend = get_storage_backend()
+    file_path = get_data_file_path(data_id, project_name, backend)
+    if file_path.exists():
+        return backend.load(file_path, columns)
 
-    file_path = get_data_file_path(data_id, project_name)
-    if not file_path.exists():
-        # fall back to uncompressed file if present for seamless migration
-        # to cache file compression
-        if Path(str(file_path)[:-3]).exists():
-            file_path = Path(str(file_path)[:-3])
-        else:
-            return None
+    cache_file_to_migrate = __find_cache_file_to_migrate(
+        data_id, project_name, backend
+    )
+    if cache_file_to_migrate is None:
+        return None
+
+    old_file_path, old_backend = cache_file_to_migrate
+    LOG.info(f"Migrating cache file {old_file_path} to {file_path}")
+    dataframe = old_backend.load(old_file_path)
+    backend.store(file_path, dataframe)
+    old_file_path.unlink()
 
-    return pd.read_csv(str(file_path), index_col=0, compression='infer')
+    if columns is not None:
+        return dataframe[columns]
+    return dataframe
 
 
 def cache_dataframe(
@@ -68,17 +275,246 @@ def cache_dataframe(
         project_name: name of the project
         dataframe: pandas dataframe to store
     """
-    file_path = get_data_file_path(data_id, project_name)
-    dataframe.to_csv(str(file_path), compression='infer')
+    backend = get_storage_backend()
+    backend.store(get_data_file_path(data_id, project_name, backend), dataframe)
+
+
+class SegmentedReportTable():
+    """
+    Cached report table that is stored as a set of immutable segments.
+
+    Each batch of new or updated entries is written to a new segment file. An
+    append-only manifest records for every entry, i.e., every
+    ``cache_revision``, its ``cache_timestamp`` and the segment that holds its
+    current rows; dropped entries are recorded with an empty segment. Adding,
+    replacing, or dropping entries, therefore, only writes the changed
+    entries. Rows that were replaced or dropped stay in their old segments
+    until the table is :func:`compacted<SegmentedReportTable.compact>`.
+
+    Args:
+        data_id: identifier or identifier_name of the dataframe
+        project_name: name of the project
+    """
+
+    MANIFEST_FILE_NAME = "manifest.csv"
+    __MANIFEST_SEGMENT_COL = "segment"
+
+    def __init__(self, data_id: str, project_name: str) -> None:
+        self.__data_id = data_id
+        self.__project_name = project_name
+
+    @property
+    def path(self) -> Path:
+        """Directory that contains the segments and the manifest."""
+        return Path(
+            str(vara_cfg()["data_cache"])
+        ) / f"{self.__data_id}-{self.__project_name}.segments"
+
+    @property
+    def manifest_path(self) -> Path:
+        """Path to the manifest file."""
+        return self.path / self.MANIFEST_FILE_NAME
+
+    def exists(self) -> bool:
+        """Check whether the table was already created."""
+        return self.manifest_path.exists()
+
+    def __read_manifest(self) -> tp.List[tp.Tuple[str, str, str]]:
+        if not self.exists():
+            return []
+
+        with open(self.manifest_path, "r", newline="") as manifest_file:
+            reader = csv.reader(manifest_file)
+            next(reader)  # skip header
+            return [(row[0], row[1], row[2]) for row in reader]
+
+    def __append_to_manifest(
+        self,
+        records: tp.Iterable[tp.Tuple[str, str, str]],
+        manifest_path: tp.Optional[Path] = None
+    ) -> None:
+        if manifest_path is None:
+            manifest_path = self.manifest_path
+        self.path.mkdir(parents=True, exist_ok=True)
+        write_header = not manifest_path.exists()
+        with open(manifest_path, "a", newline="") as manifest_file:
+            writer = csv.writer(manifest_file)
+            if write_header:
+                writer.writerow([
+                    CACHE_ID_COL, CACHE_TIMESTAMP_COL,
+                    self.__MANIFEST_SEGMENT_COL
+                ])
+            writer.writerows(records)
+
+    def entries(self) -> tp.Dict[str, tp.Tuple[str, str]]:
+        """
+        Current entries of the table.
+
+        Returns:
+            a mapping from ``cache_revision`` to the ``cache_timestamp`` and the
+            segment of the entry
+        """
+        current_entries: tp.Dict[str, tp.Tuple[str, str]] = {}
+        for entry_id, timestamp, segment in self.__read_manifest():
+            if segment:
+                current_entries[entry_id] = (timestamp, segment)
+            else:
+                current_entries.pop(entry_id, None)
+        return current_entries
+
+    def load(
+        self,
+        columns: tp.Optional[tp.List[str]] = None
+    ) -> tp.Optional[pd.DataFrame]:
+        """
+        Load the current rows of the table.
+
+        Args:
+            columns: if given, only load these columns
+
+        Returns:
+            the table, or ``None`` if it does not exist
+        """
+        if not self.exists():
+            return None
+
+        entries_per_segment: tp.Dict[str, tp.Set[str]] = defaultdict(set)
+        for entry_id, (_, segment) in self.entries().items():
+            entries_per_segment[segment].add(entry_id)
+
+        load_columns = columns
+        if columns is not None and CACHE_ID_COL not in columns:
+            load_columns = columns + [CACHE_ID_COL]
+
+        segment_dfs = []
+        for segment in sorted(entries_per_segment):
+            segment_df = _get_backend_for_file(segment).load(
+                self.path / segment, load_columns
+            )
+            segment_dfs.append(
+                segment_df[segment_df[CACHE_ID_COL].astype(str).isin(
+                    entries_per_segment[segment]
+                )]
+            )
+
+        if not segment_dfs:
+            return None
+
+        table = pd.concat(segment_dfs, ignore_index=True, sort=False)
+        if columns is not None:
+            return table[columns]
+        return table
+
+    def __write_segment(
+        self, dataframe: pd.DataFrame
+    ) -> tp.List[tp.Tuple[str, str, str]]:
+        """Write a new segment and return the manifest records of its
+        entries."""
+        backend = get_storage_backend()
+        self.path.mkdir(parents=True, exist_ok=True)
+        # segments are written before they are referenced in the manifest, so
+        # all used segment numbers can be found in the directory
+        last_segment_number = max((
+            int(segment_file.name.split(".")[0][len("segment-"):])
+            for segment_file in self.path.glob("segment-*")
+        ),
+                                  default=-1)
+        segment = f"segment-{last_segment_number + 1:06d}." \
+                  f"{backend.FILE_EXTENSION}"
+        backend.store(self.path / segment, dataframe)
+
+        entries = dataframe[[CACHE_ID_COL, CACHE_TIMESTAMP_COL
+                            ]].drop_duplicates(subset=CACHE_ID_COL)
+        return [(str(entry_id), str(timestamp), segment)
+                for entry_id, timestamp in entries.itertuples(index=False)]
+
+    def append_segment(self, dataframe: pd.DataFrame) -> None:
+        """
+        Store a batch of new or updated entries in a new segment.
+
+        All rows of an entry must be part of the same batch, as the rows of the
+        entry in older segments are replaced.
+
+        Args:
+            dataframe: rows of the new or updated entries
+        """
+        if dataframe.empty:
+            return
+
+        self.__append_to_manifest(self.__write_segment(dataframe))
+
+    def drop_entries(self, entry_ids: tp.Iterable[str]) -> None:
+        """
+        Remove entries from the table.
+
+        Args:
+            entry_ids: ``cache_revision`` values of the entries to remove
+        """
+        self.__append_to_manifest([
+            (str(entry_id), "", "") for entry_id in entry_ids
+        ])
+
+    def compact(self) -> None:
+        """Rewrite the table into a single segment and remove all replaced or
+        dropped rows."""
+        table = self.load()
+        old_segment_files = list(self.path.glob("segment-*"))
+
+        records: tp.List[tp.Tuple[str, str, str]] = []
+        if table is not None and not table.empty:
+            records = self.__write_segment(table)
+
+        # replace the manifest atomically, so it never references removed
+        # segments
+        new_manifest_path = self.path / f"{self.MANIFEST_FILE_NAME}.tmp"
+        if new_manifest_path.exists():
+            new_manifest_path.unlink()
+        self.__append_to_manifest(records, new_manifest_path)
+        os.replace(new_manifest_path, self.manifest_path)
+
+        for segment_file in old_segment_files:
+            segment_file.unlink()
+
+
+def _get_backend_for_file(
+    file_path: tp.Union[Path, str]
+) -> CacheStorageBackend:
+    for backend in _STORAGE_BACKENDS.values():
+        if str(file_path).endswith(f".{backend.FILE_EXTENSION}"):
+            return backend
+    raise ValueError(f"Unknown cache file format: {file_path}")
+
+
+def _use_segmented_report_tables() -> bool:
+    return bool(vara_cfg()["caching"]["segmented_report_tables"].value)
+
+
+def compact_cached_report_table(data_id: str, project_name: str) -> None:
+    """
+    Compact a segmented cached report table by rewriting it into a single
+    segment.
+
+    Args:
+        data_id: identifier or identifier_name of the dataframe
+        project_name: name of the project
+    """
+    table = SegmentedReportTable(data_id, project_name)
+    if table.exists():
+        table.compact()
 
 
 InDataType = tp.TypeVar("InDataType")
+CreateCacheEntryDataTy = tp.Callable[[InDataType], tp.Tuple[pd.DataFrame, str,
+                                                            str]]
+
+# Function that creates cache entries in worker processes. Cache entry
+# functions are usually closures that cannot be pickled, so they are passed to
+# forked workers through this global.
+_WORKER_CREATE_CACHE_ENTRY_DATA: tp.Optional[CreateCacheEntryDataTy] = None
 
 
 def __create_cache_entry(
-    create_df_from_report: tp.Callable[[InDataType], tp.Tuple[pd.DataFrame, str,
-                                                              str]],
-    data: InDataType
+    create_df_from_report: CreateCacheEntryDataTy, data: InDataType
 ) -> pd.DataFrame:
     new_df, entry_id, entry_timestamp = create_df_from_report(data)
     new_df[CACHE_ID_COL] = entry_id
@@ -86,12 +522,77 @@ def __create_cache_entry(
     return new_df
 
 
+def _create_cache_entry_in_worker(data: InDataType) -> pd.DataFrame:
+    if _WORKER_CREATE_CACHE_ENTRY_DATA is None:
+        raise AssertionError("Worker was not initialized.")
+    return __create_cache_entry(_WORKER_CREATE_CACHE_ENTRY_DATA, data)
+
+
+def _get_num_cache_workers() -> int:
+    num_workers = int(vara_cfg()["caching"]["cache_build_workers"].value)
+    if num_workers > 1 and \
+            "fork" not in multiprocessing.get_all_start_methods():
+        LOG.warning(
+            "Building cache entries in parallel requires the 'fork' start "
+            "method. Falling back to sequential execution."
+        )
+        return 1
+    return max(num_workers, 1)
+
+
+def __create_cache_entries_sequentially(
+    create_cache_entry_data: CreateCacheEntryDataTy,
+    entries: tp.List[InDataType]
+) -> tp.Iterator[tp.Tuple[int, pd.DataFrame]]:
+    for idx, data_entry in enumerate(entries):
+        yield idx, __create_cache_entry(create_cache_entry_data, data_entry)
+
+
+def __create_cache_entries_in_parallel(
+    create_cache_entry_data: CreateCacheEntryDataTy,
+    entries: tp.List[InDataType], num_workers: int
+) -> tp.Iterator[tp.Tuple[int, pd.DataFrame]]:
+    # pylint: disable=global-statement
+    global _WORKER_CREATE_CACHE_ENTRY_DATA
+    _WORKER_CREATE_CACHE_ENTRY_DATA = create_cache_entry_data
+    try:
+        with ProcessPoolExecutor(
+            max_workers=num_workers,
+            mp_context=multiprocessing.get_context("fork")
+        ) as executor:
+            futures = {
+                executor.submit(_create_cache_entry_in_worker, data_entry): idx
+                for idx, data_entry in enumerate(entries)
+            }
+            try:
+                for future in as_completed(futures):
+                    yield futures[future], future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+    finally:
+        _WORKER_CREATE_CACHE_ENTRY_DATA = None
+
+
+def __merge_cache_entries(
+    cached_df: pd.DataFrame, created_data_frames: tp.List[pd.DataFrame]
+) -> pd.DataFrame:
+    """Replace the rows of all created entries in the cached dataframe."""
+    created_ids: tp.Set[str] = set()
+    for created_df in created_data_frames:
+        created_ids.update(created_df[CACHE_ID_COL])
+
+    return pd.concat([cached_df[~cached_df[CACHE_ID_COL].isin(created_ids)]] +
+                     created_data_frames,
+                     ignore_index=True,
+                     sort=False)
+
+
 def build_cached_report_table(
     data_id: str, project_name: str, data_to_load: tp.List[InDataType],
     data_to_drop: tp.List[InDataType],
     create_empty_df: tp.Callable[[], pd.DataFrame],
-    create_cache_entry_data: tp.Callable[[InDataType], tp.Tuple[pd.DataFrame,
-                                                                str, str]],
+    create_cache_entry_data: CreateCacheEntryDataTy,
     get_entry_id: tp.Callable[[InDataType], str],
     get_entry_timestamp: tp.Callable[[InDataType], str],
     is_newer_timestamp: tp.Callable[[str, str], bool]
@@ -99,6 +600,16 @@ def build_cached_report_table(
     """
     Build up an automatically cache dataframe.
 
+    Missing and outdated entries are created in parallel worker processes if
+    ``vara_cfg()["caching"]["cache_build_workers"]`` is greater than 1. While
+    entries are created, the cache file is checkpointed every
+    ``vara_cfg()["caching"]["cache_build_checkpoint_interval"]`` entries and
+    when creating an entry fails, so already created entries are not lost.
+
+    If ``vara_cfg()["caching"]["segmented_report_tables"]`` is set, the table
+    is stored as a :class:`SegmentedReportTable`, so only new, updated, and
+    dropped entries are written.
+
     Args:
         data_id: graph cache identifier
         project_name: name of the project to work with
@@ -113,8 +624,20 @@ def build_cached_report_table(
                             based on their timestamps
     """
 
+    segmented_table: tp.Optional[SegmentedReportTable] = None
+    if _use_segmented_report_tables():
+        segmented_table = SegmentedReportTable(data_id, project_name)
+        if not segmented_table.exists():
+            # import an existing monolithic cache file as first segment
+            monolithic_df = load_cached_df_or_none(data_id, project_name)
+            if monolithic_df is not None:
+                segmented_table.append_segment(monolithic_df)
+                get_data_file_path(data_id, project_name).unlink()
+        optional_cached_df = segmented_table.load()
+    else:
+        optional_cached_df = load_cached_df_or_none(data_id, project_name)
+
     # mypy needs this
-    optional_cached_df = load_cached_df_or_none(data_id, project_name)
     if optional_cached_df is None:
         cached_df = create_empty_df()
         cached_df[CACHE_ID_COL] = ""
@@ -122,59 +645,106 @@ def build_cached_report_table(
     else:
         cached_df = optional_cached_df
 
+    # index the timestamp of the first row of every cached entry, so that
+    # classifying data items does not need to scan the whole cached table
+    cached_entries = cached_df.drop_duplicates(subset=CACHE_ID_COL)
+    cached_timestamps: tp.Dict[tp.Any, tp.Any] = dict(
+        zip(cached_entries[CACHE_ID_COL], cached_entries[CACHE_TIMESTAMP_COL])
+    )
+
     def is_missing_file(report_file: InDataType) -> bool:
-        return not tp.cast(
-            bool, (cached_df[CACHE_ID_COL] == get_entry_id(report_file)).any()
-        )
+        return get_entry_id(report_file) not in cached_timestamps
 
     def is_newer_file(report_file: InDataType) -> bool:
-        cached_entry = cached_df[cached_df[CACHE_ID_COL] ==
-                                 get_entry_id(report_file)][CACHE_TIMESTAMP_COL]
-
-        if len(cached_entry) > 0:
+        entry_id = get_entry_id(report_file)
+        if entry_id in cached_timestamps:
             return is_newer_timestamp(
-                get_entry_timestamp(report_file), cached_entry.iloc[0]
+                get_entry_timestamp(report_file), cached_timestamps[entry_id]
             )
         # We found no existing entry, so it will never be considered for
         # updating and does not need to be deleted.
         return False
 
-    missing_entries = [
-        entry for entry in data_to_load if is_missing_file(entry)
-    ]
-
-    updated_entries = [entry for entry in data_to_load if is_newer_file(entry)]
+    missing_entries = []
+    updated_entries = []
+    for entry in data_to_load:
+        if is_missing_file(entry):
+            missing_entries.append(entry)
+        elif is_newer_file(entry):
+            updated_entries.append(entry)
 
     failed_entries = [
         get_entry_id(entry) for entry in data_to_drop if is_newer_file(entry)
     ]
 
-    new_data_frames = []
-    for num, data_entry in enumerate(missing_entries):
-        LOG.info(
-            f"Creating missing entry ({(num + 1)}/"
-            f"{len(missing_entries)}): {data_entry}"
-        )
-        new_data_frames.append(
-            __create_cache_entry(create_cache_entry_data, data_entry)
+    # missing entries come first, so indices >= len(missing_entries) refer to
+    # updated entries
+    entries_to_create = missing_entries + updated_entries
+    created_data_frames: tp.Dict[int, pd.DataFrame] = {}
+    unsaved_entries: tp.List[int] = []
+
+    def merge_created_entries() -> pd.DataFrame:
+        return __merge_cache_entries(
+            cached_df, [df for _, df in sorted(created_data_frames.items())]
         )
 
-    new_df = pd.concat([cached_df] + new_data_frames,
-                       ignore_index=True,
-                       sort=False)
+    def save_created_entries() -> None:
+        if segmented_table is not None:
+            if unsaved_entries:
+                segmented_table.append_segment(
+                    pd.concat([
+                        created_data_frames[idx]
+                        for idx in sorted(unsaved_entries)
+                    ],
+                              ignore_index=True,
+                              sort=False)
+                )
+        else:
+            cache_dataframe(data_id, project_name, merge_created_entries())
+        unsaved_entries.clear()
 
-    new_df.set_index(CACHE_ID_COL, inplace=True)
-    for num, data_entry in enumerate(updated_entries):
-        LOG.info(
-            f"Updating outdated entry "
-            f"({(num + 1)}/{len(updated_entries)}): {data_entry}"
+    num_workers = _get_num_cache_workers()
+    if num_workers > 1 and len(entries_to_create) > 1:
+        created_entries = __create_cache_entries_in_parallel(
+            create_cache_entry_data, entries_to_create, num_workers
         )
-        updated_entry = __create_cache_entry(
-            create_cache_entry_data, data_entry
+    else:
+        created_entries = __create_cache_entries_sequentially(
+            create_cache_entry_data, entries_to_create
         )
-        updated_entry.set_index(CACHE_ID_COL, inplace=True)
-        new_df.update(updated_entry)
-    new_df.reset_index(inplace=True)
+
+    checkpoint_interval = int(
+        vara_cfg()["caching"]["cache_build_checkpoint_interval"].value
+    )
+    try:
+        for idx, created_df in created_entries:
+            if idx < len(missing_entries):
+                LOG.info(
+                    f"Created missing entry ({len(created_data_frames) + 1}/"
+                    f"{len(entries_to_create)}): {entries_to_create[idx]}"
+                )
+            else:
+                LOG.info(
+                    f"Updated outdated entry ({len(created_data_frames) + 1}/"
+                    f"{len(entries_to_create)}): {entries_to_create[idx]}"
+                )
+            created_data_frames[idx] = created_df
+            unsaved_entries.append(idx)
+
+            if checkpoint_interval > 0 and \
+                    len(created_data_frames) % checkpoint_interval == 0 and \
+                    len(created_data_frames) < len(entries_to_create):
+                save_created_entries()
+    except BaseException:
+        if created_data_frames:
+            LOG.warning(
+                f"Creating cache entries failed, storing "
+                f"{len(created_data_frames)} already created entries."
+            )
+            save_created_entries()
+        raise
+
+    new_df = merge_created_entries()
 
     if len(failed_entries) > 0:
         LOG.info(f"Dropping {len(failed_entries)} entries")
@@ -183,7 +753,12 @@ def build_cached_report_table(
             inplace=True
         )
 
-    cache_dataframe(data_id, project_name, new_df)
+    if segmented_table is not None:
+        save_created_entries()
+        if failed_entries:
+            segmented_table.drop_entries(failed_entries)
+    else:
+        cache_dataframe(data_id, project_name, new_df)
 
     return new_df.loc[:, [
         col for col in new_df.columns
@@ -9,14 +9,20 @@ like in jupyter notebooks, where we sometimes re-execute triggers a file load.
 """
 
 import hashlib
+import logging
 import os
 import typing as tp
+from collections import OrderedDict
+from concurrent.futures import Future
 from pathlib import Path
 from threading import Lock
 
 from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
 
 from varats.report.report import BaseReport
+from varats.utils.settings import vara_cfg
+
+LOG = logging.getLogger(__name__)
 
 LoadableType = tp.TypeVar('LoadableType', bound=BaseReport)
 
@@ -40,6 +46,94 @@ def sha256_checksum(file_path: Path, block_size: int = 65536) -> str:
     return sha256.hexdigest()
 
 
+def file_identity_key(file_path: Path) -> str:
+    """
+    Compute a cheap key that identifies a specific version of a file.
+
+    The key is based on the file's location, inode, size, and modification
+    time, so it changes whenever the file is replaced or modified, without
+    reading the file content.
+
+    Args:
+        file_path: path to the file
+
+    Returns:
+        identity key of the file
+    """
+    stat = os.stat(file_path)
+    return f"{os.path.realpath(file_path)}:{stat.st_ino}:" \
+           f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+class ChecksumIndex():
+    """
+    Persistent index that maps file identity keys to sha256 checksums, so that
+    the content hash of a file is only computed once per file version.
+
+    The index is an append-only text file where each line contains an identity
+    key and the corresponding checksum, separated by a tab.
+
+    Args:
+        index_path: path to the index file, defaults to a file in the
+                    ``data_cache``
+    """
+
+    def __init__(self, index_path: tp.Optional[Path] = None) -> None:
+        self.__index_path = index_path
+        self.__checksums: tp.Optional[tp.Dict[str, str]] = None
+        self.__lock = Lock()
+
+    @property
+    def index_path(self) -> Path:
+        """Path to the index file."""
+        if self.__index_path is not None:
+            return self.__index_path
+
+        return Path(str(vara_cfg()["data_cache"])) / "file_checksum_index.txt"
+
+    def __load(self) -> tp.Dict[str, str]:
+        if self.__checksums is None:
+            self.__checksums = {}
+            if self.index_path.exists():
+                with open(self.index_path, "r") as index_file:
+                    for line in index_file:
+                        identity, _, checksum = line.rstrip("\n"
+                                                           ).rpartition("\t")
+                        if identity:
+                            self.__checksums[identity] = checksum
+        return self.__checksums
+
+    def get_checksum(self, file_path: Path) -> str:
+        """
+        Look up the sha256 checksum of a file, computing and storing it if the
+        current version of the file is not in the index.
+
+        Args:
+            file_path: path to the file
+
+        Returns:
+            sha256 checksum of the file
+        """
+        identity = file_identity_key(file_path)
+        with self.__lock:
+            checksum = self.__load().get(identity, None)
+        if checksum is not None:
+            return checksum
+
+        checksum = sha256_checksum(file_path)
+        with self.__lock:
+            self.__load()[identity] = checksum
+            try:
+                self.index_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.index_path, "a") as index_file:
+                    index_file.write(f"{identity}\t{checksum}\n")
+            except OSError as err:
+                LOG.warning(
+                    f"Could not update checksum index {self.index_path}: {err}"
+                )
+        return checksum
+
+
 class FileBlob():
     """
     A FileBlob is a keyed data blob for everything that is loadable from a file
@@ -49,12 +143,20 @@ class FileBlob():
         key: identifier for the file
         file_path: path to the file
         data: a blob of data in memory
+        size: size of the loaded file in bytes
     """
 
-    def __init__(self, key: str, file_path: Path, data: LoadableType) -> None:
+    def __init__(
+        self,
+        key: str,
+        file_path: Path,
+        data: LoadableType,
+        size: int = 0
+    ) -> None:
         self.__key = key
         self.__file_path = file_path
         self.__class_object = data
+        self.__size = size
 
     @property
     def key(self) -> str:
@@ -71,11 +173,15 @@ class FileBlob():
         """The loaded DataClass from the file."""
         return self.__class_object
 
+    @property
+    def size(self) -> int:
+        """Size of the loaded file in bytes."""
+        return self.__size
+
 
 class FileSignal(QObject):
     """Emit signals after the file was loaded."""
     finished = pyqtSignal(object)
-    clean = pyqtSignal()
 
 
 class FileLoader(QRunnable):
@@ -96,7 +202,63 @@ class FileLoader(QRunnable):
         """Run the file loading method."""
         loaded_data_class = self.func(self.file_path, self.class_type)
         self.signal.finished.emit(loaded_data_class)
-        self.signal.clean.emit()
+
+
+class DataManagerStatistics():
+    """
+    Snapshot of the cache statistics of a :class:`DataManager`.
+
+    Args:
+        hits: number of requests that were answered from the cache or by
+              waiting on a load that was already in progress
+        misses: number of requests that had to load the file
+        evictions: number of files that were evicted to stay within the
+                   file size budget
+        num_entries: number of files currently cached
+        size: total size of the cached files on disk in bytes
+    """
+
+    def __init__(
+        self, hits: int, misses: int, evictions: int, num_entries: int,
+        size: int
+    ) -> None:
+        self.__hits = hits
+        self.__misses = misses
+        self.__evictions = evictions
+        self.__num_entries = num_entries
+        self.__size = size
+
+    @property
+    def hits(self) -> int:
+        """Number of cache hits."""
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """Number of cache misses."""
+        return self.__misses
+
+    @property
+    def evictions(self) -> int:
+        """Number of evicted files."""
+        return self.__evictions
+
+    @property
+    def num_entries(self) -> int:
+        """Number of currently cached files."""
+        return self.__num_entries
+
+    @property
+    def size(self) -> int:
+        """Total size of the cached files on disk in bytes."""
+        return self.__size
+
+    def __str__(self) -> str:
+        return (
+            f"hits={self.hits}, misses={self.misses}, "
+            f"evictions={self.evictions}, entries={self.num_entries}, "
+            f"size={self.size}"
+        )
 
 
 class DataManager():
@@ -104,34 +266,144 @@ class DataManager():
     Manages data over the lifetime of the tool suite.
 
     The DataManager handles the concurrent file loading, creation of DataClasses
-    and caching of loaded files.
+    and caching of loaded files. Concurrent requests for the same file wait for
+    a single load, while different files are loaded in parallel. Loaded files
+    are kept in a least recently used cache, which is bounded by a budget for
+    the total size of the cached files on disk that defaults to
+    ``vara_cfg()["caching"]["data_manager_file_size_budget"]``. The memory
+    used by loaded files is not measured, but it grows with their file size.
+
+    Cached files are identified either by their :func:`identity
+    <file_identity_key>`, which only requires a ``stat`` call, or by the sha256
+    checksum of their content, which is looked up in a persistent
+    :class:`ChecksumIndex` and, therefore, only computed once per file version.
+
+    Args:
+        file_size_budget: number of bytes that the cached files may use on
+                          disk, where 0 disables the limit
+        key_mode: either ``"identity"`` or ``"checksum"``, defaults to
+                  ``vara_cfg()["caching"]["data_manager_key_mode"]``
+        checksum_index: index used to look up checksums in ``"checksum"`` mode
     """
 
-    def __init__(self) -> None:
-        self.file_map: tp.Dict[str, FileBlob] = dict()
+    KEY_MODES = ("identity", "checksum")
+
+    def __init__(
+        self,
+        file_size_budget: tp.Optional[int] = None,
+        key_mode: tp.Optional[str] = None,
+        checksum_index: tp.Optional[ChecksumIndex] = None
+    ) -> None:
+        if key_mode is not None and key_mode not in self.KEY_MODES:
+            raise ValueError(f"Unknown key mode: {key_mode}")
+
+        self.file_map: tp.OrderedDict[str, FileBlob] = OrderedDict()
         self.thread_pool = QThreadPool()
-        self.loader_lock = Lock()
+        self.__file_size_budget = file_size_budget
+        self.__key_mode = key_mode
+        self.__checksum_index = checksum_index or ChecksumIndex()
+        self.__lock = Lock()
+        self.__in_flight: tp.Dict[str, Future] = {}
+        self.__cache_size = 0
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    @property
+    def file_size_budget(self) -> int:
+        """Number of bytes that the cached files may use on disk."""
+        if self.__file_size_budget is not None:
+            return self.__file_size_budget
+
+        return int(
+            vara_cfg()["caching"]["data_manager_file_size_budget"].value
+        ) * 1024 * 1024
+
+    @property
+    def key_mode(self) -> str:
+        """How cached files are identified, either by their identity or by the
+        checksum of their content."""
+        if self.__key_mode is not None:
+            return self.__key_mode
+
+        key_mode = str(vara_cfg()["caching"]["data_manager_key_mode"])
+        if key_mode not in self.KEY_MODES:
+            raise ValueError(f"Unknown key mode: {key_mode}")
+        return key_mode
+
+    def __compute_key(self, file_path: Path) -> str:
+        if self.key_mode == "checksum":
+            return self.__checksum_index.get_checksum(file_path)
+
+        return file_identity_key(file_path)
+
+    @property
+    def statistics(self) -> DataManagerStatistics:
+        """Current cache statistics of the DataManager."""
+        with self.__lock:
+            return DataManagerStatistics(
+                self.__hits, self.__misses, self.__evictions,
+                len(self.file_map), self.__cache_size
+            )
 
     def __load_data_class(
         self, file_path: Path, DataClassTy: tp.Type[LoadableType]
     ) -> LoadableType:
         # pylint: disable=invalid-name
         """Load a DataClass of type <DataClassTy> from a file."""
-        self.loader_lock.acquire()
+        key = self.__compute_key(file_path)
+
+        with self.__lock:
+            if key in self.file_map:
+                self.file_map.move_to_end(key)
+                self.__hits += 1
+                return tp.cast(LoadableType, self.file_map[key].data)
+
+            in_flight_load = self.__in_flight.get(key, None)
+            if in_flight_load is None:
+                self.__misses += 1
+                new_load: Future = Future()
+                self.__in_flight[key] = new_load
+            else:
+                self.__hits += 1
 
-        key = sha256_checksum(file_path)
-        if key in self.file_map:
-            return tp.cast(LoadableType, self.file_map[key].data)
+        if in_flight_load is not None:
+            return tp.cast(LoadableType, in_flight_load.result())
 
         try:
-            new_blob = FileBlob(key, file_path, DataClassTy(file_path))
+            new_blob = FileBlob(
+                key, file_path, DataClassTy(file_path),
+                os.path.getsize(file_path)
+            )
         except Exception as e:
-            self.loader_lock.release()
+            with self.__lock:
+                del self.__in_flight[key]
+            new_load.set_exception(e)
             raise e
-        self.file_map[key] = new_blob
+
+        with self.__lock:
+            del self.__in_flight[key]
+            self.__insert(new_blob)
+        new_load.set_result(new_blob.data)
 
         return tp.cast(LoadableType, new_blob.data)
 
+    def __insert(self, blob: FileBlob) -> None:
+        """Insert a blob into the cache and evict the least recently used blobs
+        if the file size budget is exceeded."""
+        self.file_map[blob.key] = blob
+        self.__cache_size += blob.size
+
+        file_size_budget = self.file_size_budget
+        if file_size_budget <= 0:
+            return
+
+        # always keep the latest blob, even if it exceeds the budget alone
+        while self.__cache_size > file_size_budget and len(self.file_map) > 1:
+            _, evicted_blob = self.file_map.popitem(last=False)
+            self.__cache_size -= evicted_blob.size
+            self.__evictions += 1
+
     def load_data_class(
         self, file_path: Path, DataClassTy: tp.Type[LoadableType],
         loaded_callback: tp.Callable[[LoadableType], None]
@@ -150,7 +422,6 @@ class DataManager():
 
         worker = FileLoader(self.__load_data_class, file_path, DataClassTy)
         worker.signal.finished.connect(loaded_callback)
-        worker.signal.clean.connect(self._release_lock)
         self.thread_pool.start(worker)
 
     def load_data_class_sync(
@@ -170,12 +441,34 @@ class DataManager():
         if not os.path.isfile(file_path):
             raise FileNotFoundError
 
-        loaded_file = self.__load_data_class(file_path, DataClassTy)
-        self._release_lock()
-        return loaded_file
+        return self.__load_data_class(file_path, DataClassTy)
+
+    def evict(self, file_path: Path) -> bool:
+        """
+        Remove a file from the cache.
+
+        Args:
+            file_path: to the file
 
-    def _release_lock(self) -> None:
-        self.loader_lock.release()
+        Returns:
+            True, if the file was cached
+        """
+        if not os.path.isfile(file_path):
+            return False
+
+        key = self.__compute_key(file_path)
+        with self.__lock:
+            evicted_blob = self.file_map.pop(key, None)
+            if evicted_blob is None:
+                return False
+            self.__cache_size -= evicted_blob.size
+            return True
+
+    def clear(self) -> None:
+        """Remove all files from the cache."""
+        with self.__lock:
+            self.file_map.clear()
+            self.__cache_size = 0
 
 
 VDM = DataManager()
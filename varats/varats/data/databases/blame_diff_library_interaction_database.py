@@ -28,6 +28,9 @@ class BlameDiffLibraryInteractionDatabase(
 ):
     """Provides access to blame diff library interaction data."""
 
+    # reports are paired with their predecessor in the case study
+    PAIRS_CASE_STUDY_REVISIONS = True
+
     @classmethod
     def _load_dataframe(
         cls, project_name: str, commit_map: CommitMap,
@@ -10,14 +10,9 @@ from varats.data.cache_helper import build_cached_report_table
 from varats.data.databases.evaluationdatabase import EvaluationDatabase
 from varats.data.reports.blame_report import (
     BlameReport,
+    BlameReportAnalysis,
     BlameReportDiff,
-    generate_degree_tuples,
-    generate_author_degree_tuples,
-    generate_avg_time_distribution_tuples,
-    generate_max_time_distribution_tuples,
-    count_interactions,
-    count_interacting_commits,
-    count_interacting_authors,
+    get_commit_repo_pairs,
 )
 from varats.jupyterhelper.file import load_blame_report
 from varats.mapping.commit_map import CommitMap
@@ -33,7 +28,7 @@ from varats.revision.revisions import (
 from varats.utils.git_util import (
     ChurnConfig,
     calc_code_churn,
-    create_commit_lookup_helper,
+    create_commit_metadata_lookup_helper,
 )
 
 
@@ -151,9 +146,10 @@ def build_report_pairs_tuple(
         sampled_revs = case_study.revisions
     else:
         sampled_revs = get_processed_revisions(project_name, BlameReport)
-    short_time_id_cache: tp.Dict[str, int] = {
-        rev: commit_map.short_time_id(rev) for rev in sampled_revs
-    }
+    short_time_id_cache: tp.Dict[str, int] = dict(
+        zip(sampled_revs,
+            commit_map.short_time_ids(sampled_revs).tolist())
+    )
 
     report_pairs: tp.List[tp.Tuple[Path, Path]] = [
         (report, pred) for report, pred in [(
@@ -258,13 +254,16 @@ class BlameDiffMetricsDatabase(
     """Metrics database that contains all different blame-interaction metrics
     that are based on a diff between two `BlameReports`."""
 
+    # reports are paired with their predecessor in the case study
+    PAIRS_CASE_STUDY_REVISIONS = True
+
     @classmethod
     def _load_dataframe(
         cls, project_name: str, commit_map: CommitMap,
         case_study: tp.Optional[CaseStudy], **kwargs: tp.Any
     ) -> pd.DataFrame:
         repo = get_local_project_git(project_name)
-        commit_lookup = create_commit_lookup_helper(project_name)
+        commit_lookup = create_commit_metadata_lookup_helper(project_name)
 
         def create_dataframe_layout() -> pd.DataFrame:
             df_layout = pd.DataFrame(columns=cls.COLUMNS)
@@ -288,6 +287,14 @@ class BlameDiffMetricsDatabase(
             commit_date = datetime.utcfromtimestamp(commit.commit_time)
 
             diff_between_head_pred = BlameReportDiff(head_report, pred_report)
+            commit_lookup.prefetch(
+                get_commit_repo_pairs(diff_between_head_pred)
+            )
+            analysis = BlameReportAnalysis(
+                diff_between_head_pred, commit_lookup
+            )
+            degree_tuples = analysis.degree_tuples()
+            author_degree_tuples = analysis.author_degree_tuples()
 
             # Calculate the total churn between pred and base commit
             code_churn = calc_code_churn(
@@ -319,45 +326,23 @@ class BlameDiffMetricsDatabase(
                     'churn':
                         total_churn,
                     'num_interactions':
-                        count_interactions(diff_between_head_pred),
+                        analysis.num_interactions(),
                     'num_interacting_commits':
-                        count_interacting_commits(diff_between_head_pred),
+                        analysis.num_interacting_commits(),
                     'num_interacting_authors':
-                        count_interacting_authors(
-                            diff_between_head_pred, commit_lookup
-                        ),
+                        analysis.num_interacting_authors(),
                     "ci_degree_mean":
-                        weighted_avg(
-                            generate_degree_tuples(diff_between_head_pred)
-                        ),
+                        weighted_avg(degree_tuples),
                     "author_mean":
-                        weighted_avg(
-                            generate_author_degree_tuples(
-                                diff_between_head_pred, commit_lookup
-                            )
-                        ),
+                        weighted_avg(author_degree_tuples),
                     "avg_time_mean":
-                        weighted_avg(
-                            generate_avg_time_distribution_tuples(
-                                diff_between_head_pred, commit_lookup, 1
-                            )
-                        ),
+                        weighted_avg(analysis.avg_time_distribution_tuples(1)),
                     "ci_degree_max":
-                        combine_max(
-                            generate_degree_tuples(diff_between_head_pred)
-                        ),
+                        combine_max(degree_tuples),
                     "author_max":
-                        combine_max(
-                            generate_author_degree_tuples(
-                                diff_between_head_pred, commit_lookup
-                            )
-                        ),
+                        combine_max(author_degree_tuples),
                     "avg_time_max":
-                        combine_max(
-                            generate_max_time_distribution_tuples(
-                                diff_between_head_pred, commit_lookup, 1
-                            )
-                        ),
+                        combine_max(analysis.max_time_distribution_tuples(1)),
                     'year':
                         commit_date.year,
                 },
@@ -10,10 +10,8 @@ from varats.data.cache_helper import build_cached_report_table
 from varats.data.databases.evaluationdatabase import EvaluationDatabase
 from varats.data.reports.blame_report import (
     BlameReport,
-    generate_author_degree_tuples,
-    generate_avg_time_distribution_tuples,
-    generate_max_time_distribution_tuples,
-    generate_lib_dependent_degrees,
+    BlameReportAnalysis,
+    get_commit_repo_pairs,
 )
 from varats.jupyterhelper.file import load_blame_report
 from varats.mapping.commit_map import CommitMap
@@ -24,7 +22,7 @@ from varats.revision.revisions import (
     get_failed_revisions_files,
     get_processed_revisions_files,
 )
-from varats.utils.git_util import create_commit_lookup_helper
+from varats.utils.git_util import create_commit_metadata_lookup_helper
 
 MAX_TIME_BUCKET_SIZE = 1
 AVG_TIME_BUCKET_SIZE = 1
@@ -82,7 +80,7 @@ class BlameInteractionDegreeDatabase(
         cls, project_name: str, commit_map: CommitMap,
         case_study: tp.Optional[CaseStudy], **kwargs: tp.Any
     ) -> pd.DataFrame:
-        commit_lookup = create_commit_lookup_helper(project_name)
+        commit_lookup = create_commit_metadata_lookup_helper(project_name)
 
         def create_dataframe_layout() -> pd.DataFrame:
             df_layout = pd.DataFrame(columns=cls.COLUMNS)
@@ -98,10 +96,10 @@ class BlameInteractionDegreeDatabase(
             report_path: Path
         ) -> tp.Tuple[pd.DataFrame, str, str]:
             report = load_blame_report(report_path)
+            commit_lookup.prefetch(get_commit_repo_pairs(report))
+            analysis = BlameReportAnalysis(report, commit_lookup)
 
-            categorised_degree_occurrences = generate_lib_dependent_degrees(
-                report
-            )
+            categorised_degree_occurrences = analysis.lib_dependent_degrees()
 
             def calc_total_amounts() -> int:
                 total = 0
@@ -114,28 +112,28 @@ class BlameInteractionDegreeDatabase(
 
             total_amounts_of_all_libs = calc_total_amounts()
 
-            list_of_author_degree_occurrences = generate_author_degree_tuples(
-                report, commit_lookup
-            )
+            list_of_author_degree_occurrences = analysis.author_degree_tuples()
             author_degrees, author_amounts = _split_tuple_values_in_lists_tuple(
                 list_of_author_degree_occurrences
             )
             author_total = sum(author_amounts)
 
-            list_of_max_time_deltas = generate_max_time_distribution_tuples(
-                report, commit_lookup, MAX_TIME_BUCKET_SIZE
+            list_of_max_time_deltas = analysis.max_time_distribution_tuples(
+                MAX_TIME_BUCKET_SIZE
             )
             (max_time_buckets, max_time_amounts
             ) = _split_tuple_values_in_lists_tuple(list_of_max_time_deltas)
             total_max_time_amounts = sum(max_time_amounts)
 
-            list_of_avg_time_deltas = generate_avg_time_distribution_tuples(
-                report, commit_lookup, AVG_TIME_BUCKET_SIZE
+            list_of_avg_time_deltas = analysis.avg_time_distribution_tuples(
+                AVG_TIME_BUCKET_SIZE
             )
             (avg_time_buckets, avg_time_amounts
             ) = _split_tuple_values_in_lists_tuple(list_of_avg_time_deltas)
             total_avg_time_amounts = sum(avg_time_amounts)
 
+            head_time_id = commit_map.short_time_id(report.head_commit)
+
             def build_dataframe_row(
                 degree_type: DegreeType,
                 degree: int,
@@ -147,7 +145,7 @@ class BlameInteractionDegreeDatabase(
 
                 data_dict: tp.Dict[str, tp.Any] = {
                     'revision': report.head_commit,
-                    'time_id': commit_map.short_time_id(report.head_commit),
+                    'time_id': head_time_id,
                     'degree_type': degree_type.value,
                     'base_lib': base_library,
                     'inter_lib': inter_library,
@@ -1,31 +1,208 @@
 """Module for the base Database class."""
 import abc
+import os
 import typing as tp
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
 
+import numpy as np
 import pandas as pd
-from pygtrie import CharTrie
 
-from varats.data.cache_helper import get_data_file_path
+from varats.data.cache_helper import get_data_file_path, SegmentedReportTable
 from varats.mapping.commit_map import CommitMap
 from varats.paper.case_study import CaseStudy
+from varats.utils.settings import vara_cfg
 
 AvailableColumns = tp.TypeVar("AvailableColumns")
 
+QueryKeyTy = tp.Tuple[tp.Hashable, ...]
+DataVersionTy = tp.Tuple[tp.Optional[tp.Tuple[int, int]], ...]
+
+
+class QueryCache():
+    """
+    Process-wide cache of the data that :class:`EvaluationDatabase` queries
+    loaded.
+
+    Loaded dataframes are kept in a least recently used cache, which is bounded
+    by an approximate memory budget that defaults to ``vara_cfg()["caching"]
+    ["query_cache_memory_budget"]``. Every entry stores the version of the
+    files it was loaded from, i.e., the identity of the database's cache file
+    and of the project's result directory, so it is only used as long as these
+    did not change.
+
+    Args:
+        memory_budget: approximate number of bytes that the cached dataframes
+                       may use, where 0 disables the limit
+    """
+
+    def __init__(self, memory_budget: tp.Optional[int] = None) -> None:
+        self.__memory_budget = memory_budget
+        self.__entries: tp.OrderedDict[QueryKeyTy,
+                                       tp.Tuple[DataVersionTy, pd.DataFrame,
+                                                int]] = OrderedDict()
+        self.__size = 0
+        self.__hits = 0
+        self.__misses = 0
+        self.__lock = Lock()
+
+    @property
+    def memory_budget(self) -> int:
+        """Approximate number of bytes that the cached dataframes may use."""
+        if self.__memory_budget is not None:
+            return self.__memory_budget
+
+        return int(
+            vara_cfg()["caching"]["query_cache_memory_budget"].value
+        ) * 1024 * 1024
+
+    @property
+    def hits(self) -> int:
+        """Number of queries that were answered from the cache."""
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """Number of queries that had to load their data."""
+        return self.__misses
+
+    @property
+    def num_entries(self) -> int:
+        """Number of currently cached dataframes."""
+        return len(self.__entries)
+
+    @property
+    def size(self) -> int:
+        """Approximate size of the cached dataframes in bytes."""
+        return self.__size
+
+    def get(self, key: QueryKeyTy,
+            version: tp.Optional[DataVersionTy]) -> tp.Optional[pd.DataFrame]:
+        """
+        Look up the data of a query.
+
+        Args:
+            key: identifies the query
+            version: current version of the files the data is loaded from
+
+        Returns:
+            the cached dataframe, or ``None`` if no entry for the current
+            version exists
+        """
+        with self.__lock:
+            entry = self.__entries.get(key, None)
+            if entry is None or version is None or entry[0] != version:
+                self.__misses += 1
+                return None
+
+            self.__entries.move_to_end(key)
+            self.__hits += 1
+            return entry[1]
+
+    def insert(
+        self, key: QueryKeyTy, version: DataVersionTy, data: pd.DataFrame
+    ) -> None:
+        """
+        Store the data of a query and evict the least recently used entries if
+        the memory budget is exceeded.
+
+        Args:
+            key: identifies the query
+            version: version of the files the data was loaded from
+            data: loaded dataframe, which must not be modified afterwards
+        """
+        size = int(data.memory_usage(deep=True).sum())
+        memory_budget = self.memory_budget
+        with self.__lock:
+            self.__remove(key)
+            if 0 < memory_budget < size:
+                return
+
+            self.__entries[key] = (version, data, size)
+            self.__size += size
+            while 0 < memory_budget < self.__size:
+                self.__remove(next(iter(self.__entries)))
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self.__lock:
+            self.__entries.clear()
+            self.__size = 0
+
+    def __remove(self, key: QueryKeyTy) -> None:
+        entry = self.__entries.pop(key, None)
+        if entry is not None:
+            self.__size -= entry[2]
+
+
+_QUERY_CACHE = QueryCache()
+
+
+def get_query_cache() -> QueryCache:
+    """Get the process-wide query cache of all evaluation databases."""
+    return _QUERY_CACHE
+
+
+def _get_path_identity(path: Path) -> tp.Optional[tp.Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _get_data_version(cache_id: str,
+                      project_name: str) -> tp.Optional[DataVersionTy]:
+    """
+    Compute the version of the files a database loads its data from.
+
+    Returns:
+        the identities of the cache file, the manifest of a segmented cache
+        table, and the project's result directory, or ``None`` if the database
+        has no cache file
+    """
+    cache_file_identity = _get_path_identity(
+        get_data_file_path(cache_id, project_name)
+    )
+    manifest_identity = _get_path_identity(
+        SegmentedReportTable(cache_id, project_name).manifest_path
+    )
+    if cache_file_identity is None and manifest_identity is None:
+        return None
+
+    return (
+        cache_file_identity, manifest_identity,
+        _get_path_identity(Path(str(vara_cfg()["result_dir"])) / project_name)
+    )
+
 
 class EvaluationDatabase(abc.ABC):
     """
     Base class for accessing report data.
 
+    Data that is loaded from a cache file is kept in the process-wide
+    :class:`QueryCache`, so repeated queries for the same project, case
+    studies, and arguments do not load the cache file again as long as it did
+    not change.
+
     Subclasses have to provide the following:
         - a list of available columns in the variable ``COLUMNS``; this list
           must start with ``Database.COLUMNS``!
         - an identifier for cache files ``CACHE_ID``
         - a function :func:`_load_dataframe` that loads and transparently caches
           report data
+
+    Subclasses whose data depends on which revisions belong to the same case
+    study, e.g., because reports are paired with their predecessor in the case
+    study, have to set ``PAIRS_CASE_STUDY_REVISIONS``. Their data is loaded
+    separately for every requested case study. For all other databases, the
+    data of multiple case studies is loaded at once.
     """
 
     CACHE_ID: str
     COLUMNS = ["revision", "time_id"]
+    PAIRS_CASE_STUDY_REVISIONS = False
 
     @classmethod
     def __init_subclass__(
@@ -61,40 +238,48 @@ class EvaluationDatabase(abc.ABC):
         """
 
     @classmethod
-    def __get_data_for_case_study(
+    def __load_data(
         cls, project_name: str, columns: tp.List[str], commit_map: CommitMap,
         case_study: tp.Optional[CaseStudy], **kwargs: tp.Any
     ) -> pd.DataFrame:
-        data: pd.DataFrame = cls._load_dataframe(
-            project_name, commit_map, case_study, **kwargs
+        query_cache = get_query_cache()
+        query_key = (
+            cls.__module__, cls.__qualname__, project_name,
+            tuple(case_study.revisions) if case_study is not None else None,
+            tuple(sorted((key, repr(value)) for key, value in kwargs.items()))
         )
-
-        if not [*data] == cls.COLUMNS:
-            raise AssertionError(
-                "Loaded dataframe does not match expected layout."
-                "Consider removing the cache file "
-                f"{get_data_file_path(cls.CACHE_ID, project_name)}."
+        cached_data = query_cache.get(
+            query_key, _get_data_version(cls.CACHE_ID, project_name)
+        )
+        # cached dataframes are shared between queries, so they are never
+        # modified in place; every query returns a new frame with the
+        # selected rows and columns
+        if cached_data is not None:
+            data = cached_data
+        else:
+            data = cls._load_dataframe(
+                project_name, commit_map, case_study, **kwargs
             )
 
+            if not [*data] == cls.COLUMNS:
+                raise AssertionError(
+                    "Loaded dataframe does not match expected layout."
+                    "Consider removing the cache file "
+                    f"{get_data_file_path(cls.CACHE_ID, project_name)}."
+                )
+
+            # loading can update the cache file, so its version is computed
+            # afterwards
+            data_version = _get_data_version(cls.CACHE_ID, project_name)
+            if data_version is not None:
+                query_cache.insert(query_key, data_version, data)
+
         if not all(column in cls.COLUMNS for column in columns):
             raise ValueError(
                 f"All values in 'columns' must be in {cls.__name__}.COLUMNS"
             )
 
-        def cs_filter(data_frame: pd.DataFrame) -> pd.DataFrame:
-            """Filter out all commits that are not in the case study if one was
-            selected."""
-            if case_study is None or data_frame.empty:
-                return data_frame
-            # use a trie for fast prefix lookup
-            revisions = CharTrie()
-            for revision in case_study.revisions:
-                revisions[revision] = True
-            return data_frame[data_frame["revision"].
-                              apply(lambda x: revisions.has_node(x) != 0)]
-
-        data = cs_filter(data)
-        return data[columns]
+        return data
 
     @classmethod
     def get_data_for_project(
@@ -123,15 +308,104 @@ class EvaluationDatabase(abc.ABC):
             )
 
         if not case_studies:
-            return cls.__get_data_for_case_study(
-                project_name, columns, commit_map, None, **kwargs
+            return _select_columns(
+                cls.__load_data(
+                    project_name, columns, commit_map, None, **kwargs
+                ), columns, commit_map
             )
 
-        data_frames: tp.List[pd.DataFrame] = []
-        for case_study in case_studies:
-            data_frames.append(
-                cls.__get_data_for_case_study(
-                    project_name, columns, commit_map, case_study, **kwargs
-                )
-            )
-        return pd.concat(data_frames)
+        if cls.PAIRS_CASE_STUDY_REVISIONS:
+            return pd.concat([
+                _select_columns(
+                    _filter_case_study(
+                        cls.__load_data(
+                            project_name, columns, commit_map, case_study,
+                            **kwargs
+                        ), case_study
+                    ), columns, commit_map
+                ) for case_study in case_studies
+            ])
+
+        # load the data of all case studies at once and split it afterwards
+        data = cls.__load_data(
+            project_name, columns, commit_map,
+            _merge_case_studies(case_studies), **kwargs
+        )
+        return pd.concat([
+            _select_columns(
+                _filter_case_study(data, case_study), columns, commit_map
+            ) for case_study in case_studies
+        ])
+
+
+def _filter_case_study(
+    data: pd.DataFrame, case_study: CaseStudy
+) -> pd.DataFrame:
+    """Select all rows that belong to a case study."""
+    if data.empty:
+        return data
+
+    revision_lengths = data["revision"].str.len().fillna(-1).astype(int)
+    return data.loc[
+        _case_study_row_mask(data["revision"], revision_lengths, case_study)]
+
+
+def _select_columns(
+    data: pd.DataFrame, columns: tp.List[str], commit_map: CommitMap
+) -> pd.DataFrame:
+    """
+    Select the requested columns of the data.
+
+    Cached time ids depend on the commit map that was used to create the cache
+    entries, so they are resolved again with the given commit map. Revisions
+    that are not part of the commit map keep their cached time id.
+    """
+    if "time_id" in columns and not data.empty:
+        time_ids = commit_map.short_time_ids(data["revision"], default=-1)
+        data = data.assign(
+            time_id=np.where(time_ids >= 0, time_ids, data["time_id"])
+        )
+    return data[columns]
+
+
+def _merge_case_studies(case_studies: tp.Sequence[CaseStudy]) -> CaseStudy:
+    """Combine the stages of multiple case studies of a project into one case
+    study that contains the revisions of all of them."""
+    if len(case_studies) == 1:
+        return case_studies[0]
+
+    return CaseStudy(
+        case_studies[0].project_name, case_studies[0].version,
+        [stage for case_study in case_studies for stage in case_study.stages]
+    )
+
+
+def _case_study_row_mask(
+    revisions: pd.Series, revision_lengths: pd.Series, case_study: CaseStudy
+) -> pd.Series:
+    """
+    Select the rows whose revision belongs to a case study, i.e., is a prefix of
+    one of the case study's revisions.
+
+    Args:
+        revisions: revision column of the data
+        revision_lengths: length of every revision in ``revisions``
+        case_study: the case study to select rows for
+
+    Returns:
+        a boolean mask over the rows
+
+    Test:
+    >>> from varats.paper.case_study import CSEntry, CSStage
+    >>> cs = CaseStudy("xz", 0, [CSStage(revisions=[CSEntry("a1b2c3", 0)])])
+    >>> revs = pd.Series(["a1b2", "a1b2c3", "a1c", "ffff"])
+    >>> _case_study_row_mask(revs, revs.str.len(), cs).tolist()
+    [True, True, False, False]
+    """
+    mask = pd.Series(False, index=revisions.index)
+    for length in revision_lengths.unique():
+        if length < 0:
+            continue
+        prefixes = {revision[:length] for revision in case_study.revisions}
+        mask |= (revision_lengths == length) & revisions.isin(prefixes)
+    return mask
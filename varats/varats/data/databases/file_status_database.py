@@ -7,8 +7,8 @@ from varats.data.databases.evaluationdatabase import EvaluationDatabase
 from varats.data.reports.empty_report import EmptyReport
 from varats.mapping.commit_map import CommitMap
 from varats.paper.case_study import CaseStudy
-from varats.paper_mgmt.case_study import get_revisions_status_for_case_study
-from varats.report.report import FileStatusExtension, MetaReport
+from varats.paper_mgmt.case_study import get_revisions_status_df_for_case_study
+from varats.report.report import MetaReport
 
 
 class FileStatusDatabase(
@@ -35,29 +35,17 @@ class FileStatusDatabase(
             df_layout = pd.DataFrame(columns=cls.COLUMNS)
             return df_layout
 
-        def create_data_frame_for_revision(
-            revision: str, status: FileStatusExtension
-        ) -> pd.DataFrame:
-            return pd.DataFrame({
-                'revision': revision,
-                'time_id': commit_map.short_time_id(revision),
-                'file_status': status.get_status_extension()
-            },
-                                index=[0])
-
         data_frame = create_dataframe_layout()
-        data_frames = []
-
-        if case_study:
-            processed_revisions = get_revisions_status_for_case_study(
-                case_study, result_file_type, tag_blocked=tag_blocked
-            )
-            for rev, stat in processed_revisions:
-                data_frames.append(create_data_frame_for_revision(rev, stat))
+        if not case_study:
+            return data_frame
 
-        return pd.concat([data_frame] + data_frames,
-                         ignore_index=True,
-                         sort=False)
+        status_df = get_revisions_status_df_for_case_study(
+            case_study, result_file_type, tag_blocked=tag_blocked
+        )
+        status_df.insert(
+            1, "time_id", commit_map.short_time_ids(status_df["revision"])
+        )
+        return pd.concat([data_frame, status_df], ignore_index=True, sort=False)
 
     @classmethod
     def get_data_for_project(
@@ -0,0 +1,355 @@
+"""
+Binary sidecar files for parsed reports.
+
+Parsing large yaml reports is expensive, so reports can store their already
+parsed structure as a set of numpy arrays in an uncompressed ``.npz`` file in
+the data cache. Sidecars are opt-in, see ``caching.report_sidecars``. A sidecar
+is only used as long as the report file was not modified, i.e., its
+``st_mtime_ns`` and size did not change, and the stored ``VersionHeader`` is
+still accepted by the report class. The arrays of a sidecar are memory mapped
+instead of being read completely.
+"""
+import hashlib
+import logging
+import os
+import struct
+import tempfile
+import typing as tp
+import zipfile
+from pathlib import Path
+
+import numpy as np
+
+from varats.base.version_header import (
+    VersionHeader,
+    WrongYamlFileType,
+    WrongYamlFileVersion,
+)
+from varats.utils.settings import vara_cfg
+
+LOG = logging.getLogger(__name__)
+
+# Bump this version whenever the layout of a sidecar changes.
+SIDECAR_FORMAT_VERSION = 2
+
+SidecarArrays = tp.Mapping[str, np.ndarray]
+
+_META_KEY = "__sidecar_meta__"
+_DOC_TYPE_KEY = "__sidecar_doc_type__"
+
+# yaml scalar types that can be stored with :func:`store_values` and how they
+# are restored from their string representation
+_VALUE_TYPES: tp.List[tp.Tuple[type, tp.Callable[[str], tp.Any]]] = [
+    (str, str),
+    (int, int),
+    (float, float),
+    (bool, lambda value: value == "True"),
+    (type(None), lambda value: None),
+]
+
+# size of the fixed part of a zip local file header
+_ZIP_LOCAL_HEADER_SIZE = 30
+
+
+def get_sidecar_file_path(report_path: Path) -> Path:
+    """
+    Compute the path of the sidecar file for a report.
+
+    Sidecars are keyed by a hash of the resolved report path, so reports with
+    the same name in different result directories do not share a sidecar.
+
+    Args:
+        report_path: path to the report file
+
+    Returns:
+        path to the sidecar file in the data cache
+
+    Test:
+    >>> str(get_sidecar_file_path(Path("/results/xz/BR-xz-xz-42_1_success")))
+    'data_cache/report_sidecars/d9e65878f0f533de-BR-xz-xz-42_1_success.npz'
+    """
+    report_path = Path(report_path).resolve()
+    path_hash = hashlib.sha256(str(report_path).encode("utf-8")).hexdigest()
+    return Path(
+        str(vara_cfg()["data_cache"])
+    ) / "report_sidecars" / (f"{path_hash[:16]}-{report_path.name}.npz")
+
+
+def _sidecars_enabled() -> bool:
+    return bool(vara_cfg()["caching"]["report_sidecars"].value)
+
+
+def _report_file_identity(report_path: Path) -> tp.Optional[tp.List[int]]:
+    try:
+        stat = os.stat(report_path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def load_report_sidecar(
+    report_path: Path, doc_type: str, min_version: int
+) -> tp.Optional[tp.Tuple[VersionHeader, SidecarArrays]]:
+    """
+    Load the sidecar of a report if it exists and is still valid.
+
+    Args:
+        report_path: path to the report file
+        doc_type: document type the report class expects
+        min_version: minimal report version the report class accepts
+
+    Returns:
+        the version header of the report and the stored arrays, or ``None`` if
+        no valid sidecar exists
+    """
+    if not _sidecars_enabled():
+        return None
+
+    file_identity = _report_file_identity(report_path)
+    sidecar_path = get_sidecar_file_path(report_path)
+    if file_identity is None or not sidecar_path.exists():
+        return None
+
+    try:
+        arrays = _map_arrays(sidecar_path)
+        format_version, report_version, *stored_identity = arrays[_META_KEY
+                                                                 ].tolist()
+        if format_version != SIDECAR_FORMAT_VERSION or \
+                stored_identity != file_identity:
+            return None
+
+        version_header = VersionHeader.from_version_number(
+            load_strings(arrays, _DOC_TYPE_KEY)[0], report_version
+        )
+        version_header.raise_if_not_type(doc_type)
+        version_header.raise_if_version_is_less_than(min_version)
+    except (
+        OSError, ValueError, KeyError, zipfile.BadZipFile, WrongYamlFileType,
+        WrongYamlFileVersion
+    ) as err:
+        LOG.debug(f"Ignoring invalid sidecar {sidecar_path}: {err}")
+        return None
+
+    return version_header, arrays
+
+
+def _map_arrays(sidecar_path: Path) -> tp.Dict[str, np.ndarray]:
+    """Memory map all arrays of an uncompressed ``.npz`` file, which
+    ``np.load`` does not support."""
+    arrays: tp.Dict[str, np.ndarray] = {}
+    with zipfile.ZipFile(sidecar_path) as zip_file, \
+            open(sidecar_path, "rb") as raw_file:
+        for info in zip_file.infolist():
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError(f"Compressed sidecar array {info.filename}")
+
+            raw_file.seek(info.header_offset)
+            local_header = raw_file.read(_ZIP_LOCAL_HEADER_SIZE)
+            if len(local_header) != _ZIP_LOCAL_HEADER_SIZE or \
+                    local_header[:4] != b"PK\x03\x04":
+                raise ValueError(f"Invalid zip header of {info.filename}")
+            name_length, extra_length = struct.unpack(
+                "<HH", local_header[26:30]
+            )
+            raw_file.seek(
+                info.header_offset + _ZIP_LOCAL_HEADER_SIZE + name_length +
+                extra_length
+            )
+
+            version = np.lib.format.read_magic(raw_file)
+            if version == (1, 0):
+                header = np.lib.format.read_array_header_1_0(raw_file)
+            else:
+                header = np.lib.format.read_array_header_2_0(raw_file)
+            shape, fortran_order, dtype = header
+            if dtype.hasobject:
+                raise ValueError(f"Object array {info.filename} in sidecar")
+
+            key = info.filename[:-len(".npy")]
+            if np.prod(shape) == 0:
+                arrays[key] = np.empty(shape, dtype=dtype)
+            else:
+                arrays[key] = np.memmap(
+                    raw_file,
+                    dtype=dtype,
+                    mode="r",
+                    offset=raw_file.tell(),
+                    shape=shape,
+                    order="F" if fortran_order else "C"
+                )
+    return arrays
+
+
+def store_report_sidecar(
+    report_path: Path, version_header: VersionHeader,
+    create_arrays: tp.Callable[[], SidecarArrays]
+) -> None:
+    """
+    Store the parsed data of a report in its sidecar file.
+
+    Args:
+        report_path: path to the report file
+        version_header: version header of the report
+        create_arrays: creates the arrays with the parsed report data; only
+                       called if sidecars are enabled
+    """
+    if not _sidecars_enabled():
+        return
+
+    file_identity = _report_file_identity(report_path)
+    if file_identity is None:
+        return
+
+    sidecar_path = get_sidecar_file_path(report_path)
+    try:
+        sidecar_arrays = dict(create_arrays())
+    except (TypeError, ValueError) as err:
+        LOG.debug(f"Could not create sidecar {sidecar_path}: {err}")
+        return
+    sidecar_arrays[_META_KEY] = np.array(
+        [SIDECAR_FORMAT_VERSION, version_header.version] + file_identity,
+        dtype=np.int64
+    )
+    store_strings(sidecar_arrays, _DOC_TYPE_KEY, [version_header.doc_type])
+
+    try:
+        sidecar_path.parent.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file first so that concurrent readers never see
+        # a partially written sidecar
+        with tempfile.NamedTemporaryFile(
+            dir=sidecar_path.parent, suffix=".tmp", delete=False
+        ) as tmp_file:
+            np.savez(tmp_file, **sidecar_arrays)
+        os.replace(tmp_file.name, sidecar_path)
+    except OSError as err:
+        LOG.warning(f"Could not store sidecar {sidecar_path}: {err}")
+
+
+def pack_strings(strings: tp.Sequence[str]) -> tp.Tuple[np.ndarray, np.ndarray]:
+    """
+    Pack a sequence of strings into one utf-8 encoded byte array and an array of
+    offsets.
+
+    Args:
+        strings: to pack
+
+    Returns:
+        tuple (data, offsets), where string ``i`` is stored in
+        ``data[offsets[i]:offsets[i + 1]]``
+
+    Test:
+    >>> data, offsets = pack_strings(["foo", "", "bar"])
+    >>> offsets.tolist()
+    [0, 3, 3, 6]
+    >>> unpack_strings(data, offsets)
+    ['foo', '', 'bar']
+    """
+    encoded = [string.encode("utf-8") for string in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(enc) for enc in encoded], out=offsets[1:])
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+def unpack_strings(data: np.ndarray, offsets: np.ndarray) -> tp.List[str]:
+    """
+    Unpack strings that were packed with :func:`pack_strings`.
+
+    Args:
+        data: utf-8 encoded string data
+        offsets: offsets of the single strings in ``data``
+
+    Returns:
+        list of the unpacked strings
+    """
+    raw_data = data.tobytes()
+    offset_list = offsets.tolist()
+    return [
+        raw_data[start:end].decode("utf-8")
+        for start, end in zip(offset_list, offset_list[1:])
+    ]
+
+
+def store_strings(
+    arrays: tp.Dict[str, np.ndarray], key: str, strings: tp.Sequence[str]
+) -> None:
+    """
+    Pack ``strings`` into ``arrays`` under the given ``key``.
+
+    Args:
+        arrays: sidecar arrays to extend
+        key: name of the string list
+        strings: to store
+    """
+    _store_pair(arrays, key, pack_strings(strings))
+
+
+def load_strings(arrays: SidecarArrays, key: str) -> tp.List[str]:
+    """
+    Unpack the strings stored in ``arrays`` under the given ``key``.
+
+    Args:
+        arrays: loaded sidecar arrays
+        key: name of the string list
+
+    Returns:
+        list of strings
+    """
+    return unpack_strings(*_unpack_pair(arrays, key))
+
+
+def store_values(
+    arrays: tp.Dict[str, np.ndarray], key: str, values: tp.Sequence[tp.Any]
+) -> None:
+    """
+    Store yaml scalars in ``arrays`` under the given ``key`` so that they are
+    restored with their original type.
+
+    Args:
+        arrays: sidecar arrays to extend
+        key: name of the value list
+        values: strings, ints, floats, bools, or ``None``
+
+    Test:
+    >>> arrays = {}
+    >>> store_values(arrays, "values", ["1", 1, 1.5, True, None])
+    >>> load_values(arrays, "values")
+    ['1', 1, 1.5, True, None]
+    """
+    value_types = [value_type for value_type, _ in _VALUE_TYPES]
+    type_codes = []
+    for value in values:
+        if type(value) not in value_types:
+            raise TypeError(f"Can not store {type(value)} in a sidecar")
+        type_codes.append(value_types.index(type(value)))
+
+    store_strings(arrays, key, [str(value) for value in values])
+    arrays[f"{key}_types"] = np.array(type_codes, dtype=np.uint8)
+
+
+def load_values(arrays: SidecarArrays, key: str) -> tp.List[tp.Any]:
+    """
+    Load the yaml scalars stored in ``arrays`` under the given ``key``.
+
+    Args:
+        arrays: loaded sidecar arrays
+        key: name of the value list
+
+    Returns:
+        list of values with their original types
+    """
+    return [
+        _VALUE_TYPES[type_code][1](value) for value, type_code in
+        zip(load_strings(arrays, key), arrays[f"{key}_types"].tolist())
+    ]
+
+
+def _store_pair(
+    arrays: tp.Dict[str, np.ndarray], key: str,
+    data_offsets: tp.Tuple[np.ndarray, np.ndarray]
+) -> None:
+    arrays[f"{key}_data"], arrays[f"{key}_offsets"] = data_offsets
+
+
+def _unpack_pair(arrays: SidecarArrays,
+                 key: str) -> tp.Tuple[np.ndarray, np.ndarray]:
+    return arrays[f"{key}_data"], arrays[f"{key}_offsets"]
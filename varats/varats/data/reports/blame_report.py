@@ -1,18 +1,36 @@
 """Module for BlameReport, a collection of blame interactions."""
 
 import typing as tp
+from array import array
 from collections import defaultdict
 from copy import deepcopy
-from datetime import datetime
 from pathlib import Path
 
 import numpy as np
-import pygit2
 import yaml
 
 from varats.base.version_header import VersionHeader
+from varats.data.report_sidecar import (
+    SidecarArrays,
+    load_report_sidecar,
+    load_strings,
+    store_report_sidecar,
+    store_strings,
+)
 from varats.report.report import BaseReport, FileStatusExtension, MetaReport
-from varats.utils.git_util import map_commits, CommitRepoPair, CommitLookupTy
+from varats.utils.git_util import (
+    COMMIT_AUTHOR_NAME,
+    COMMIT_TIME,
+    UNCOMMITTED_COMMIT_HASH,
+    CommitMetadataLookupTy,
+    CommitRepoPair,
+)
+
+
+def _create_commit_repo_pair(raw_hash: str) -> CommitRepoPair:
+    """Splits a raw ``<hash>[-<repo>]`` entry into a ``CommitRepoPair``."""
+    commit, *repo = raw_hash.split('-', maxsplit=1)
+    return CommitRepoPair(commit, repo[0] if repo else "Unknown")
 
 
 class BlameInstInteractions():
@@ -38,20 +56,11 @@ class BlameInstInteractions():
     ) -> 'BlameInstInteractions':
         """Creates a `BlameInstInteractions` entry from the corresponding yaml
         document section."""
-        base_commit, *base_repo = str(raw_inst_entry['base-hash']
-                                     ).split('-', maxsplit=1)
-        base_hash = CommitRepoPair(
-            base_commit, base_repo[0] if base_repo else "Unknown"
-        )
-        interacting_hashes: tp.List[CommitRepoPair] = []
-        for raw_inst_hash in raw_inst_entry['interacting-hashes']:
-            inter_commit, *inter_repo = str(raw_inst_hash
-                                           ).split('-', maxsplit=1)
-            interacting_hashes.append(
-                CommitRepoPair(
-                    inter_commit, inter_repo[0] if inter_repo else "Unknown"
-                )
-            )
+        base_hash = _create_commit_repo_pair(str(raw_inst_entry['base-hash']))
+        interacting_hashes: tp.List[CommitRepoPair] = [
+            _create_commit_repo_pair(str(raw_inst_hash))
+            for raw_inst_hash in raw_inst_entry['interacting-hashes']
+        ]
         amount = int(raw_inst_entry['amount'])
         return BlameInstInteractions(base_hash, interacting_hashes, amount)
 
@@ -97,17 +106,198 @@ class BlameInstInteractions():
         return False
 
 
+class BlameInteractionColumns():
+    """
+    Compact, array-backed storage for all interactions of a ``BlameReport``.
+
+    Every distinct ``CommitRepoPair`` is interned once and referred to by its
+    index into ``commits``. Interaction ``i`` has the base commit
+    ``base_commit_ids[i]``, the amount ``amounts[i]``, and the interacting
+    commits ``interacting_commit_ids[offsets[i]:offsets[i + 1]]``.
+    """
+
+    def __init__(
+        self, commits: tp.List[CommitRepoPair], base_commit_ids: np.ndarray,
+        interacting_commit_offsets: np.ndarray,
+        interacting_commit_ids: np.ndarray, amounts: np.ndarray
+    ) -> None:
+        self.__commits = commits
+        self.__base_commit_ids = base_commit_ids
+        self.__interacting_commit_offsets = interacting_commit_offsets
+        self.__interacting_commit_ids = interacting_commit_ids
+        self.__amounts = amounts
+
+    @property
+    def commits(self) -> tp.List[CommitRepoPair]:
+        """Table of all interned commits, indexed by commit id."""
+        return self.__commits
+
+    @property
+    def base_commit_ids(self) -> np.ndarray:
+        """Commit id of the base commit of every interaction."""
+        return self.__base_commit_ids
+
+    @property
+    def interacting_commit_offsets(self) -> np.ndarray:
+        """Start offsets of the interacting commits of every interaction into
+        ``interacting_commit_ids``, followed by the total length."""
+        return self.__interacting_commit_offsets
+
+    @property
+    def interacting_commit_ids(self) -> np.ndarray:
+        """Commit ids of the interacting commits of all interactions."""
+        return self.__interacting_commit_ids
+
+    @property
+    def amounts(self) -> np.ndarray:
+        """Amount of every interaction."""
+        return self.__amounts
+
+    @property
+    def degrees(self) -> np.ndarray:
+        """Number of interacting commits of every interaction."""
+        return tp.cast(np.ndarray, np.diff(self.__interacting_commit_offsets))
+
+    def __len__(self) -> int:
+        return len(self.__amounts)
+
+    def interaction(self, idx: int) -> BlameInstInteractions:
+        """
+        Create the interaction object for the interaction at index ``idx``.
+
+        Args:
+            idx: index of the interaction
+
+        Returns:
+            the interaction at ``idx``
+        """
+        start = self.__interacting_commit_offsets[idx]
+        end = self.__interacting_commit_offsets[idx + 1]
+        return BlameInstInteractions(
+            self.__commits[self.__base_commit_ids[idx]], [
+                self.__commits[commit_id] for commit_id in
+                self.__interacting_commit_ids[start:end].tolist()
+            ], int(self.__amounts[idx])
+        )
+
+    def interactions(self, start: int,
+                     end: int) -> tp.List[BlameInstInteractions]:
+        """
+        Create the interaction objects for the interactions in the index range
+        ``[start, end)``.
+
+        Args:
+            start: index of the first interaction
+            end: index after the last interaction
+
+        Returns:
+            list of interactions
+        """
+        return [self.interaction(idx) for idx in range(start, end)]
+
+
+class _BlameInteractionColumnsBuilder():
+    """Incrementally collects interactions into ``BlameInteractionColumns``."""
+
+    def __init__(self) -> None:
+        self.__raw_hash_to_id: tp.Dict[str, int] = {}
+        self.__pair_to_id: tp.Dict[CommitRepoPair, int] = {}
+        self.__commits: tp.List[CommitRepoPair] = []
+        self.__base_commit_ids = array('q')
+        self.__interacting_commit_offsets = array('q', [0])
+        self.__interacting_commit_ids = array('q')
+        self.__amounts = array('q')
+
+    @property
+    def num_interactions(self) -> int:
+        """Number of interactions added so far."""
+        return len(self.__amounts)
+
+    def intern_commit(self, raw_hash: str) -> int:
+        """
+        Look up the commit id of a raw ``<hash>[-<repo>]`` entry, adding the
+        commit to the commit table if it was not seen before.
+
+        Args:
+            raw_hash: hash entry as found in the report
+
+        Returns:
+            id of the commit
+        """
+        commit_id = self.__raw_hash_to_id.get(raw_hash)
+        if commit_id is None:
+            commit_id = self.intern_commit_repo_pair(
+                _create_commit_repo_pair(raw_hash)
+            )
+            self.__raw_hash_to_id[raw_hash] = commit_id
+        return commit_id
+
+    def intern_commit_repo_pair(self, commit: CommitRepoPair) -> int:
+        """
+        Look up the commit id of a ``CommitRepoPair``, adding the commit to the
+        commit table if it was not seen before.
+
+        Args:
+            commit: the commit
+
+        Returns:
+            id of the commit
+        """
+        commit_id = self.__pair_to_id.get(commit)
+        if commit_id is None:
+            commit_id = len(self.__commits)
+            self.__commits.append(commit)
+            self.__pair_to_id[commit] = commit_id
+        return commit_id
+
+    def add_interaction(
+        self, base_commit_id: int, interacting_commit_ids: tp.List[int],
+        amount: int
+    ) -> None:
+        """Append an interaction to the columns."""
+        self.__base_commit_ids.append(base_commit_id)
+        self.__interacting_commit_ids.extend(interacting_commit_ids)
+        self.__interacting_commit_offsets.append(
+            len(self.__interacting_commit_ids)
+        )
+        self.__amounts.append(amount)
+
+    def build(self) -> BlameInteractionColumns:
+        """Create the ``BlameInteractionColumns`` without copying the
+        collected data."""
+        return BlameInteractionColumns(
+            self.__commits,
+            np.frombuffer(self.__base_commit_ids, dtype=np.int64),
+            np.frombuffer(self.__interacting_commit_offsets, dtype=np.int64),
+            np.frombuffer(self.__interacting_commit_ids, dtype=np.int64),
+            np.frombuffer(self.__amounts, dtype=np.int64)
+        )
+
+
 class BlameResultFunctionEntry():
-    """Collection of all interactions for a specific function."""
+    """
+    Collection of all interactions for a specific function.
+
+    Function entries of a loaded ``BlameReport`` are views on the report's
+    ``BlameInteractionColumns``, i.e., interaction objects are only created
+    when they are accessed.
+    """
 
     def __init__(
-        self, name: str, demangled_name: str,
-        blame_insts: tp.List[BlameInstInteractions], num_instructions: int
+        self,
+        name: str,
+        demangled_name: str,
+        blame_insts: tp.Optional[tp.List[BlameInstInteractions]],
+        num_instructions: int,
+        columns: tp.Optional[BlameInteractionColumns] = None,
+        interaction_range: tp.Tuple[int, int] = (0, 0)
     ) -> None:
         self.__name = name
         self.__demangled_name = demangled_name
         self.__inst_list = blame_insts
         self.__num_instructions = num_instructions
+        self.__columns = columns
+        self.__interaction_range = interaction_range
 
     @staticmethod
     def create_blame_result_function_entry(
@@ -150,13 +340,36 @@ class BlameResultFunctionEntry():
     @property
     def interactions(self) -> tp.List[BlameInstInteractions]:
         """List of found instruction blame-interactions."""
+        if self.__inst_list is None:
+            if self.__columns is None:
+                return []
+            return self.__columns.interactions(*self.__interaction_range)
         return self.__inst_list
 
+    @property
+    def interaction_range(self) -> tp.Optional[tp.Tuple[int, int]]:
+        """Index range ``[start, end)`` of this function's interactions in the
+        report's ``BlameInteractionColumns``, if the entry is a view on
+        them."""
+        if self.__inst_list is None and self.__columns is not None:
+            return self.__interaction_range
+        return None
+
+    def __deepcopy__(
+        self, memo: tp.Dict[int, tp.Any]
+    ) -> 'BlameResultFunctionEntry':
+        # copies only contain the interactions of this function and not the
+        # columns of the whole report
+        return BlameResultFunctionEntry(
+            self.name, self.demangled_name, deepcopy(self.interactions, memo),
+            self.num_instructions
+        )
+
     def __str__(self) -> str:
         str_representation = "{name} ({demangled_name})\n".format(
             name=self.name, demangled_name=self.demangled_name
         )
-        for inst in self.__inst_list:
+        for inst in self.interactions:
             str_representation += "  - {}".format(inst)
         return str_representation
 
@@ -232,6 +445,159 @@ class BlameReportMetaData():
         return BlameReportMetaData(num_functions, num_instructions)
 
 
+YamlEventIterator = tp.Iterator[yaml.Event]
+
+
+def _construct_plain_node(
+    event: yaml.Event, events: YamlEventIterator
+) -> tp.Any:
+    """
+    Construct a python object from the yaml node that starts with ``event``.
+
+    In contrast to the default yaml constructors, scalars are not resolved and
+    are always returned as strings.
+    """
+    if isinstance(event, yaml.ScalarEvent):
+        return event.value
+    if isinstance(event, yaml.SequenceStartEvent):
+        sequence: tp.List[tp.Any] = []
+        for item_event in events:
+            if isinstance(item_event, yaml.SequenceEndEvent):
+                return sequence
+            sequence.append(_construct_plain_node(item_event, events))
+    if isinstance(event, yaml.MappingStartEvent):
+        mapping: tp.Dict[str, tp.Any] = {}
+        for key_event in events:
+            if isinstance(key_event, yaml.MappingEndEvent):
+                return mapping
+            key = _construct_plain_node(key_event, events)
+            mapping[key] = _construct_plain_node(next(events), events)
+    raise yaml.YAMLError(f"Unexpected yaml event: {event}")
+
+
+def _start_next_document(events: YamlEventIterator) -> yaml.Event:
+    """Advance ``events`` to the next document and return the first event of
+    its root node."""
+    for event in events:
+        if isinstance(event, yaml.DocumentStartEvent):
+            return next(events)
+    raise yaml.YAMLError("Expected another yaml document.")
+
+
+def _next_plain_document(events: YamlEventIterator) -> tp.Any:
+    """Construct the next yaml document from the event stream."""
+    return _construct_plain_node(_start_next_document(events), events)
+
+
+def _parse_inst_entry(
+    events: YamlEventIterator, builder: _BlameInteractionColumnsBuilder
+) -> None:
+    """Parse one entry of an ``insts`` list directly into the ``builder``."""
+    base_commit_id = -1
+    interacting_commit_ids: tp.List[int] = []
+    amount = 0
+
+    for key_event in events:
+        if isinstance(key_event, yaml.MappingEndEvent):
+            break
+        key = key_event.value
+        value_event = next(events)
+        if key == 'base-hash':
+            base_commit_id = builder.intern_commit(value_event.value)
+        elif key == 'interacting-hashes' and isinstance(
+            value_event, yaml.SequenceStartEvent
+        ):
+            for hash_event in events:
+                if isinstance(hash_event, yaml.SequenceEndEvent):
+                    break
+                interacting_commit_ids.append(
+                    builder.intern_commit(hash_event.value)
+                )
+        elif key == 'amount':
+            amount = int(value_event.value)
+        else:
+            _construct_plain_node(value_event, events)
+
+    if base_commit_id < 0:
+        raise yaml.YAMLError("Found a blame interaction without base-hash.")
+    builder.add_interaction(base_commit_id, interacting_commit_ids, amount)
+
+
+_FunctionEntryInfo = tp.Tuple[str, str, int, tp.Tuple[int, int]]
+
+
+def _parse_function_entry(
+    name: str, events: YamlEventIterator,
+    builder: _BlameInteractionColumnsBuilder
+) -> _FunctionEntryInfo:
+    """Parse one function entry of the ``result-map``, adding its interactions
+    to the ``builder``."""
+    demangled_name = ""
+    num_instructions = 0
+    start = builder.num_interactions
+
+    for key_event in events:
+        if isinstance(key_event, yaml.MappingEndEvent):
+            break
+        key = key_event.value
+        value_event = next(events)
+        if key == 'demangled-name':
+            demangled_name = value_event.value
+        elif key == 'num-instructions':
+            num_instructions = int(value_event.value)
+        elif key == 'insts' and isinstance(
+            value_event, yaml.SequenceStartEvent
+        ):
+            for inst_event in events:
+                if isinstance(inst_event, yaml.SequenceEndEvent):
+                    break
+                _parse_inst_entry(events, builder)
+        else:
+            _construct_plain_node(value_event, events)
+
+    return name, demangled_name, num_instructions, (
+        start, builder.num_interactions
+    )
+
+
+def _parse_result_map(
+    events: YamlEventIterator
+) -> tp.Tuple[BlameInteractionColumns, tp.List[_FunctionEntryInfo]]:
+    """
+    Stream the ``result-map`` document of a blame report into interaction
+    columns without building the intermediate yaml document.
+
+    Returns:
+        the interaction columns and the parsed function entry infos
+    """
+    builder = _BlameInteractionColumnsBuilder()
+    function_infos: tp.List[_FunctionEntryInfo] = []
+
+    root_event = _start_next_document(events)
+    if not isinstance(root_event, yaml.MappingStartEvent):
+        raise yaml.YAMLError("Expected a result-map document.")
+
+    for key_event in events:
+        if isinstance(key_event, yaml.MappingEndEvent):
+            break
+        value_event = next(events)
+        if key_event.value != 'result-map' or not isinstance(
+            value_event, yaml.MappingStartEvent
+        ):
+            _construct_plain_node(value_event, events)
+            continue
+
+        for func_name_event in events:
+            if isinstance(func_name_event, yaml.MappingEndEvent):
+                break
+            next(events)  # MappingStartEvent of the function entry
+            function_infos.append(
+                _parse_function_entry(func_name_event.value, events, builder)
+            )
+
+    return builder.build(), function_infos
+
+
 class BlameReport(BaseReport):
     """Full blame report containing all blame interactions."""
 
@@ -241,27 +607,107 @@ class BlameReport(BaseReport):
     def __init__(self, path: Path) -> None:
         super().__init__(path)
         self.__path = path
+
+        sidecar = load_report_sidecar(path, "BlameReport", 4)
+        if sidecar is None:
+            version_header, function_infos = self.__parse_yaml(path)
+            store_report_sidecar(
+                path, version_header, lambda: self.__to_sidecar(function_infos)
+            )
+        else:
+            function_infos = self.__load_sidecar(sidecar[1])
+
+        self.__function_entries: tp.Dict[str, BlameResultFunctionEntry] = {
+            name: BlameResultFunctionEntry(
+                name, demangled_name, None, num_instructions,
+                self.__interaction_columns, interaction_range
+            ) for name, demangled_name, num_instructions, interaction_range in
+            function_infos
+        }
+
+    def __parse_yaml(
+        self, path: Path
+    ) -> tp.Tuple[VersionHeader, tp.List[_FunctionEntryInfo]]:
         with open(path, 'r') as stream:
-            documents = yaml.load_all(stream, Loader=yaml.CLoader)
-            version_header = VersionHeader(next(documents))
+            events = yaml.parse(stream, Loader=yaml.CLoader)
+            version_header = VersionHeader(_next_plain_document(events))
             version_header.raise_if_not_type("BlameReport")
             version_header.raise_if_version_is_less_than(4)
 
             self.__meta_data = BlameReportMetaData \
-                .create_blame_report_meta_data(next(documents))
-
-            self.__function_entries: tp.Dict[str,
-                                             BlameResultFunctionEntry] = dict()
-            raw_blame_report = next(documents)
-            for raw_func_entry in raw_blame_report['result-map']:
-                new_function_entry = (
-                    BlameResultFunctionEntry.create_blame_result_function_entry(
-                        raw_func_entry,
-                        raw_blame_report['result-map'][raw_func_entry]
-                    )
+                .create_blame_report_meta_data(_next_plain_document(events))
+
+            self.__interaction_columns, function_infos = _parse_result_map(
+                events
+            )
+
+        return version_header, function_infos
+
+    def __to_sidecar(
+        self, function_infos: tp.List[_FunctionEntryInfo]
+    ) -> tp.Dict[str, np.ndarray]:
+        columns = self.__interaction_columns
+        arrays: tp.Dict[str, np.ndarray] = {
+            "meta_data":
+                np.array([
+                    self.__meta_data.num_functions,
+                    self.__meta_data.num_instructions
+                ],
+                         dtype=np.int64),
+            "base_commit_ids":
+                columns.base_commit_ids,
+            "interacting_commit_offsets":
+                columns.interacting_commit_offsets,
+            "interacting_commit_ids":
+                columns.interacting_commit_ids,
+            "amounts":
+                columns.amounts,
+            "function_num_instructions":
+                np.array([info[2] for info in function_infos], dtype=np.int64),
+            "function_ranges":
+                np.array([info[3] for info in function_infos],
+                         dtype=np.int64).reshape(-1, 2)
+        }
+        store_strings(
+            arrays, "commit_hashes",
+            [commit.commit_hash for commit in columns.commits]
+        )
+        store_strings(
+            arrays, "commit_repos",
+            [commit.repository_name for commit in columns.commits]
+        )
+        store_strings(
+            arrays, "function_names", [info[0] for info in function_infos]
+        )
+        store_strings(
+            arrays, "function_demangled_names",
+            [info[1] for info in function_infos]
+        )
+        return arrays
+
+    def __load_sidecar(self,
+                       arrays: SidecarArrays) -> tp.List[_FunctionEntryInfo]:
+        num_functions, num_instructions = arrays["meta_data"].tolist()
+        self.__meta_data = BlameReportMetaData(num_functions, num_instructions)
+
+        self.__interaction_columns = BlameInteractionColumns(
+            [
+                CommitRepoPair(commit_hash, repo_name)
+                for commit_hash, repo_name in zip(
+                    load_strings(arrays, "commit_hashes"),
+                    load_strings(arrays, "commit_repos")
                 )
-                self.__function_entries[new_function_entry.name
-                                       ] = new_function_entry
+            ], arrays["base_commit_ids"], arrays["interacting_commit_offsets"],
+            arrays["interacting_commit_ids"], arrays["amounts"]
+        )
+
+        return [(name, demangled_name, num_insts, (start, end))
+                for name, demangled_name, num_insts, (start, end) in zip(
+                    load_strings(arrays, "function_names"),
+                    load_strings(arrays, "function_demangled_names"
+                                ), arrays["function_num_instructions"].tolist(),
+                    arrays["function_ranges"].tolist()
+                )]
 
     def get_blame_result_function_entry(
         self, mangled_function_name: str
@@ -279,6 +725,11 @@ class BlameReport(BaseReport):
         """Iterate over all function entries."""
         return self.__function_entries.values()
 
+    @property
+    def interaction_columns(self) -> BlameInteractionColumns:
+        """Array-backed storage of all interactions in the report."""
+        return self.__interaction_columns
+
     @property
     def head_commit(self) -> str:
         """The current HEAD commit under which this CommitReport was created."""
@@ -425,21 +876,388 @@ class BlameReportDiff():
         return str_representation
 
 
-ElementType = tp.TypeVar('ElementType')
+def _sum_amounts_by_key(keys: np.ndarray,
+                        amounts: np.ndarray) -> tp.List[tp.Tuple[int, int]]:
+    """
+    Sums up the ``amounts`` per key, keeping the keys in the order of their
+    first occurrence.
 
+    Args:
+        keys: key of every interaction
+        amounts: amount of every interaction
 
-def __count_elements(
-    report: tp.Union[BlameReport, BlameReportDiff],
-    get_elements_from_interaction: tp.Callable[[BlameInstInteractions],
-                                               tp.Iterable[ElementType]]
-) -> int:
-    elements: tp.Set[ElementType] = set()
+    Returns:
+        list of tuples (key, summed amount)
+    """
+    if len(keys) == 0:
+        return []
+
+    unique_keys, first_idx, inverse = np.unique(
+        keys, return_index=True, return_inverse=True
+    )
+    sums = np.zeros(len(unique_keys), dtype=np.int64)
+    np.add.at(sums, inverse, amounts)
+    order = np.argsort(first_idx, kind='stable')
+    return list(zip(unique_keys[order].tolist(), sums[order].tolist()))
 
+
+def _get_interaction_columns(
+    report: tp.Union[BlameReport, BlameReportDiff]
+) -> BlameInteractionColumns:
+    """Array-backed interactions of a report, which are collected from the
+    function entries for reports that do not store them as columns."""
+    if isinstance(report, BlameReport):
+        return report.interaction_columns
+
+    builder = _BlameInteractionColumnsBuilder()
     for func_entry in report.function_entries:
         for interaction in func_entry.interactions:
-            elements.update(get_elements_from_interaction(interaction))
+            builder.add_interaction(
+                builder.intern_commit_repo_pair(interaction.base_commit), [
+                    builder.intern_commit_repo_pair(commit)
+                    for commit in interaction.interacting_commits
+                ], interaction.amount
+            )
+    return builder.build()
+
+
+def _aggregate_segments(
+    values: np.ndarray, counts: np.ndarray,
+    aggregate_function: tp.Callable[[tp.Sequence[tp.Union[int, float]]],
+                                    tp.Union[int, float]]
+) -> np.ndarray:
+    """
+    Aggregates consecutive segments of ``values``.
+
+    Args:
+        values: values of all segments
+        counts: length of every segment
+        aggregate_function: to aggregate the values of a segment
+
+    Returns:
+        aggregated value of every segment, 0 for empty segments
+    """
+    non_empty = counts > 0
+    starts = np.cumsum(counts) - counts
+    if aggregate_function in (max, np.max, np.amax):
+        aggregated = np.zeros(len(counts), dtype=values.dtype)
+        if len(values):
+            aggregated[non_empty] = np.maximum.reduceat(
+                values, starts[non_empty]
+            )
+    elif aggregate_function in (np.average, np.mean):
+        aggregated = np.zeros(len(counts), dtype=np.float64)
+        if len(values):
+            aggregated[non_empty] = np.add.reduceat(values, starts[non_empty]
+                                                   ) / counts[non_empty]
+    else:
+        aggregated = np.array([
+            aggregate_function(segment.tolist()) if len(segment) else 0
+            for segment in np.split(values, starts[1:])
+        ],
+                              dtype=np.float64)
+    return aggregated
+
+
+class BlameReportAnalysis():
+    """
+    Computes the interaction, author, and time-delta degree distributions of a
+    report.
+
+    The interactions of the report are collected only once and the metadata of
+    every commit is looked up at most once, so that any number of distributions
+    can be computed without traversing the report again.
+
+    Args:
+        report: the blame report or diff
+        commit_lookup: function to look up commit metadata, only required for
+                       author and time-delta distributions
+    """
 
-    return len(elements)
+    def __init__(
+        self,
+        report: tp.Union[BlameReport, BlameReportDiff],
+        commit_lookup: tp.Optional[CommitMetadataLookupTy] = None
+    ) -> None:
+        self.__columns = _get_interaction_columns(report)
+        self.__commit_lookup = commit_lookup
+
+        num_commits = len(self.__columns.commits)
+        self.__interaction_ids = np.repeat(
+            np.arange(len(self.__columns)), self.__columns.degrees
+        )
+        self.__committed = np.array([
+            commit.commit_hash != UNCOMMITTED_COMMIT_HASH
+            for commit in self.__columns.commits
+        ],
+                                    dtype=bool)
+
+        self.__resolved = np.zeros(num_commits, dtype=bool)
+        self.__author_ids = np.full(num_commits, -1, dtype=np.int64)
+        self.__commit_times = np.zeros(num_commits, dtype=np.int64)
+        self.__author_to_id: tp.Dict[str, int] = {}
+
+        self.__author_degrees: tp.Optional[np.ndarray] = None
+        self.__time_deltas: tp.Optional[tp.Tuple[np.ndarray, np.ndarray,
+                                                 np.ndarray]] = None
+
+    @property
+    def interaction_columns(self) -> BlameInteractionColumns:
+        """Array-backed interactions of the analyzed report."""
+        return self.__columns
+
+    def __resolve_commits(self, commit_ids: np.ndarray) -> None:
+        """Looks up the metadata of all commits in ``commit_ids`` that were not
+        looked up before and interns their authors."""
+        if self.__commit_lookup is None:
+            raise ValueError(
+                "Author and time-delta distributions require a commit lookup."
+            )
+
+        missing = np.unique(commit_ids)
+        missing = missing[~self.__resolved[missing] & self.__committed[missing]]
+        for commit_id in missing.tolist():
+            commit = self.__columns.commits[commit_id]
+            metadata = self.__commit_lookup(
+                commit.commit_hash, commit.repository_name
+            )
+            # Issue (se-passau/VaRA#647): improve author uniquifying
+            self.__author_ids[commit_id] = self.__author_to_id.setdefault(
+                metadata[COMMIT_AUTHOR_NAME], len(self.__author_to_id)
+            )
+            self.__commit_times[commit_id] = metadata[COMMIT_TIME]
+        self.__resolved[missing] = True
+
+    def __get_interacting_authors(self) -> np.ndarray:
+        """Author id of every interacting commit, -1 for uncommitted
+        changes."""
+        self.__resolve_commits(self.__columns.interacting_commit_ids)
+        return tp.cast(
+            np.ndarray, self.__author_ids[self.__columns.interacting_commit_ids]
+        )
+
+    def __get_author_degrees(self) -> np.ndarray:
+        """Number of unique authors of the interacting commits of every
+        interaction."""
+        if self.__author_degrees is None:
+            interacting_authors = self.__get_interacting_authors()
+            committed = interacting_authors >= 0
+            num_authors = max(len(self.__author_to_id), 1)
+            unique_interaction_authors = np.unique(
+                self.__interaction_ids[committed] * num_authors +
+                interacting_authors[committed]
+            )
+            self.__author_degrees = np.bincount(
+                unique_interaction_authors // num_authors,
+                minlength=len(self.__columns)
+            )
+        return self.__author_degrees
+
+    def __get_time_deltas(self) -> tp.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Time deltas between the base commit and the interacting commits.
+
+        Interactions with an uncommitted base commit and uncommitted
+        interacting commits are ignored.
+
+        Returns:
+            tuple (used_interactions, delta_counts, time_deltas), where
+            ``used_interactions`` masks the considered interactions,
+            ``delta_counts`` is the number of deltas of every interaction, and
+            ``time_deltas`` contains the deltas of all interactions in days
+        """
+        if self.__time_deltas is None:
+            columns = self.__columns
+            used_interactions = self.__committed[columns.base_commit_ids]
+            used_entries = used_interactions[self.__interaction_ids
+                                            ] & self.__committed[
+                                                columns.interacting_commit_ids]
+            entry_commit_ids = columns.interacting_commit_ids[used_entries]
+            entry_interaction_ids = self.__interaction_ids[used_entries]
+
+            self.__resolve_commits(
+                np.concatenate((
+                    columns.base_commit_ids[used_interactions], entry_commit_ids
+                ))
+            )
+            base_times = self.__commit_times[columns.base_commit_ids]
+            # like timedelta.days, the differences are floored to full days
+            time_deltas = np.abs((
+                base_times[entry_interaction_ids] -
+                self.__commit_times[entry_commit_ids]
+            ) // 86400)
+            self.__time_deltas = (
+                used_interactions,
+                np.bincount(entry_interaction_ids,
+                            minlength=len(columns)), time_deltas
+            )
+        return self.__time_deltas
+
+    def num_interactions(self) -> int:
+        """
+        Counts the number of interactions.
+
+        Returns:
+            the number of interactions in the report
+        """
+        return int(np.abs(self.__columns.amounts).sum())
+
+    def num_interacting_commits(self) -> int:
+        """
+        Counts the number of unique interacting commits.
+
+        Returns:
+            the number unique interacting commits in the report
+        """
+        return len(np.unique(self.__columns.interacting_commit_ids))
+
+    def num_interacting_authors(self) -> int:
+        """
+        Counts the number of unique interacting authors.
+
+        Returns:
+            the number unique interacting authors in the report
+        """
+        interacting_authors = self.__get_interacting_authors()
+        return len(np.unique(interacting_authors[interacting_authors >= 0]))
+
+    def degree_tuples(self) -> tp.List[tp.Tuple[int, int]]:
+        """
+        Generates a list of tuples (degree, amount), see
+        :func:`generate_degree_tuples`.
+
+        Returns:
+            list of tuples (degree, amount)
+        """
+        return _sum_amounts_by_key(
+            self.__columns.degrees, self.__columns.amounts
+        )
+
+    def lib_dependent_degrees(
+        self
+    ) -> tp.Dict[str, tp.Dict[str, tp.List[tp.Tuple[int, int]]]]:
+        """
+        Generates the degree tuples categorised by library, see
+        :func:`generate_lib_dependent_degrees`.
+
+        Returns:
+            Map of tuples (degree, amount) categorised by their corresponding
+            library name to their corresponding base library name.
+        """
+        columns = self.__columns
+        repo_to_id: tp.Dict[str, int] = {}
+        commit_repo_ids = np.array([
+            repo_to_id.setdefault(commit.repository_name, len(repo_to_id))
+            for commit in columns.commits
+        ],
+                                   dtype=np.int64)
+        repo_names = list(repo_to_id)
+        num_repos = max(len(repo_names), 1)
+
+        base_repo_ids = commit_repo_ids[columns.base_commit_ids]
+        result_dict: tp.Dict[str, tp.Dict[str, tp.List[tp.Tuple[int,
+                                                                int]]]] = {}
+        for base_repo_id in base_repo_ids.tolist():
+            result_dict.setdefault(repo_names[base_repo_id], {})
+        if len(columns.interacting_commit_ids) == 0:
+            return result_dict
+
+        # number of interacting commits per interaction and library, in the
+        # order in which the libraries occur in the interactions
+        lib_keys = self.__interaction_ids * num_repos + commit_repo_ids[
+            columns.interacting_commit_ids]
+        unique_lib_keys, first_idx, lib_degrees = np.unique(
+            lib_keys, return_index=True, return_counts=True
+        )
+        order = np.argsort(first_idx, kind='stable')
+        lib_interactions = unique_lib_keys[order] // num_repos
+        inter_repo_ids = unique_lib_keys[order] % num_repos
+
+        # sum up the amounts per (base library, interacting library, degree)
+        max_degree = int(lib_degrees.max()) + 1
+        keys = (base_repo_ids[lib_interactions] * num_repos +
+                inter_repo_ids) * max_degree + lib_degrees[order]
+        for key, amount in _sum_amounts_by_key(
+            keys, columns.amounts[lib_interactions]
+        ):
+            repo_pair, degree = divmod(key, max_degree)
+            base_repo_id, inter_repo_id = divmod(repo_pair, num_repos)
+            result_dict[repo_names[base_repo_id]
+                       ].setdefault(repo_names[inter_repo_id],
+                                    []).append((degree, amount))
+
+        return result_dict
+
+    def author_degree_tuples(self) -> tp.List[tp.Tuple[int, int]]:
+        """
+        Generates a list of tuples (author_degree, amount), see
+        :func:`generate_author_degree_tuples`.
+
+        Returns:
+            list of tuples (author_degree, amount)
+        """
+        return _sum_amounts_by_key(
+            self.__get_author_degrees(), self.__columns.amounts
+        )
+
+    def time_delta_distribution_tuples(
+        self, bucket_size: int,
+        aggregate_function: tp.Callable[[tp.Sequence[tp.Union[int, float]]],
+                                        tp.Union[int, float]]
+    ) -> tp.List[tp.Tuple[int, int]]:
+        """
+        Generates a list of tuples that represent the distribution of time
+        delta interactions, see :func:`generate_time_delta_distribution_tuples`.
+
+        Args:
+            bucket_size: size of a time bucket in days
+            aggregate_function: to aggregate the delta values of all
+                                interacting commits
+
+        Returns:
+            list of (degree, amount) tuples
+        """
+        used_interactions, delta_counts, time_deltas = self.__get_time_deltas()
+        degrees = _aggregate_segments(
+            time_deltas, delta_counts, aggregate_function
+        )
+        buckets = np.round(degrees / bucket_size).astype(np.int64)
+        return _sum_amounts_by_key(
+            buckets[used_interactions],
+            self.__columns.amounts[used_interactions]
+        )
+
+    def avg_time_distribution_tuples(
+        self, bucket_size: int
+    ) -> tp.List[tp.Tuple[int, int]]:
+        """
+        Generates a list of tuples that represent the distribution of average
+        time delta interactions, see
+        :func:`generate_avg_time_distribution_tuples`.
+
+        Args:
+            bucket_size: size of a time bucket in days
+
+        Returns:
+            list of (degree, avg_time) tuples
+        """
+        return self.time_delta_distribution_tuples(bucket_size, np.average)
+
+    def max_time_distribution_tuples(
+        self, bucket_size: int
+    ) -> tp.List[tp.Tuple[int, int]]:
+        """
+        Generates a list of tuples that represent the distribution of maximal
+        time delta interactions, see
+        :func:`generate_max_time_distribution_tuples`.
+
+        Args:
+            bucket_size: size of a time bucket in days
+
+        Returns:
+            list of (degree, max_time) tuples
+        """
+        return self.time_delta_distribution_tuples(bucket_size, max)
 
 
 def count_interactions(report: tp.Union[BlameReport, BlameReportDiff]) -> int:
@@ -452,13 +1270,7 @@ def count_interactions(report: tp.Union[BlameReport, BlameReportDiff]) -> int:
     Returns:
         the number of interactions in this report or diff
     """
-    amount = 0
-
-    for func_entry in report.function_entries:
-        for interaction in func_entry.interactions:
-            amount += abs(interaction.amount)
-
-    return amount
+    return BlameReportAnalysis(report).num_interactions()
 
 
 def count_interacting_commits(
@@ -473,37 +1285,56 @@ def count_interacting_commits(
     Returns:
         the number unique interacting commits in this report or diff
     """
-    return __count_elements(
-        report, lambda interaction: interaction.interacting_commits
-    )
+    return BlameReportAnalysis(report).num_interacting_commits()
+
+
+def get_commit_repo_pairs(
+    report: tp.Union[BlameReport, BlameReportDiff]
+) -> tp.Set[CommitRepoPair]:
+    """
+    Collects all base and interacting commits of a report, e.g., to prefetch
+    their metadata.
+
+    Args:
+        report: the blame report or diff
+
+    Returns:
+        set of all commits that occur in the report
+    """
+    if isinstance(report, BlameReport):
+        # collect the commits from the columns without creating the
+        # interaction objects
+        columns = report.interaction_columns
+        commit_ids = np.unique(
+            np.concatenate(
+                (columns.base_commit_ids, columns.interacting_commit_ids)
+            )
+        )
+        return {columns.commits[commit_id] for commit_id in commit_ids.tolist()}
+
+    cr_pairs: tp.Set[CommitRepoPair] = set()
+    for func_entry in report.function_entries:
+        for interaction in func_entry.interactions:
+            cr_pairs.add(interaction.base_commit)
+            cr_pairs.update(interaction.interacting_commits)
+    return cr_pairs
 
 
 def count_interacting_authors(
     report: tp.Union[BlameReport, BlameReportDiff],
-    commit_lookup: CommitLookupTy
+    commit_lookup: CommitMetadataLookupTy
 ) -> int:
     """
     Counts the number of unique interacting authors.
 
     Args:
         report: the blame report or diff
-        commit_lookup: function to look up commits
+        commit_lookup: function to look up commit metadata
 
     Returns:
         the number unique interacting authors in this report or diff
     """
-
-    def extract_interacting_authors(
-        interaction: BlameInstInteractions
-    ) -> tp.Iterable[str]:
-        return map_commits(
-            # Issue (se-passau/VaRA#647): improve author uniquifying
-            lambda c: tp.cast(str, c.author.name),
-            interaction.interacting_commits,
-            commit_lookup
-        )
-
-    return __count_elements(report, extract_interacting_authors)
+    return BlameReportAnalysis(report, commit_lookup).num_interacting_authors()
 
 
 def generate_degree_tuples(
@@ -521,14 +1352,7 @@ def generate_degree_tuples(
     Returns:
         list of tuples (degree, amount)
     """
-    degree_dict: DegreeAmountMappingTy = defaultdict(int)
-
-    for func_entry in report.function_entries:
-        for interaction in func_entry.interactions:
-            degree = len(interaction.interacting_commits)
-            degree_dict[degree] += interaction.amount
-
-    return list(degree_dict.items())
+    return BlameReportAnalysis(report).degree_tuples()
 
 
 InteractingCommitRepoPairToAmountMapping = tp.Dict[CommitRepoPair, int]
@@ -586,60 +1410,12 @@ def generate_lib_dependent_degrees(
         Map of tuples (degree, amount) categorised by their corresponding
         library name to their corresponding base library name.
     """
-
-    base_inter_lib_degree_amount_mapping: tp.Dict[str, tp.Dict[
-        str, DegreeAmountMappingTy]] = {}
-
-    for func_entry in report.function_entries:
-        for interaction in func_entry.interactions:
-            base_repo_name = interaction.base_commit.repository_name
-            tmp_degree_of_libs: tp.Dict[str, int] = {}
-
-            if base_repo_name not in base_inter_lib_degree_amount_mapping:
-                base_inter_lib_degree_amount_mapping[base_repo_name] = {}
-
-            for inter_hash in interaction.interacting_commits:
-                inter_hash_repo_name = inter_hash.repository_name
-
-                if (
-                    inter_hash_repo_name not in
-                    base_inter_lib_degree_amount_mapping[base_repo_name]
-                ):
-                    base_inter_lib_degree_amount_mapping[base_repo_name][
-                        inter_hash_repo_name] = {}
-
-                if inter_hash_repo_name not in tmp_degree_of_libs:
-                    tmp_degree_of_libs[inter_hash_repo_name] = 1
-                else:
-                    tmp_degree_of_libs[inter_hash_repo_name] += 1
-
-            for repo_name, degree in tmp_degree_of_libs.items():
-                if (
-                    degree not in base_inter_lib_degree_amount_mapping[
-                        base_repo_name][repo_name]
-                ):
-                    base_inter_lib_degree_amount_mapping[base_repo_name][
-                        repo_name][degree] = 0
-
-                base_inter_lib_degree_amount_mapping[base_repo_name][repo_name][
-                    degree] += interaction.amount
-
-    # Transform to tuples (degree, amount)
-    result_dict: tp.Dict[str, tp.Dict[str, tp.List[tp.Tuple[int, int]]]] = {}
-    for base_name, inter_lib_dict in base_inter_lib_degree_amount_mapping.items(
-    ):
-        result_dict[base_name] = {}
-        for inter_lib_name, degree_amount_dict in inter_lib_dict.items():
-            result_dict[base_name][inter_lib_name] = list(
-                degree_amount_dict.items()
-            )
-
-    return result_dict
+    return BlameReportAnalysis(report).lib_dependent_degrees()
 
 
 def generate_author_degree_tuples(
     report: tp.Union[BlameReport, BlameReportDiff],
-    commit_lookup: CommitLookupTy
+    commit_lookup: CommitMetadataLookupTy
 ) -> tp.List[tp.Tuple[int, int]]:
     """
     Generates a list of tuples (author_degree, amount) where author_degree is
@@ -649,32 +1425,17 @@ def generate_author_degree_tuples(
 
     Args:
         report: the blame report
-        commit_lookup: function to look up commits
+        commit_lookup: function to look up commit metadata
 
     Returns:
         list of tuples (author_degree, amount)
     """
-
-    degree_dict: tp.DefaultDict[int, int] = defaultdict(int)
-
-    for func_entry in report.function_entries:
-        for interaction in func_entry.interactions:
-            author_list = map_commits(
-                # Issue (se-passau/VaRA#647): improve author uniquifying
-                lambda c: tp.cast(str, c.author.name),
-                interaction.interacting_commits,
-                commit_lookup
-            )
-
-            degree = len(set(author_list))
-            degree_dict[degree] += interaction.amount
-
-    return list(degree_dict.items())
+    return BlameReportAnalysis(report, commit_lookup).author_degree_tuples()
 
 
 def generate_time_delta_distribution_tuples(
     report: tp.Union[BlameReport, BlameReportDiff],
-    commit_lookup: CommitLookupTy, bucket_size: int,
+    commit_lookup: CommitMetadataLookupTy, bucket_size: int,
     aggregate_function: tp.Callable[[tp.Sequence[tp.Union[int, float]]],
                                     tp.Union[int, float]]
 ) -> tp.List[tp.Tuple[int, int]]:
@@ -687,7 +1448,7 @@ def generate_time_delta_distribution_tuples(
 
     Args:
         report: to analyze
-        commit_lookup: function to look up commits
+        commit_lookup: function to look up commit metadata
         bucket_size: size of a time bucket in days
         aggregate_function: to aggregate the delta values of all
                             interacting commits
@@ -695,44 +1456,15 @@ def generate_time_delta_distribution_tuples(
     Returns:
         list of (degree, amount) tuples
     """
-    degree_dict: tp.DefaultDict[int, int] = defaultdict(int)
-
-    for func_entry in report.function_entries:
-        for interaction in func_entry.interactions:
-            if (
-                interaction.base_commit.commit_hash ==
-                "0000000000000000000000000000000000000000"
-            ):
-                continue
-
-            base_commit = commit_lookup(
-                interaction.base_commit.commit_hash,
-                interaction.base_commit.repository_name
-            )
-            base_c_time = datetime.utcfromtimestamp(base_commit.commit_time)
-
-            def translate_to_time_deltas2(
-                commit: pygit2.Commit,
-                base_time: datetime = base_c_time
-            ) -> int:
-                other_c_time = datetime.utcfromtimestamp(commit.commit_time)
-                return abs((base_time - other_c_time).days)
-
-            author_list = map_commits(
-                translate_to_time_deltas2, interaction.interacting_commits,
-                commit_lookup
-            )
-
-            degree = aggregate_function(author_list) if author_list else 0
-            bucket = round(degree / bucket_size)
-            degree_dict[bucket] += interaction.amount
-
-    return list(degree_dict.items())
+    return BlameReportAnalysis(report,
+                               commit_lookup).time_delta_distribution_tuples(
+                                   bucket_size, aggregate_function
+                               )
 
 
 def generate_avg_time_distribution_tuples(
     report: tp.Union[BlameReport, BlameReportDiff],
-    commit_lookup: CommitLookupTy, bucket_size: int
+    commit_lookup: CommitMetadataLookupTy, bucket_size: int
 ) -> tp.List[tp.Tuple[int, int]]:
     """
     Generates a list of tuples that represent the distribution of average time
@@ -742,20 +1474,19 @@ def generate_avg_time_distribution_tuples(
 
     Args:
         report: to analyze
-        commit_lookup: function to look up commits
+        commit_lookup: function to look up commit metadata
         bucket_size: size of a time bucket in days
 
     Returns:
         list of (degree, avg_time) tuples
     """
-    return generate_time_delta_distribution_tuples(
-        report, commit_lookup, bucket_size, np.average
-    )
+    return BlameReportAnalysis(report, commit_lookup
+                              ).avg_time_distribution_tuples(bucket_size)
 
 
 def generate_max_time_distribution_tuples(
     report: tp.Union[BlameReport, BlameReportDiff],
-    commit_lookup: CommitLookupTy, bucket_size: int
+    commit_lookup: CommitMetadataLookupTy, bucket_size: int
 ) -> tp.List[tp.Tuple[int, int]]:
     """
     Generates a list of tuples that represent the distribution of maximal time
@@ -766,15 +1497,14 @@ def generate_max_time_distribution_tuples(
 
     Args:
         report: to analyze
-        commit_lookup: function to look up commits
+        commit_lookup: function to look up commit metadata
         bucket_size: size of a time bucket in days
 
     Returns:
         list of (degree, max_time) tuples
     """
-    return generate_time_delta_distribution_tuples(
-        report, commit_lookup, bucket_size, max
-    )
+    return BlameReportAnalysis(report, commit_lookup
+                              ).max_time_distribution_tuples(bucket_size)
 
 
 def generate_in_head_interactions(
@@ -3,10 +3,20 @@ import logging
 import typing as tp
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import yaml
 
 from varats.base.version_header import VersionHeader
+from varats.data.report_sidecar import (
+    SidecarArrays,
+    load_report_sidecar,
+    load_strings,
+    load_values,
+    store_report_sidecar,
+    store_strings,
+    store_values,
+)
 from varats.mapping.commit_map import CommitMap
 from varats.report.report import BaseReport, FileStatusExtension, MetaReport
 
@@ -143,6 +153,15 @@ class CommitReport(BaseReport):
 
     def __init__(self, path: Path) -> None:
         super().__init__(path)
+        self.finfos: tp.Dict[str, FunctionInfo] = dict()
+        self.region_mappings: tp.Dict[str, RegionMapping] = dict()
+        self.graph_info: tp.Dict[str, FunctionGraphEdges] = dict()
+
+        sidecar = load_report_sidecar(path, "CommitReport", 3)
+        if sidecar is not None:
+            self.__load_sidecar(sidecar[1])
+            return
+
         with open(path, "r") as stream:
             documents = yaml.load_all(stream, Loader=yaml.CLoader)
             version_header = VersionHeader(next(documents))
@@ -150,12 +169,10 @@ class CommitReport(BaseReport):
             version_header.raise_if_version_is_less_than(3)
 
             raw_infos = next(documents)
-            self.finfos: tp.Dict[str, FunctionInfo] = dict()
             for raw_finfo in raw_infos['function-info']:
                 finfo = FunctionInfo(raw_finfo)
                 self.finfos[finfo.name] = finfo
 
-            self.region_mappings: tp.Dict[str, RegionMapping] = dict()
             raw_region_mapping = raw_infos['region-mapping']
             if raw_region_mapping is not None:
                 for raw_r_mapping in raw_region_mapping:
@@ -163,12 +180,114 @@ class CommitReport(BaseReport):
                     self.region_mappings[r_mapping.id] = r_mapping
 
             gedges = next(documents)
-            self.graph_info: tp.Dict[str, FunctionGraphEdges] = dict()
-
             for raw_fg_edge in gedges:
                 f_edge = FunctionGraphEdges(raw_fg_edge)
                 self.graph_info[f_edge.fid] = f_edge
 
+        store_report_sidecar(path, version_header, self.__to_sidecar)
+
+    def __to_sidecar(self) -> tp.Dict[str, np.ndarray]:
+        arrays: tp.Dict[str, np.ndarray] = {}
+        finfos = list(self.finfos.values())
+        store_strings(arrays, "finfo_names", [finfo.name for finfo in finfos])
+        store_strings(arrays, "finfo_ids", [finfo.id for finfo in finfos])
+        store_strings(
+            arrays, "finfo_region_ids", [finfo.region_id for finfo in finfos]
+        )
+
+        mappings = list(self.region_mappings.values())
+        store_strings(arrays, "region_ids", [r_map.id for r_map in mappings])
+        store_strings(
+            arrays, "region_hashes", [r_map.hash for r_map in mappings]
+        )
+
+        graph_edges = list(self.graph_info.values())
+        store_values(
+            arrays, "graph_fids", [f_edge.fid for f_edge in graph_edges]
+        )
+        for key, get_edges in (
+            (
+                "cg", lambda f_edge: [(edge.region, edge.function)
+                                      for edge in f_edge.cg_edges]
+            ),
+            (
+                "cf", lambda f_edge: [(edge.edge_from, edge.edge_to)
+                                      for edge in f_edge.cf_edges]
+            ),
+            (
+                "df", lambda f_edge: [(edge.edge_from, edge.edge_to)
+                                      for edge in f_edge.df_relations]
+            ),
+        ):
+            edges_per_function = [get_edges(f_edge) for f_edge in graph_edges]
+            offsets = np.zeros(len(edges_per_function) + 1, dtype=np.int64)
+            np.cumsum([len(edges) for edges in edges_per_function],
+                      out=offsets[1:])
+            arrays[f"{key}_edge_offsets"] = offsets
+            store_values(
+                arrays, f"{key}_edge_from",
+                [edge[0] for edges in edges_per_function for edge in edges]
+            )
+            store_values(
+                arrays, f"{key}_edge_to",
+                [edge[1] for edges in edges_per_function for edge in edges]
+            )
+
+        return arrays
+
+    def __load_sidecar(self, arrays: SidecarArrays) -> None:
+        for name, fid, region_id in zip(
+            load_strings(arrays, "finfo_names"),
+            load_strings(arrays, "finfo_ids"),
+            load_strings(arrays, "finfo_region_ids")
+        ):
+            self.finfos[name] = FunctionInfo({
+                'function-name': name,
+                'id': fid,
+                'region-id': region_id
+            })
+
+        for region_id, region_hash in zip(
+            load_strings(arrays, "region_ids"),
+            load_strings(arrays, "region_hashes")
+        ):
+            self.region_mappings[region_id] = RegionMapping({
+                'id': region_id,
+                'hash': region_hash
+            })
+
+        edges: tp.Dict[str, tp.List[tp.List[tp.Tuple[tp.Any, tp.Any]]]] = {}
+        for key in ("cg", "cf", "df"):
+            edge_pairs = list(
+                zip(
+                    load_values(arrays, f"{key}_edge_from"),
+                    load_values(arrays, f"{key}_edge_to")
+                )
+            )
+            offsets = arrays[f"{key}_edge_offsets"].tolist()
+            edges[key] = [
+                edge_pairs[start:end]
+                for start, end in zip(offsets, offsets[1:])
+            ]
+
+        for idx, fid in enumerate(load_values(arrays, "graph_fids")):
+            self.graph_info[fid] = FunctionGraphEdges({
+                'function-id':
+                    fid,
+                'call-graph-edges': [{
+                    'from-region': region,
+                    'to-functions': [function]
+                } for region, function in edges["cg"][idx]],
+                'control-flow-edges': [{
+                    'from': edge_from,
+                    'to': edge_to
+                } for edge_from, edge_to in edges["cf"][idx]],
+                'data-flow-relations': [{
+                    'from': edge_from,
+                    'to': edge_to
+                } for edge_from, edge_to in edges["df"][idx]]
+            })
+
     @property
     def head_commit(self) -> str:
         """The current HEAD commit under which this CommitReport was created."""
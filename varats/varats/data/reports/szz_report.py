@@ -2,9 +2,17 @@
 import typing as tp
 from pathlib import Path
 
+import numpy as np
 import yaml
 
 from varats.base.version_header import VersionHeader
+from varats.data.report_sidecar import (
+    SidecarArrays,
+    load_report_sidecar,
+    load_strings,
+    store_report_sidecar,
+    store_strings,
+)
 from varats.provider.bug.bug import RawBug
 from varats.report.report import BaseReport, FileStatusExtension, MetaReport
 
@@ -21,6 +29,13 @@ class SZZReport(BaseReport):
 
     def __init__(self, path: Path, szz_tool: str):
         super().__init__(path)
+        self.__bugs: tp.Dict[str, RawBug] = {}
+
+        sidecar = load_report_sidecar(path, "SZZReport", 1)
+        if sidecar is not None:
+            self.__load_sidecar(sidecar[1], szz_tool)
+            return
+
         with open(path, 'r') as stream:
             documents = yaml.load_all(stream, Loader=yaml.CLoader)
             version_header = VersionHeader(next(documents))
@@ -31,10 +46,41 @@ class SZZReport(BaseReport):
                 raise AssertionError(
                     "Report was not created with the correct tool."
                 )
-            self.__bugs: tp.Dict[str, RawBug] = {}
             for fix, introducers in raw_report["bugs"].items():
                 self.__bugs[fix] = RawBug(fix, set(introducers), None)
 
+        store_report_sidecar(
+            path, version_header, lambda: self.__to_sidecar(szz_tool)
+        )
+
+    def __to_sidecar(self, szz_tool: str) -> tp.Dict[str, np.ndarray]:
+        arrays: tp.Dict[str, np.ndarray] = {}
+        bugs = list(self.__bugs.values())
+        store_strings(arrays, "szz_tool", [szz_tool])
+        store_strings(arrays, "fixes", [bug.fixing_commit for bug in bugs])
+        introducers = [sorted(bug.introducing_commits) for bug in bugs]
+        offsets = np.zeros(len(introducers) + 1, dtype=np.int64)
+        np.cumsum([len(intros) for intros in introducers], out=offsets[1:])
+        arrays["introducer_offsets"] = offsets
+        store_strings(
+            arrays, "introducers",
+            [intro for intros in introducers for intro in intros]
+        )
+        return arrays
+
+    def __load_sidecar(self, arrays: SidecarArrays, szz_tool: str) -> None:
+        if not load_strings(arrays, "szz_tool")[0] == szz_tool:
+            raise AssertionError(
+                "Report was not created with the correct tool."
+            )
+
+        introducers = load_strings(arrays, "introducers")
+        offsets = arrays["introducer_offsets"].tolist()
+        for fix, start, end in zip(
+            load_strings(arrays, "fixes"), offsets, offsets[1:]
+        ):
+            self.__bugs[fix] = RawBug(fix, set(introducers[start:end]), None)
+
     @staticmethod
     def get_file_name(
         project_name: str,
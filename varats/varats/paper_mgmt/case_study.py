@@ -8,6 +8,7 @@ from enum import Enum
 from itertools import groupby
 from pathlib import Path
 
+import pandas as pd
 import pygit2
 from benchbuild import Project
 
@@ -91,11 +92,117 @@ def failed_revisions_for_case_study(
     ]
 
 
+class RevisionStatusIndex():
+    """
+    Index of the file status of all tagged revisions of a project, keyed by the
+    short revision hash.
+
+    Args:
+        project_name: name of the project
+        result_file_type: report type of the result files
+        tag_blocked: if true, also blocked commits are tagged
+    """
+
+    def __init__(
+        self,
+        project_name: str,
+        result_file_type: MetaReport,
+        tag_blocked: bool = True
+    ) -> None:
+        self.__project_cls = get_project_cls_by_name(project_name)
+        self.__tag_blocked = tag_blocked
+
+        self.__tagged_revisions: tp.Dict[str,
+                                         tp.Tuple[str,
+                                                  FileStatusExtension]] = {}
+        for tagged_rev in get_tagged_revisions(
+            self.__project_cls, result_file_type, tag_blocked
+        ):
+            self.__tagged_revisions.setdefault(tagged_rev[0][:10], tagged_rev)
+
+    def get_revision_status(
+        self, revision: str
+    ) -> tp.Tuple[str, FileStatusExtension]:
+        """
+        Look up the file status of a revision.
+
+        Args:
+            revision: to look up
+
+        Returns:
+            tuple (revision, status), where revisions without result files are
+            tagged as blocked or missing
+        """
+        short_rev = revision[:10]
+        tagged_rev = self.__tagged_revisions.get(short_rev, None)
+        if tagged_rev is None:
+            if self.__tag_blocked and is_revision_blocked(
+                short_rev, self.__project_cls
+            ):
+                tagged_rev = (short_rev, FileStatusExtension.Blocked)
+            else:
+                tagged_rev = (short_rev, FileStatusExtension.Missing)
+            self.__tagged_revisions[short_rev] = tagged_rev
+        return tagged_rev
+
+    def get_revisions_status(
+        self, revisions: tp.Iterable[str]
+    ) -> tp.List[tp.Tuple[str, FileStatusExtension]]:
+        """
+        Look up the file status of multiple revisions.
+
+        Args:
+            revisions: to look up
+
+        Returns:
+            a list of (revision, status) tuples
+        """
+        return [self.get_revision_status(revision) for revision in revisions]
+
+
+class RevisionStatusCache():
+    """Shares the :class:`RevisionStatusIndex` of a project and report type
+    between the status computations of multiple case studies, e.g., for all
+    case studies of a paper config."""
+
+    def __init__(self) -> None:
+        self.__indices: tp.Dict[tp.Tuple[str, str, bool],
+                                RevisionStatusIndex] = {}
+
+    def get_index(
+        self,
+        project_name: str,
+        result_file_type: MetaReport,
+        tag_blocked: bool = True
+    ) -> RevisionStatusIndex:
+        """
+        Get the status index for a project, creating it on first use.
+
+        Args:
+            project_name: name of the project
+            result_file_type: report type of the result files
+            tag_blocked: if true, also blocked commits are tagged
+
+        Returns:
+            the status index of the project
+        """
+        key = (
+            project_name, str(getattr(result_file_type,
+                                      "SHORTHAND")), tag_blocked
+        )
+        if key not in self.__indices:
+            self.__indices[key] = RevisionStatusIndex(
+                project_name, result_file_type, tag_blocked
+            )
+        return self.__indices[key]
+
+
 def get_revisions_status_for_case_study(
     case_study: CaseStudy,
     result_file_type: MetaReport,
     stage_num: int = -1,
-    tag_blocked: bool = True
+    tag_blocked: bool = True,
+    status_cache: tp.Optional[RevisionStatusCache] = None
 ) -> tp.List[tp.Tuple[str, FileStatusExtension]]:
     """
     Computes the file status for all revisions in this case study.
@@ -105,46 +212,58 @@ def get_revisions_status_for_case_study(
         result_file_type: report type of the result files
         stage_num: only consider a specific stage of the case study
         tag_blocked: if true, also blocked commits are tagged
+        status_cache: cache to share the tagged revisions of a project between
+                      multiple calls
 
     Returns:
         a list of (revision, status) tuples
     """
-    project_cls = get_project_cls_by_name(case_study.project_name)
-    tagged_revisions = get_tagged_revisions(
-        project_cls, result_file_type, tag_blocked
-    )
+    if stage_num == -1:
+        revisions = case_study.revisions
+    elif stage_num < case_study.num_stages:
+        revisions = case_study.stages[stage_num].revisions
+    else:
+        return []
 
-    def filtered_tagged_revs(
-        rev_provider: tp.Iterable[str]
-    ) -> tp.List[tp.Tuple[str, FileStatusExtension]]:
-        filtered_revisions = []
-        for rev in rev_provider:
-            found = False
-            short_rev = rev[:10]
-            for tagged_rev in tagged_revisions:
-                if short_rev == tagged_rev[0][:10]:
-                    filtered_revisions.append(tagged_rev)
-                    found = True
-                    break
-            if not found:
-                if tag_blocked and is_revision_blocked(short_rev, project_cls):
-                    filtered_revisions.append(
-                        (short_rev, FileStatusExtension.Blocked)
-                    )
-                else:
-                    filtered_revisions.append(
-                        (short_rev, FileStatusExtension.Missing)
-                    )
-        return filtered_revisions
+    if status_cache is None:
+        status_cache = RevisionStatusCache()
+    return status_cache.get_index(
+        case_study.project_name, result_file_type, tag_blocked
+    ).get_revisions_status(revisions)
 
-    if stage_num == -1:
-        return filtered_tagged_revs(case_study.revisions)
 
-    if stage_num < case_study.num_stages:
-        stage = case_study.stages[stage_num]
-        return filtered_tagged_revs(stage.revisions)
+def get_revisions_status_df_for_case_study(
+    case_study: CaseStudy,
+    result_file_type: MetaReport,
+    stage_num: int = -1,
+    tag_blocked: bool = True,
+    status_cache: tp.Optional[RevisionStatusCache] = None
+) -> pd.DataFrame:
+    """
+    Computes the file status for all revisions in this case study as a
+    dataframe.
 
-    return []
+    Args:
+        case_study: to work on
+        result_file_type: report type of the result files
+        stage_num: only consider a specific stage of the case study
+        tag_blocked: if true, also blocked commits are tagged
+        status_cache: cache to share the tagged revisions of a project between
+                      multiple calls
+
+    Returns:
+        a dataframe with the columns ``revision`` and ``file_status``, which
+        contains the status extension of the revision's file status
+    """
+    tagged_revs = get_revisions_status_for_case_study(
+        case_study, result_file_type, stage_num, tag_blocked, status_cache
+    )
+    return pd.DataFrame({
+        "revision": [rev for rev, _ in tagged_revs],
+        "file_status":
+            [status.get_status_extension() for _, status in tagged_revs]
+    },
+                        columns=["revision", "file_status"])
 
 
 def get_revision_status_for_case_study(
@@ -472,12 +591,13 @@ def extend_with_distrib_sampling(
     # Needs to be sorted so the propability distribution over the length
     # of the list is the same as the distribution over the commits age history
     project_cls = get_project_cls_by_name(case_study.project_name)
+    rev_items = sorted(list(cmap.mapping_items()), key=lambda x: x[1])
+    in_merge_stage = case_study.has_revisions_in_stage([
+        rev_item[0] for rev_item in rev_items
+    ], kwargs['merge_stage'])
     revision_list = [
-        rev_item
-        for rev_item in sorted(list(cmap.mapping_items()), key=lambda x: x[1])
-        if not case_study.
-        has_revision_in_stage(rev_item[0], kwargs['merge_stage']) and
-        not is_blocked(rev_item[0], project_cls)
+        rev_item for rev_item, is_in_stage in zip(rev_items, in_merge_stage)
+        if not is_in_stage and not is_blocked(rev_item[0], project_cls)
     ]
 
     sampling_method = kwargs['distribution']
@@ -520,8 +640,11 @@ def extend_with_smooth_revs(
         )
 
     # Remove revision that are already present in another stage.
+    new_revision_list = list(new_revisions)
     new_revisions = {
-        rev for rev in new_revisions if not case_study.has_revision(rev)
+        rev for rev, is_in_case_study in
+        zip(new_revision_list, case_study.has_revisions(new_revision_list))
+        if not is_in_case_study
     }
     if new_revisions:
         print("Found new revisions: ", new_revisions)
@@ -14,6 +14,7 @@ import varats.paper_mgmt.paper_config as PC
 from varats.mapping.commit_map import create_lazy_commit_map_loader
 from varats.paper.case_study import CaseStudy
 from varats.paper_mgmt.case_study import (
+    RevisionStatusCache,
     get_revisions_status_for_case_study,
     get_newest_result_files_for_case_study,
 )
@@ -65,6 +66,7 @@ def show_status_of_case_studies(
     report_type = MetaReport.REPORT_TYPES[report_name]
     total_status_occurrences: tp.DefaultDict[FileStatusExtension,
                                              tp.Set[str]] = defaultdict(set)
+    status_cache = RevisionStatusCache()
 
     for case_study in output_case_studies:
         if print_rev_list:
@@ -73,14 +75,14 @@ def show_status_of_case_studies(
             print(
                 get_short_status(
                     case_study, report_type, longest_cs_name, True,
-                    total_status_occurrences
+                    total_status_occurrences, status_cache
                 )
             )
         else:
             print(
                 get_status(
                     case_study, report_type, longest_cs_name, sep_stages, sort,
-                    True, total_status_occurrences
+                    True, total_status_occurrences, status_cache
                 )
             )
 
@@ -222,7 +224,8 @@ def get_short_status(
     longest_cs_name: int,
     use_color: bool = False,
     total_status_occurrences: tp.Optional[tp.DefaultDict[FileStatusExtension,
-                                                         tp.Set[str]]] = None
+                                                         tp.Set[str]]] = None,
+    status_cache: tp.Optional[RevisionStatusCache] = None
 ) -> str:
     """
     Return a short string representation that describes the current status of
@@ -236,6 +239,8 @@ def get_short_status(
         use_color: add color escape sequences for highlighting
         total_status_occurrences: mapping from all occured status to a set of
                                   all revisions (total amount of revisions)
+        status_cache: cache to share the file status of revisions between
+                      multiple case studies
 
     Returns:
         a short string representation of a case study
@@ -250,7 +255,7 @@ def get_short_status(
     status_occurrences: tp.DefaultDict[FileStatusExtension,
                                        tp.Set[str]] = defaultdict(set)
     for tagged_rev in get_revisions_status_for_case_study(
-        case_study, result_file_type
+        case_study, result_file_type, status_cache=status_cache
     ):
         status_occurrences[tagged_rev[1]].add(tagged_rev[0])
 
@@ -270,7 +275,8 @@ def get_status(
     sort: bool,
     use_color: bool = False,
     total_status_occurrences: tp.Optional[tp.DefaultDict[FileStatusExtension,
-                                                         tp.Set[str]]] = None
+                                                         tp.Set[str]]] = None,
+    status_cache: tp.Optional[RevisionStatusCache] = None
 ) -> str:
     """
     Return a string representation that describes the current status of the case
@@ -285,13 +291,18 @@ def get_status(
         use_color: add color escape sequences for highlighting
         total_status_occurrences: mapping from all occured status to a set of
                                   all revisions (total amount of revisions)
+        status_cache: cache to share the file status of revisions between
+                      multiple case studies
 
     Returns:
         a full string representation of all case studies
     """
+    if status_cache is None:
+        status_cache = RevisionStatusCache()
+
     status = get_short_status(
         case_study, result_file_type, longest_cs_name, use_color,
-        total_status_occurrences
+        total_status_occurrences, status_cache
     ) + "\n"
 
     if sort:
@@ -309,7 +320,10 @@ def get_status(
                 status += " ({})".format(stage_name)
             status += "\n"
             tagged_revs = get_revisions_status_for_case_study(
-                case_study, result_file_type, stage_num
+                case_study,
+                result_file_type,
+                stage_num,
+                status_cache=status_cache
             )
             if sort:
                 tagged_revs = sorted(tagged_revs, key=rev_time, reverse=True)
@@ -322,7 +336,7 @@ def get_status(
         tagged_revs = list(
             dict.fromkeys(
                 get_revisions_status_for_case_study(
-                    case_study, result_file_type
+                    case_study, result_file_type, status_cache=status_cache
                 )
             )
         )
@@ -15,6 +15,7 @@ from varats.plot.plot import Plot
 from varats.plot.plot_utils import check_required_args
 from varats.project.project_util import get_project_cls_by_name
 from varats.report.report import FileStatusExtension, MetaReport
+from varats.revision.revisions import is_revision_blocked
 
 SUCCESS_COLOR = (0.5568627450980392, 0.7294117647058823, 0.25882352941176473)
 BLOCKED_COLOR = (0.20392156862745098, 0.5411764705882353, 0.7411764705882353)
@@ -51,8 +52,7 @@ def _gen_overview_data(tag_blocked: bool,
     for c_hash, index in commit_map.mapping_items():
         if not case_study.has_revision(c_hash):
             positions["background"].append(index)
-            if hasattr(project, "is_blocked_revision"
-                      ) and project.is_blocked_revision(c_hash)[0]:
+            if is_revision_blocked(c_hash, project):
                 positions["blocked_all"].append(index)
 
     revisions = FileStatusDatabase.get_data_for_project(
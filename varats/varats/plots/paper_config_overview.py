@@ -16,7 +16,10 @@ import varats.paper_mgmt.paper_config as PC
 from varats.data.databases.file_status_database import FileStatusDatabase
 from varats.data.reports.empty_report import EmptyReport
 from varats.mapping.commit_map import CommitMap
-from varats.paper_mgmt.case_study import get_revisions_status_for_case_study
+from varats.paper_mgmt.case_study import (
+    RevisionStatusCache,
+    get_revisions_status_for_case_study,
+)
 from varats.plot.plot import Plot
 from varats.plot.plot_utils import check_required_args, find_missing_revisions
 from varats.project.project_util import get_local_project_git
@@ -59,13 +62,14 @@ def _load_projects_ordered_by_year(
 ) -> tp.Dict[str, tp.Dict[int, tp.List[tp.Tuple[str, FileStatusExtension]]]]:
     projects: tp.Dict[str, tp.Dict[int, tp.List[tp.Tuple[
         str, FileStatusExtension]]]] = OrderedDict()
+    status_cache = RevisionStatusCache()
 
     for case_study in sorted(
         current_config.get_all_case_studies(),
         key=lambda cs: (cs.project_name, cs.version)
     ):
         processed_revisions = get_revisions_status_for_case_study(
-            case_study, result_file_type
+            case_study, result_file_type, status_cache=status_cache
         )
 
         repo = get_local_project_git(case_study.project_name)
@@ -19,8 +19,8 @@ from varats.plot.plot import Plot
 from varats.project.project_util import get_local_project_git
 from varats.utils.git_util import (
     ChurnConfig,
+    calc_code_churn_pairs,
     calc_repo_code_churn,
-    calc_code_churn,
 )
 
 
@@ -106,19 +106,15 @@ def build_revisions_churn_table(
     repo = get_local_project_git(project_name)
 
     revision_pairs = zip(*(islice(revisions, i, None) for i in range(2)))
-    code_churn = [(0, 0, 0)]
-    code_churn.extend([
-        calc_code_churn(
-            repo, repo.get(a), repo.get(b),
-            ChurnConfig.create_c_style_languages_config()
-        ) for a, b in revision_pairs
-    ])
+    code_churn = calc_code_churn_pairs(
+        repo, revision_pairs, ChurnConfig.create_c_style_languages_config()
+    )
     churn_data = pd.DataFrame({
         "revision": revisions,
-        "time_id": [commit_map.short_time_id(x) for x in revisions],
-        "insertions": [x[1] for x in code_churn],
-        "deletions": [x[2] for x in code_churn],
-        "changed_files": [x[0] for x in code_churn]
+        "time_id": commit_map.short_time_ids(revisions),
+        "insertions": [0] + code_churn["insertions"].tolist(),
+        "deletions": [0] + code_churn["deletions"].tolist(),
+        "changed_files": [0] + code_churn["changed_files"].tolist()
     })
 
     return pd.concat([create_dataframe_layout(), churn_data])
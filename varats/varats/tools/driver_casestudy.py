@@ -17,6 +17,7 @@ from varats.mapping.commit_map import create_lazy_commit_map_loader
 from varats.paper.case_study import load_case_study_from_file, store_case_study
 from varats.paper_mgmt import paper_config_manager as PCM
 from varats.paper_mgmt.case_study import (
+    RevisionStatusCache,
     get_revisions_status_for_case_study,
     ExtenderStrategy,
     extend_case_study,
@@ -445,11 +446,15 @@ def __init_commit_hash(args: tp.Dict[str, tp.Any]) -> str:
         commit_hash = ""
         paper_config = get_paper_config()
         available_commit_hashes = []
+        status_cache = RevisionStatusCache()
         # Compute available commit hashes
         for case_study in paper_config.get_case_studies(project_name):
             available_commit_hashes.extend(
                 get_revisions_status_for_case_study(
-                    case_study, result_file_type, tag_blocked=False
+                    case_study,
+                    result_file_type,
+                    tag_blocked=False,
+                    status_cache=status_cache
                 )
             )
 
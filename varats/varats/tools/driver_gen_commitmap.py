@@ -3,7 +3,11 @@
 import argparse
 from pathlib import Path
 
-from varats.mapping.commit_map import get_commit_map, store_commit_map
+from varats.mapping.commit_map import (
+    get_project_refspec,
+    store_commit_map_stream,
+)
+from varats.project.project_util import get_local_project_git_path
 from varats.utils.cli_util import initialize_cli_tool
 from varats.utils.settings import vara_cfg
 
@@ -34,8 +38,6 @@ def main() -> None:
     if path is not None and not path.exists():
         raise argparse.ArgumentTypeError("Repository path does not exist")
 
-    cmap = get_commit_map(args.project_name, path, args.end, args.start)
-
     if args.output is None:
         if path is not None:
             default_name = path.name.replace("-HEAD", "")
@@ -52,7 +54,16 @@ def main() -> None:
             output_name = args.output
         else:
             output_name = args.output + ".cmap"
-    store_commit_map(cmap, output_name)
+
+    # the walk is written line by line, so the commit map is never kept in
+    # memory as a whole
+    if path is None:
+        store_commit_map_stream(
+            output_name, get_local_project_git_path(args.project_name),
+            args.end, args.start, get_project_refspec(args.project_name)
+        )
+    else:
+        store_commit_map_stream(output_name, path, args.end, args.start)
 
 
 if __name__ == '__main__':